@@ -1,26 +1,50 @@
+import gzip
 import json
+import hashlib
+import os
+import stat
+import sys
+import tempfile
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List
-from fastapi import FastAPI, HTTPException, Query
-from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Set, Tuple
+import numpy as np
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import Response
+from pydantic import BaseModel, Field
 from rapidfuzz import process, fuzz
 
+try:
+    import brotli
+except ImportError:  # optional: gzip-only when brotli isn't installed
+    brotli = None
+
 BASE_DIR = Path(__file__).resolve().parents[1]
 ASSETS = BASE_DIR / "assets"
 
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+from build_assets import iter_skill_names, open_skill_name_index
+
 app = FastAPI()
 
-class StripPathPrefix(BaseHTTPMiddleware):
+class StripPathPrefix:
+    """
+    Pure ASGI middleware that strips the longest matching prefix from
+    scope["path"], so routes answer at /x, /api/x, /index/x and /api/index/x.
+    """
     def __init__(self, app, prefixes=()):
-        super().__init__(app)
-        self.prefixes = tuple(p.rstrip('/') for p in prefixes)
-    async def dispatch(self, request, call_next):
-        path = request.scope.get("path", "")
-        for p in self.prefixes:
-            if path == p or path.startswith(p + "/"):
-                request.scope["path"] = path[len(p):] or "/"
-                break
-        return await call_next(request)
+        self.app = app
+        self.prefixes = tuple(sorted((p.rstrip('/') for p in prefixes), key=len, reverse=True))
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            path = scope.get("path", "")
+            for p in self.prefixes:
+                if path == p or path.startswith(p + "/"):
+                    scope = dict(scope, path=path[len(p):] or "/")
+                    break
+        await self.app(scope, receive, send)
 
 app.add_middleware(StripPathPrefix, prefixes=("/api", "/index", "/api/index"))
 
@@ -85,12 +109,17 @@ def _first_existing(paths: List[Path]) -> Path:
             return p
     raise FileNotFoundError("None of the candidate paths exist:\n" + "\n".join(str(p) for p in paths))
 
+EVENT_SOURCES = ("support_card.json", "uma_data.json", "career.json")
+SNAPSHOT_VERSION = 2
+SNAPSHOT_FILE = ASSETS / "events.snapshot.json"
+SNAPSHOT_FALLBACK_NAME = "events.snapshot.json"
+
 def load_all_events() -> List[Dict]:
     assets_root = ASSETS  # /<repo>/assets
 
-    support_file = assets_root / "support_card.json"
-    uma_file     = assets_root / "uma_data.json"
-    ura_file     = assets_root / "career.json"
+    support_file = assets_root / EVENT_SOURCES[0]
+    uma_file     = assets_root / EVENT_SOURCES[1]
+    ura_file     = assets_root / EVENT_SOURCES[2]
 
     for p in (support_file, uma_file, ura_file):
         if not p.exists():
@@ -106,13 +135,198 @@ def load_all_events() -> List[Dict]:
 
     return [events_map[name] for name in sorted(events_map)]
 
-EVENTS = load_all_events()
-EVENT_MAP = {e["event_name"]: e for e in EVENTS}
-EVENT_NAMES = list(EVENT_MAP.keys())
+def _source_hashes() -> Dict[str, str]:
+    """Content hashes of the event source files that exist (missing ones simply never match)."""
+    hashes: Dict[str, str] = {}
+    for name in EVENT_SOURCES:
+        p = ASSETS / name
+        if p.exists():
+            hashes[name] = hashlib.sha256(p.read_bytes()).hexdigest()
+    return hashes
+
+def _private_cache_dir() -> Optional[Path]:
+    """
+    Per-user 0700 directory under the temp dir for the fallback snapshot
+    (serverless bundles are read-only). Returns None unless the directory is
+    ours, private and not a symlink, so nobody else can plant a snapshot.
+    """
+    if not hasattr(os, "getuid"):
+        return Path(tempfile.gettempdir())  # already per-user on Windows
+    path = Path(tempfile.gettempdir()) / f"umatools-{os.getuid()}"
+    try:
+        path.mkdir(mode=0o700, exist_ok=True)
+        st = path.lstat()
+    except OSError:
+        return None
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        return None
+    return path
+
+def _snapshot_paths() -> List[Path]:
+    """The bundled snapshot first, then the private fallback copy when one is usable."""
+    paths = [SNAPSHOT_FILE]
+    cache_dir = _private_cache_dir()
+    if cache_dir is not None:
+        paths.append(cache_dir / SNAPSHOT_FALLBACK_NAME)
+    return paths
+
+def _read_snapshot(path: Path, hashes: Dict[str, str]) -> Optional[List[Dict]]:
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            snap = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(snap, dict):
+        return None
+    if snap.get("version") != SNAPSHOT_VERSION or snap.get("sources") != hashes:
+        return None
+    return snap.get("events")
+
+def _write_snapshot(path: Path, hashes: Dict[str, str], events: List[Dict]) -> bool:
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump({"version": SNAPSHOT_VERSION, "sources": hashes, "events": events}, f,
+                      ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+        return True
+    except OSError:
+        return False
+
+def build_event_snapshot(path: Path = SNAPSHOT_FILE) -> List[Dict]:
+    """Compile the merged event catalogue into a JSON snapshot keyed by source hashes."""
+    events = load_all_events()
+    if not _write_snapshot(path, _source_hashes(), events):
+        raise OSError(f"Could not write event snapshot: {path}")
+    return events
+
+def load_events_cached() -> List[Dict]:
+    """
+    Load the event catalogue from the precompiled snapshot when its source
+    hashes still match the JSON files; otherwise rebuild from JSON and try
+    to refresh the snapshot (bundled path first, then a private temp dir).
+    """
+    hashes = _source_hashes()
+    paths = _snapshot_paths()
+    for path in paths:
+        events = _read_snapshot(path, hashes)
+        if events is not None:
+            return events
+    events = load_all_events()
+    for path in paths:
+        if _write_snapshot(path, hashes, events):
+            break
+    return events
+
+class LRUCache:
+    """Small bounded LRU mapping with hit/miss counters."""
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = max(1, int(maxsize))
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0,
+        }
+
+MATCH_CACHE = LRUCache(maxsize=2048)
+_NO_MATCH: List[Tuple[str, float]] = []
+
+def _normalize_query(q: str) -> str:
+    """Collapse whitespace so re-OCR'd variants of the same text share a cache entry."""
+    return " ".join(str(q).split())
+
+class PrecompressedJSON:
+    """
+    A JSON body serialized once, with gzip/brotli variants and a strong ETag
+    per representation, for payloads that never change during the process
+    lifetime.
+    """
+    def __init__(self, content: Any):
+        raw = json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()[:32]
+        self.variants: Dict[str, bytes] = {"identity": raw, "gzip": gzip.compress(raw, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            self.variants["br"] = brotli.compress(raw, quality=11)
+        self.etags = {
+            coding: f'"{digest}"' if coding == "identity" else f'"{digest}-{coding}"'
+            for coding in self.variants
+        }
+
+    def response(self, request: Request) -> Response:
+        accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+        coding = next((c for c in ("br", "gzip") if c in accepted and c in self.variants), "identity")
+        headers = {"ETag": self.etags[coding], "Vary": "Accept-Encoding"}
+        if _etag_matches(request.headers.get("if-none-match", ""), self.etags[coding]):
+            return Response(status_code=304, headers=headers)
+        if coding != "identity":
+            headers["Content-Encoding"] = coding
+        return Response(self.variants[coding], media_type="application/json", headers=headers)
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+def _accepted_encodings(accept_encoding: str) -> Set[str]:
+    accepted: Set[str] = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if coding and q > 0:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+def reload_events() -> None:
+    """(Re)load the event catalogue and drop everything derived from the old one."""
+    global EVENTS, EVENT_MAP, EVENT_NAMES, EVENTS_BODY
+    EVENTS = load_events_cached()
+    EVENT_MAP = {e["event_name"]: e for e in EVENTS}
+    EVENT_NAMES = list(EVENT_MAP.keys())
+    EVENTS_BODY = PrecompressedJSON({"events": EVENT_NAMES})
+    MATCH_CACHE.clear()
+
+reload_events()
 
 @app.get("/events")
-async def list_events():
-    return {"events": EVENT_NAMES}
+async def list_events(request: Request):
+    return EVENTS_BODY.response(request)
 
 @app.get("/event_by_name")
 async def get_event_by_name(
@@ -120,14 +334,21 @@ async def get_event_by_name(
     limit: int = Query(5, description="Maximum number of fuzzy matches to return"),
     min_score: float = Query(0, ge=0, le=100, description="Minimum score threshold for matches"),
 ):
-    matches = process.extract(event_name, EVENT_NAMES, scorer=fuzz.ratio, limit=limit)
-    filtered = [m for m in matches if m[1] >= min_score]
+    query = _normalize_query(event_name)
+    key = (query, limit, min_score)
+    filtered = MATCH_CACHE.get(key)
+    if filtered is None:
+        matches = process.extract(query, EVENT_NAMES, scorer=fuzz.ratio, limit=limit)
+        filtered = [(n, s) for n, s, _ in matches if s >= min_score] or _NO_MATCH
+        MATCH_CACHE.put(key, filtered)
     if not filtered:
         raise HTTPException(status_code=404, detail="No matches found")
+    return _match_payload(filtered)
 
-    top_name, top_score, _ = filtered[0]
+def _match_payload(filtered: List[Tuple[str, float]]) -> Dict:
+    top_name, top_score = filtered[0]
     top_event = EVENT_MAP[top_name]
-    other_matches = [{"event_name": n, "score": s} for n, s, _ in filtered[1:]]
+    other_matches = [{"event_name": n, "score": s} for n, s in filtered[1:]]
 
     return {
         "match": {
@@ -138,6 +359,240 @@ async def get_event_by_name(
         "other_matches": other_matches,
     }
 
+@app.get("/event_by_name/cache")
+async def event_cache_stats():
+    return MATCH_CACHE.stats()
+
+BATCH_MAX_QUERIES = 32
+BATCH_MAX_LIMIT = 50
+
+class BatchLookup(BaseModel):
+    queries: List[str] = Field(..., min_length=1, max_length=BATCH_MAX_QUERIES)
+    limit: int = Field(5, ge=1, le=BATCH_MAX_LIMIT)
+    min_score: float = Field(0, ge=0, le=100)
+
+@app.post("/event_by_name/batch")
+async def get_events_by_name_batch(body: BatchLookup):
+    """
+    Score several (e.g. noisy OCR) query strings against every event in one
+    rapidfuzz.cdist pass and return per-query top-k results. Queries are
+    normalized and cached exactly like /event_by_name, so both routes agree;
+    only cache misses are scored. Queries without a match above min_score
+    get `"match": null` instead of failing the batch.
+    """
+    keys = [(_normalize_query(q), body.limit, body.min_score) for q in body.queries]
+    found = {key: MATCH_CACHE.get(key) for key in dict.fromkeys(keys)}
+    missing = [key for key, filtered in found.items() if filtered is None]
+    if missing:
+        limit = min(body.limit, len(EVENT_NAMES))
+        scores = process.cdist([q for q, _, _ in missing], EVENT_NAMES, scorer=fuzz.ratio, dtype=np.float64)
+        for key, row in zip(missing, scores):
+            top = np.argsort(-row, kind="stable")[:limit]
+            found[key] = [(EVENT_NAMES[i], float(row[i])) for i in top if row[i] >= body.min_score] or _NO_MATCH
+            MATCH_CACHE.put(key, found[key])
+
+    results = []
+    for query, key in zip(body.queries, keys):
+        filtered = found[key]
+        if filtered:
+            results.append({"query": query, **_match_payload(filtered)})
+        else:
+            results.append({"query": query, "match": None, "other_matches": []})
+    return {"results": results}
+
+# ---------- Skill search ----------
+SKILL_SHARD_DIR = ASSETS / "skills"
+SKILL_NAME_INDEX = ASSETS / "skill_names.idx"
+SKILL_NAMES_MAX_IDS = 200
+SKILL_NAME_FIELDS = ("name_en", "enname", "jpname")
+SKILL_RESULT_FIELDS = ("id", "name_en", "enname", "jpname", "type", "rarity", "char", "iconid", "cost")
+SKILL_SEARCH_MAX_LIMIT = 50
+# Prefix hits gathered before ranking; short prefixes ("s") stop here.
+PREFIX_SCAN_LIMIT = 512
+PREFIX_SCORE = 100.0       # query is a prefix of the whole name
+WORD_PREFIX_SCORE = 90.0   # query is a prefix of a later word in the name
+
+def load_skill_records() -> List[Dict]:
+    """
+    Slim skill records for search: the skills_core shard named by
+    assets/skills/manifest.json, or skills_all.json when the shards
+    haven't been built.
+    """
+    try:
+        manifest = _json_load_bom_tolerant(SKILL_SHARD_DIR / "manifest.json")
+        source = SKILL_SHARD_DIR / manifest["core"]
+        data = _json_load_bom_tolerant(source)
+    except (OSError, ValueError, KeyError, TypeError):
+        data = _json_load_bom_tolerant(ASSETS / "skills_all.json")
+    return [
+        {k: item[k] for k in SKILL_RESULT_FIELDS if k in item}
+        for item in data if isinstance(item, dict) and item.get("id") is not None
+    ]
+
+def _fold(s: str) -> str:
+    return " ".join(str(s).casefold().split())
+
+class PrefixTrie:
+    """
+    Character trie mapping normalized keys to the values inserted under
+    them. search() walks to the prefix node and collects values breadth-first,
+    one key length at a time (shorter keys first), stopping after `limit`.
+    """
+    _END = ""
+
+    def __init__(self):
+        self.root: Dict[str, Any] = {}
+
+    def insert(self, key: str, value: Any) -> None:
+        node = self.root
+        for ch in key:
+            node = node.setdefault(ch, {})
+        node.setdefault(self._END, []).append(value)
+
+    def search(self, prefix: str, limit: int = PREFIX_SCAN_LIMIT) -> List[Any]:
+        node = self.root
+        for ch in prefix:
+            node = node.get(ch)
+            if node is None:
+                return []
+        out: List[Any] = []
+        level = [node]
+        while level and len(out) < limit:
+            nxt = []
+            for n in level:
+                for ch, child in n.items():
+                    if ch == self._END:
+                        out.extend(child)
+                    else:
+                        nxt.append(child)
+            level = nxt
+        return out[:limit]
+
+class SkillSearchIndex:
+    """
+    Name lookup over the slim skill records. Every name field is inserted
+    into a PrefixTrie whole and from each later word start, so "mind" finds
+    "Focused Mind"; queries with too few prefix hits fall back to rapidfuzz
+    over all names. Filters apply before ranking.
+    """
+    def __init__(self, skills: List[Dict]):
+        self.skills = skills
+        self.trie = PrefixTrie()
+        self.names: List[str] = []
+        self.owners: List[int] = []
+        for i, skill in enumerate(skills):
+            for field in SKILL_NAME_FIELDS:
+                name = _fold(skill.get(field) or "")
+                if not name:
+                    continue
+                self.names.append(name)
+                self.owners.append(i)
+                self.trie.insert(name, (i, PREFIX_SCORE))
+                words = name.split(" ")
+                for w in range(1, len(words)):
+                    self.trie.insert(" ".join(words[w:]), (i, WORD_PREFIX_SCORE))
+
+    @staticmethod
+    def _accepts(skill: Dict, type_: Optional[str], rarity: Optional[int], char: Optional[int]) -> bool:
+        if type_ is not None and type_ not in (skill.get("type") or ()):
+            return False
+        if rarity is not None and skill.get("rarity") != rarity:
+            return False
+        if char is not None and char not in (skill.get("char") or ()):
+            return False
+        return True
+
+    def search(self, query: str, limit: int = 10, type_: Optional[str] = None, rarity: Optional[int] = None,
+               char: Optional[int] = None, min_score: float = 60) -> List[Tuple[int, float, str]]:
+        """Top `limit` (skill index, score, "prefix" | "fuzzy") for query, best first."""
+        q = _fold(query)
+        if not q:
+            return []
+        best: Dict[int, Tuple[float, str]] = {}
+        for i, score in self.trie.search(q):
+            if score > best.get(i, (0.0, ""))[0] and self._accepts(self.skills[i], type_, rarity, char):
+                best[i] = (score, "prefix")
+        if len(best) < limit:
+            for _, score, j in process.extract(q, self.names, scorer=fuzz.WRatio, processor=None,
+                                               limit=None, score_cutoff=min_score):
+                i = self.owners[j]
+                if i not in best and self._accepts(self.skills[i], type_, rarity, char):
+                    best[i] = (float(score), "fuzzy")
+        def rank(item: Tuple[int, Tuple[float, str]]):
+            i, (score, via) = item
+            skill = self.skills[i]
+            # Ties: prefix hits before fuzzy ones, then shorter names
+            return (-score, via != "prefix", len(skill.get("name_en") or skill.get("enname") or ""))
+        ranked = sorted(best.items(), key=rank)
+        return [(i, score, via) for i, (score, via) in ranked[:limit]]
+
+SKILL_CACHE = LRUCache(maxsize=1024)
+_SKILL_INDEX: Optional[SkillSearchIndex] = None
+
+def skill_index() -> SkillSearchIndex:
+    """Build the skill search index on first use, so event-only cold starts don't pay for it."""
+    global _SKILL_INDEX
+    if _SKILL_INDEX is None:
+        _SKILL_INDEX = SkillSearchIndex(load_skill_records())
+    return _SKILL_INDEX
+
+_SKILL_NAMES: Optional[Mapping[str, str]] = None
+
+def skill_names() -> Mapping[str, str]:
+    """
+    Skill id -> display name from the memory-mapped assets/skill_names.idx,
+    opened on first use. When the bundled index is missing or stale it is
+    recompiled into the private temp dir; failing that, names are read
+    straight from skills_all.json.
+    """
+    global _SKILL_NAMES
+    if _SKILL_NAMES is None:
+        source = str(ASSETS / "skills_all.json")
+        names = open_skill_name_index(str(SKILL_NAME_INDEX), source, rebuild=False)
+        if names is None:
+            cache_dir = _private_cache_dir()
+            if cache_dir is not None:
+                names = open_skill_name_index(str(cache_dir / SKILL_NAME_INDEX.name), source)
+        _SKILL_NAMES = names if names is not None else dict(iter_skill_names(source))
+    return _SKILL_NAMES
+
+@app.get("/skills/names")
+async def skill_names_by_id(
+    ids: List[str] = Query(..., min_length=1, max_length=SKILL_NAMES_MAX_IDS,
+                           description="Skill ids to resolve (repeat the parameter)"),
+):
+    names = skill_names()
+    return {"names": {sid: names.get(sid) for sid in ids}}
+
+@app.get("/skills/search")
+async def search_skills(
+    q: str = Query(..., min_length=1, description="Skill name or name prefix (English or Japanese)"),
+    limit: int = Query(10, ge=1, le=SKILL_SEARCH_MAX_LIMIT, description="Maximum number of skills to return"),
+    type: Optional[str] = Query(None, description="Only skills tagged with this type (e.g. 'nac')"),
+    rarity: Optional[int] = Query(None, description="Only skills of this rarity"),
+    char: Optional[int] = Query(None, description="Only skills tied to this character id"),
+    min_score: float = Query(60, ge=0, le=100, description="Minimum score for fuzzy matches"),
+):
+    query = _normalize_query(q)
+    key = (query.casefold(), limit, type, rarity, char, min_score)
+    results = SKILL_CACHE.get(key)
+    if results is None:
+        index = skill_index()
+        results = [
+            {"score": score, "match": via, "skill": index.skills[i]}
+            for i, score, via in index.search(query, limit, type, rarity, char, min_score)
+        ]
+        SKILL_CACHE.put(key, results)
+    return {"query": query, "results": results}
+
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=3000)
+    import argparse
+    ap = argparse.ArgumentParser(description="Event lookup API")
+    ap.add_argument("--build-snapshot", action="store_true", help=f"Compile {SNAPSHOT_FILE.name} from the event JSON and exit")
+    args = ap.parse_args()
+    if args.build_snapshot:
+        events = build_event_snapshot()
+        print(f"[snapshot] {len(events)} events -> {SNAPSHOT_FILE}")
+    else:
+        import uvicorn
+        uvicorn.run(app, host="0.0.0.0", port=3000)
@@ -0,0 +1,60 @@
+"""
+Mean and p99 latency of the /event_by_name fuzzy scan (rapidfuzz over every
+event name, result cache bypassed) on noisy OCR-like queries, at the live
+catalogue size and at synthetic 2x/4x catalogues. Re-run this before
+reaching for a candidate index: at today's size the straight scan is the
+fastest option.
+
+    python benchmarks/bench_event_lookup.py [--queries 3000]
+"""
+import argparse
+import importlib.util
+import random
+import statistics
+import time
+from pathlib import Path
+
+from rapidfuzz import fuzz, process
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_api():
+    spec = importlib.util.spec_from_file_location("umatools_api_bench", ROOT / "api" / "[...path].py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def garble(name: str, rng: random.Random, edits: int = 3) -> str:
+    chars = list(name)
+    for _ in range(edits):
+        chars[rng.randrange(len(chars))] = rng.choice("abcdefghij ")
+    return "".join(chars)
+
+
+def latency_us(names, queries):
+    samples = []
+    for q in queries:
+        t0 = time.perf_counter()
+        process.extract(q, names, scorer=fuzz.ratio, limit=5)
+        samples.append(time.perf_counter() - t0)
+    samples.sort()
+    return statistics.mean(samples) * 1e6, samples[int(len(samples) * 0.99)] * 1e6
+
+
+def main(n: int) -> None:
+    names = load_api().EVENT_NAMES
+    rng = random.Random(1)
+    print(f"[bench] {n} noisy queries per catalogue size")
+    for scale in (1, 2, 4):
+        catalogue = [name if k == 0 else f"{name} #{k}" for k in range(scale) for name in names]
+        queries = [garble(rng.choice(catalogue), rng) for _ in range(n)]
+        mean, p99 = latency_us(catalogue, queries)
+        print(f"[bench]   {len(catalogue):>5} names  mean {mean:6.0f}us  p99 {p99:6.0f}us")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--queries", type=int, default=3000)
+    main(ap.parse_args().queries)
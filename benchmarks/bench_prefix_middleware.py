@@ -0,0 +1,75 @@
+"""
+Requests/sec through the API with the pure ASGI StripPathPrefix versus the
+BaseHTTPMiddleware version it replaced, measured in process over
+httpx.ASGITransport (no sockets, so the middleware cost isn't drowned out).
+
+    python benchmarks/bench_prefix_middleware.py [--requests 1000]
+"""
+import argparse
+import asyncio
+import importlib.util
+import time
+from pathlib import Path
+
+import httpx
+from starlette.middleware.base import BaseHTTPMiddleware
+
+ROOT = Path(__file__).resolve().parents[1]
+PREFIXES = ("/api", "/index", "/api/index")
+
+
+class BaseHTTPStripPathPrefix(BaseHTTPMiddleware):
+    """The previous implementation, kept here only as the baseline."""
+    def __init__(self, app, prefixes=()):
+        super().__init__(app)
+        self.prefixes = tuple(sorted((p.rstrip('/') for p in prefixes), key=len, reverse=True))
+
+    async def dispatch(self, request, call_next):
+        path = request.scope.get("path", "")
+        for p in self.prefixes:
+            if path == p or path.startswith(p + "/"):
+                request.scope["path"] = path[len(p):] or "/"
+                break
+        return await call_next(request)
+
+
+def load_app(middleware):
+    """A fresh copy of the API module with `middleware` swapped in for StripPathPrefix."""
+    spec = importlib.util.spec_from_file_location("umatools_api_bench", ROOT / "api" / "[...path].py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    app = module.app
+    app.user_middleware = [m for m in app.user_middleware if m.cls is not module.StripPathPrefix]
+    app.add_middleware(middleware or module.StripPathPrefix, prefixes=PREFIXES)
+    app.middleware_stack = None
+    return app, module
+
+
+async def requests_per_second(app, url: str, n: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(min(100, n)):  # warm-up
+            (await client.get(url)).raise_for_status()
+        t0 = time.perf_counter()
+        for _ in range(n):
+            (await client.get(url)).raise_for_status()
+        return n / (time.perf_counter() - t0)
+
+
+async def main(n: int) -> None:
+    apps = {"BaseHTTPMiddleware": load_app(BaseHTTPStripPathPrefix), "pure ASGI": load_app(None)}
+    name = apps["pure ASGI"][1].EVENT_NAMES[0]
+    urls = ["/api/events", f"/api/event_by_name?event_name={name[:-1]}"]
+    print(f"[bench] {n} sequential requests per case")
+    for url in urls:
+        rates = {}
+        for label, (app, _) in apps.items():
+            rates[label] = await requests_per_second(app, url, n)
+        base, fast = rates["BaseHTTPMiddleware"], rates["pure ASGI"]
+        print(f"[bench]   {url.split('?')[0]:<20} {base:8.0f} -> {fast:8.0f} req/s ({fast / base:.2f}x)")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--requests", type=int, default=1000)
+    asyncio.run(main(ap.parse_args().requests))
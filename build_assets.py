@@ -0,0 +1,310 @@
+import argparse, array, bisect, hashlib, json, mmap, os, struct, subprocess, sys, time
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+ASSETS_DIR = "assets"
+SKILLS_SOURCE = os.path.join(ASSETS_DIR, "skills_all.json")
+SKILL_NAME_INDEX = os.path.join(ASSETS_DIR, "skill_names.idx")
+SKILL_SHARD_DIR = os.path.join(ASSETS_DIR, "skills")
+
+# skills_core keeps these fields of each skill record as-is, so pages that
+# read skills_all.json can switch to it without changing their parsing.
+SKILL_CORE_FIELDS = ("id", "name_en", "enname", "jpname", "type", "rarity", "char", "iconid",
+                     "cost", "versions", "parent_skills")
+SKILL_CORE_GENE_FIELDS = ("cost",)
+# Per-locale text shards, keyed by skill id
+SKILL_LOCALE_FIELDS = {
+    "en": ("desc_en", "endesc"),
+    "ja": ("jpdesc",),
+    "ko": ("name_ko", "desc_ko"),
+    "tw": ("name_tw", "desc_tw"),
+}
+
+# skill_names.idx layout (little-endian):
+#   header   magic, version, reserved, count, source size, blake2b-8 of the source
+#   ids      u32[count], sorted ascending
+#   offsets  u32[count + 1] into the name blob
+#   names    UTF-8, concatenated
+_IDX_MAGIC = b"UMSN"
+_IDX_VERSION = 1
+_IDX_HEADER = struct.Struct("<4sHHIQ8s")
+
+
+def _read_json_list(path: str) -> List[Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return data if isinstance(data, list) else []
+
+def _source_digest(path: str) -> bytes:
+    h = hashlib.blake2b(digest_size=8)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.digest()
+
+def skill_display_name(item: Dict[str, Any]) -> str:
+    return (
+        item.get("name_en")
+        or item.get("enname")
+        or item.get("name")
+        or item.get("jpname")
+        or ""
+    )
+
+def iter_skill_names(path: str) -> Iterator[Tuple[str, str]]:
+    """(id, display name) pairs from a skills JSON list, skipping nameless entries."""
+    for item in _read_json_list(path):
+        if not isinstance(item, dict):
+            continue
+        sid = item.get("id") or item.get("skill_id") or item.get("skillId")
+        if sid is None:
+            continue
+        name = skill_display_name(item)
+        if name:
+            yield str(sid), name
+
+
+# ---------- Skill name index ----------
+def write_skill_name_index(source: str = SKILLS_SOURCE, dest: str = SKILL_NAME_INDEX) -> int:
+    """Compile source's id -> name pairs into the fixed-width index at dest; returns the entry count."""
+    names: Dict[int, str] = {}
+    for sid, name in iter_skill_names(source):
+        if sid.isdigit() and int(sid) < 1 << 32:
+            names[int(sid)] = name
+    ids = sorted(names)
+    blob = bytearray()
+    offsets = [0]
+    for sid in ids:
+        blob += names[sid].encode("utf-8")
+        offsets.append(len(blob))
+    header = _IDX_HEADER.pack(_IDX_MAGIC, _IDX_VERSION, 0, len(ids),
+                              os.path.getsize(source), _source_digest(source))
+    tmp = dest + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(struct.pack(f"<{len(ids)}I", *ids))
+        f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        f.write(blob)
+    os.replace(tmp, dest)
+    return len(ids)
+
+class SkillNameIndex(Mapping):
+    """
+    Read-only id -> name mapping over a memory-mapped skill_names.idx.
+    Lookups binary-search the id table in place, so opening it costs one
+    mmap and nothing is decoded until a name is asked for.
+    """
+    def __init__(self, path: str = SKILL_NAME_INDEX):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+        magic, version, _, count, self.source_size, self.source_digest = _IDX_HEADER.unpack_from(self._mm, 0)
+        if magic != _IDX_MAGIC or version != _IDX_VERSION:
+            self._mm.close()
+            raise ValueError(f"Not a v{_IDX_VERSION} skill name index: {path}")
+        self._count = count
+        ids_at = _IDX_HEADER.size
+        offs_at = ids_at + 4 * count
+        self._names_at = offs_at + 4 * (count + 1)
+        self._ids = self._u32_table(ids_at, count)
+        self._offs = self._u32_table(offs_at, count + 1)
+
+    def _u32_table(self, at: int, n: int):
+        raw = memoryview(self._mm)[at:at + 4 * n]
+        if sys.byteorder == "little":
+            return raw.cast("I")  # zero-copy view straight into the mapping
+        table = array.array("I", raw.tobytes())
+        table.byteswap()
+        return table
+
+    def _name(self, i: int) -> str:
+        return self._mm[self._names_at + self._offs[i]:self._names_at + self._offs[i + 1]].decode("utf-8")
+
+    def __getitem__(self, sid) -> str:
+        try:
+            key = int(sid)
+        except (TypeError, ValueError):
+            raise KeyError(sid) from None
+        i = bisect.bisect_left(self._ids, key)
+        if i < self._count and self._ids[i] == key and str(key) == str(sid):
+            return self._name(i)
+        raise KeyError(sid)
+
+    def __iter__(self) -> Iterator[str]:
+        return (str(sid) for sid in self._ids)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def is_current(self, source: str) -> bool:
+        """True when the index was compiled from source's current contents."""
+        try:
+            st = os.stat(source)
+        except OSError:
+            return True  # nothing newer to compare against
+        if st.st_size != self.source_size:
+            return False
+        if st.st_mtime_ns <= self._mtime_ns:
+            return True  # source untouched since the index was written
+        return _source_digest(source) == self.source_digest
+
+    def close(self) -> None:
+        for table in (self._ids, self._offs):
+            if isinstance(table, memoryview):
+                table.release()
+        self._mm.close()
+
+def open_skill_name_index(path: str = SKILL_NAME_INDEX, source: str = SKILLS_SOURCE,
+                          rebuild: bool = True) -> Optional[SkillNameIndex]:
+    """
+    Open the skill name index, recompiling it first when it's missing or was
+    built from a different source file. Returns None when neither works (no
+    source, read-only checkout), so callers can fall back to the JSON.
+    """
+    index = None
+    try:
+        index = SkillNameIndex(path)
+        if index.is_current(source):
+            return index
+        index.close()
+        index = None
+    except (OSError, ValueError, struct.error):
+        pass
+    if not rebuild or not os.path.exists(source):
+        return None
+    try:
+        write_skill_name_index(source, path)
+        return SkillNameIndex(path)
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+# ---------- Skill shards ----------
+def _compact_json(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def _core_record(item: Dict[str, Any]) -> Dict[str, Any]:
+    rec = {k: item[k] for k in SKILL_CORE_FIELDS if k in item}
+    gene = item.get("gene_version")
+    if isinstance(gene, dict):
+        slim = {k: gene[k] for k in SKILL_CORE_GENE_FIELDS if k in gene}
+        if slim:
+            rec["gene_version"] = slim
+    return rec
+
+def build_skill_shards(source: str = SKILLS_SOURCE, out_dir: str = SKILL_SHARD_DIR) -> Dict[str, Any]:
+    """
+    Split source into skills_core (names, type, rarity, costs) and one
+    description file per locale under out_dir, each named by a hash of its
+    contents so it can be cached as immutable. manifest.json points at the
+    current files; superseded shards are removed.
+    """
+    skills = [item for item in _read_json_list(source) if isinstance(item, dict) and item.get("id") is not None]
+    shards: Dict[str, bytes] = {"core": _compact_json([_core_record(item) for item in skills])}
+    for loc, fields in SKILL_LOCALE_FIELDS.items():
+        texts: Dict[str, Dict[str, Any]] = {}
+        for item in skills:
+            entry = {k: item[k] for k in fields if item.get(k)}
+            if entry:
+                texts[str(item["id"])] = entry
+        shards[f"desc_{loc}"] = _compact_json(texts)
+
+    os.makedirs(out_dir, exist_ok=True)
+    files: Dict[str, str] = {}
+    for key, blob in shards.items():
+        name = f"skills_{key}.{hashlib.blake2b(blob, digest_size=6).hexdigest()}.json"
+        path = os.path.join(out_dir, name)
+        if not os.path.exists(path):
+            with open(path + ".tmp", "wb") as f:
+                f.write(blob)
+            os.replace(path + ".tmp", path)
+        files[key] = name
+
+    manifest = {
+        "version": 1,
+        "source": _source_digest(source).hex(),
+        "count": len(skills),
+        "core": files["core"],
+        "desc": {loc: files[f"desc_{loc}"] for loc in SKILL_LOCALE_FIELDS},
+        "bytes": {name: len(shards[key]) for key, name in files.items()},
+    }
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    with open(manifest_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(manifest_path + ".tmp", manifest_path)
+
+    keep = set(files.values()) | {"manifest.json"}
+    for name in os.listdir(out_dir):
+        if name.startswith("skills_") and name.endswith(".json") and name not in keep:
+            os.remove(os.path.join(out_dir, name))
+    return manifest
+
+
+# ---------- Benchmark ----------
+_BENCH_CHILD = r"""
+import sys, time
+sys.path.insert(0, {root!r})
+import build_assets as ba
+def rss_kib():
+    with open("/proc/self/status") as f:
+        return next(int(line.split()[1]) for line in f if line.startswith("VmRSS:"))
+base = rss_kib()
+t0 = time.perf_counter()
+if {mode!r} == "json":
+    names = dict(ba.iter_skill_names({source!r}))
+else:
+    names = ba.open_skill_name_index({index!r}, {source!r}, rebuild=False)
+t1 = time.perf_counter()
+ids = {ids!r}
+for sid in ids:
+    names.get(sid, "")
+t2 = time.perf_counter()
+print((t1 - t0) * 1000, (t2 - t1) / len(ids) * 1e6, (rss_kib() - base) / 1024)
+"""
+
+def bench_skill_name_index(rounds: int = 5, source: str = SKILLS_SOURCE, index: str = SKILL_NAME_INDEX) -> None:
+    """
+    Compare cold open time (the index's includes its freshness check against
+    the source), per-lookup cost and resident-memory growth of the JSON map
+    vs the mmap index, each in a fresh interpreter. Linux-only (/proc).
+    """
+    ids = [sid for sid, _ in iter_skill_names(source)][::7] + ["0", "not-an-id"]
+    root = os.path.dirname(os.path.abspath(__file__))
+    print(f"[bench] {len(ids)} lookups, {rounds} fresh processes per loader")
+    for mode in ("json", "index"):
+        code = _BENCH_CHILD.format(root=root, mode=mode, source=source, index=index, ids=ids)
+        runs = []
+        for _ in range(rounds):
+            out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+            runs.append([float(x) for x in out.stdout.split()])
+        runs.sort()
+        load_ms, lookup_us, rss_mib = runs[len(runs) // 2]
+        print(f"[bench]   {mode:<6} open={load_ms:8.2f}ms lookup={lookup_us:6.2f}µs rss=+{rss_mib:6.2f}MiB")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Derive compact lookup assets from the scraped JSON.")
+    ap.add_argument("--skills", default=SKILLS_SOURCE, help="skills JSON to compile from")
+    ap.add_argument("--bench", type=int, metavar="ROUNDS", default=0,
+                    help="After building, compare the JSON and mmap skill name lookups over ROUNDS fresh processes")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    count = write_skill_name_index(args.skills, SKILL_NAME_INDEX)
+    print(f"[skills] {count} names -> {SKILL_NAME_INDEX} "
+          f"({os.path.getsize(SKILL_NAME_INDEX) / 1024:.1f} KiB, {time.perf_counter() - t0:.2f}s)")
+
+    t0 = time.perf_counter()
+    manifest = build_skill_shards(args.skills, SKILL_SHARD_DIR)
+    total = os.path.getsize(args.skills)
+    core = manifest["bytes"][manifest["core"]]
+    print(f"[skills] {manifest['count']} skills -> {SKILL_SHARD_DIR}/ ({time.perf_counter() - t0:.2f}s)")
+    print(f"[skills]   {manifest['core']:<38} {core / 1024:8.1f} KiB ({core / total:.1%} of {total / 1024:.0f} KiB)")
+    for loc, name in manifest["desc"].items():
+        print(f"[skills]   {name:<38} {manifest['bytes'][name] / 1024:8.1f} KiB")
+
+    if args.bench:
+        bench_skill_name_index(args.bench, args.skills, SKILL_NAME_INDEX)
+
+if __name__ == "__main__":
+    main()
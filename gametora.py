@@ -1,5 +1,8 @@
-import argparse, json, os, sys, time, re, requests, random, threading, queue
-from typing import Any, Dict, List, Optional, Tuple
+import argparse, asyncio, functools, gzip, hashlib, json, os, shutil, subprocess, sys, tempfile, time, re, requests, random, threading, queue
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 from urllib.parse import urlparse
 from urllib3.exceptions import ReadTimeoutError
 from pathlib import Path
@@ -15,6 +18,13 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 
+from build_assets import SKILL_NAME_INDEX, SKILLS_SOURCE, iter_skill_names, open_skill_name_index
+
+try:  # optional: only needed for the thumbnail optimization stage
+    from PIL import Image, features as pil_features
+except ImportError:
+    Image = pil_features = None
+
 # Stat key mappings from JSON abbreviations to display names
 STAT_KEY_MAP = {
     "sp": "Speed", "st": "Stamina", "po": "Power", "gu": "Guts",
@@ -26,10 +36,125 @@ DELAY = 0.25
 RETRIES = 3
 NAV_TIMEOUT = 45
 JS_TIMEOUT  = 45
+HTTP_TIMEOUT = 20
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
+SITE_ORIGIN = "https://gametora.com"
+
+ASYNC_START_CONCURRENCY = 2
+ASYNC_MAX_CONCURRENCY = 8
+ASYNC_TARGET_LATENCY = 2.0   # seconds; slower responses stop the limiter from widening
+
+DRIVER_MAX_PAGES = 150
+DRIVER_MAX_FAILURES = 3
+
+THUMB_WORKERS = 6
+THUMB_MANIFEST = ".thumbs.manifest.json"
+THUMB_MAX_SIDE = 128        # re-encoded thumbnails and atlas tiles are bounded to this
+THUMB_WEBP_QUALITY = 82
+THUMB_AVIF_QUALITY = 55     # AVIF's scale runs lower than WebP's for the same visual quality
+ATLAS_COLUMNS = 16
+ATLAS_TILES_PER_SHEET = 128
+ATLAS_DIR = "atlas"
 
 JSON_LOCK = threading.Lock()
 THUMB_LOCK = threading.Lock()
-_SKILL_NAME_MAP: Optional[Dict[str, str]] = None
+_SKILL_NAME_MAP: Optional[Mapping[str, str]] = None
+
+
+class ScrapeMetrics:
+    """
+    Timings and counters for one scrape pass. stage(name) times a block,
+    pause() routes deliberate waits through here so sleeps show up as their
+    own stage, and report() prints p50/p95 per stage with pages/min and bytes
+    written (optionally appending the same numbers to a JSON file).
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.export_path: Optional[str] = None
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.started = time.monotonic()
+            self.timings: Dict[str, List[float]] = {}
+            self.counters: Dict[str, int] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - t0)
+
+    def timed(self, name: str):
+        """Decorator form of stage()."""
+        def wrap(fn):
+            @functools.wraps(fn)
+            def inner(*args, **kwargs):
+                with self.stage(name):
+                    return fn(*args, **kwargs)
+            return inner
+        return wrap
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.timings.setdefault(name, []).append(seconds)
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def snapshot(self, label: str) -> Dict[str, Any]:
+        with self._lock:
+            elapsed = time.monotonic() - self.started
+            timings = {k: sorted(v) for k, v in self.timings.items()}
+            counters = dict(self.counters)
+        pct = lambda xs, q: xs[min(len(xs) - 1, int(round(q * (len(xs) - 1))))]
+        stages = {
+            name: {"n": len(xs), "total_s": round(sum(xs), 3),
+                   "p50_ms": round(pct(xs, 0.50) * 1000, 1), "p95_ms": round(pct(xs, 0.95) * 1000, 1)}
+            for name, xs in sorted(timings.items(), key=lambda kv: -sum(kv[1]))
+        }
+        pages = counters.pop("pages", 0)
+        return {
+            "label": label,
+            "finished_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "elapsed_s": round(elapsed, 2),
+            "pages": pages,
+            "pages_per_min": round(pages * 60 / elapsed, 1) if elapsed > 0 else 0.0,
+            "bytes_written": counters.pop("bytes_written", 0),
+            "counters": counters,
+            "stages": stages,
+        }
+
+    def report(self, label: str) -> Dict[str, Any]:
+        """Print the summary for this pass, export it if configured, and start a new pass."""
+        snap = self.snapshot(label)
+        print(f"[metrics] {label}: {snap['elapsed_s']:.1f}s, {snap['pages']} pages "
+              f"({snap['pages_per_min']}/min), {snap['bytes_written'] / 1024:.0f} KiB written")
+        for name, st in snap["stages"].items():
+            print(f"[metrics]   {name:<16} n={st['n']:<5} total={st['total_s']:>8.2f}s "
+                  f"p50={st['p50_ms']:>8.1f}ms p95={st['p95_ms']:>8.1f}ms")
+        if snap["counters"]:
+            print("[metrics]   " + ", ".join(f"{k}={v}" for k, v in sorted(snap["counters"].items())))
+        if self.export_path:
+            runs = _read_json_list(self.export_path)
+            runs.append(snap)
+            _atomic_write(self.export_path, runs, record=False)
+        self.reset()
+        return snap
+
+
+METRICS = ScrapeMetrics()
+
+def pause(seconds: float, stage: str = "sleep") -> None:
+    """time.sleep that is accounted for in METRICS."""
+    if seconds <= 0:
+        return
+    with METRICS.stage(stage):
+        time.sleep(seconds)
 
 
 def _read_json_list(path: str) -> List[Any]:
@@ -42,13 +167,17 @@ def _read_json_list(path: str) -> List[Any]:
     except json.JSONDecodeError:
         return []
 
-def _load_skill_name_map() -> Dict[str, str]:
+def _load_skill_name_map() -> Mapping[str, str]:
     global _SKILL_NAME_MAP
+    if _SKILL_NAME_MAP is not None:
+        return _SKILL_NAME_MAP
+    # Compiled id -> name index over skills_all.json (rebuilt here if stale)
+    _SKILL_NAME_MAP = open_skill_name_index(SKILL_NAME_INDEX, SKILLS_SOURCE)
     if _SKILL_NAME_MAP is not None:
         return _SKILL_NAME_MAP
     _SKILL_NAME_MAP = {}
     candidates = [
-        os.path.join("assets", "skills_all.json"),
+        SKILLS_SOURCE,
         os.path.join("assets", "skills.json"),
         "skills_all.json",
         "skills.json",
@@ -56,59 +185,200 @@ def _load_skill_name_map() -> Dict[str, str]:
     for path in candidates:
         if not os.path.exists(path):
             continue
-        for item in _read_json_list(path):
-            if not isinstance(item, dict):
-                continue
-            sid = item.get("id") or item.get("skill_id") or item.get("skillId")
-            if sid is None:
-                continue
-            name = (
-                item.get("name_en")
-                or item.get("enname")
-                or item.get("name")
-                or item.get("jpname")
-                or ""
-            )
-            if name:
-                _SKILL_NAME_MAP[str(sid)] = name
+        try:
+            _SKILL_NAME_MAP = dict(iter_skill_names(path))
+        except json.JSONDecodeError:
+            continue
         if _SKILL_NAME_MAP:
             break
     return _SKILL_NAME_MAP
 
-def _atomic_write(path: str, data: List[Any]) -> None:
+def _atomic_write(path: str, data: Any, record: bool = True) -> None:
+    t0 = time.perf_counter()
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
     tmp = path + ".tmp"
     with open(tmp, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
+        size = f.tell()
     os.replace(tmp, path)
+    if record:
+        METRICS.observe("atomic_write", time.perf_counter() - t0)
+        METRICS.count("bytes_written", size)
+
+def _pluck(d: Dict[str, Any], dotted: str) -> Any:
+    cur: Any = d
+    for part in dotted.split("."):
+        cur = cur.get(part, None) if isinstance(cur, dict) else None
+    return cur
+
+def _dedup_probe(item: Dict[str, Any], dedup_key: Tuple[str, ...]) -> bytes:
+    """Fixed-size digest of the stringified dedup_key tuple (same equality as comparing the tuples)."""
+    h = hashlib.blake2b(digest_size=16)
+    for k in dedup_key:
+        h.update(str(_pluck(item, k)).encode("utf-8", "surrogatepass"))
+        h.update(b"\x1f")
+    return h.digest()
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
-def append_json_item(path: str, item: Dict[str, Any], dedup_key: Optional[Tuple[str, ...]] = None) -> bool:
-    with JSON_LOCK:
-        data = _read_json_list(path)
+
+class JsonStore:
+    """
+    In-memory view of a JSON list asset, backed by an append-only JSONL
+    journal (`<path>.journal`). Each write appends one journal line instead
+    of rewriting the whole file; `compact()` folds everything into the
+    final JSON once. A journal left behind by a crash is replayed on load;
+    appends carry their dedup_key and upserts are idempotent, so replaying a
+    journal whose rows already reached the JSON (a crash between compact's
+    write and the journal removal) adds nothing twice.
+
+    Dedup indexes hold hashed key tuples so membership checks are O(1); the
+    store (and its indexes) stay cached until the file changes on disk.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.journal_path = path + ".journal"
+        self.signature = _file_signature(path)
+        self.data: List[Any] = _read_json_list(path)
+        self.dirty = False
+        self._match_idx: Dict[str, Dict[Any, int]] = {}
+        self._dedup_idx: Dict[Tuple[str, ...], Set[bytes]] = {}
+        self._journal = None
+        self._replay_journal()
+
+    def _replay_journal(self) -> None:
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn last line from a crash
+                if entry.get("op") == "append":
+                    dedup_key = tuple(entry.get("dedup_key") or ())
+                    if not (dedup_key and self._is_duplicate(entry["item"], dedup_key)):
+                        self._apply_append(entry["item"])
+                elif entry.get("op") == "upsert":
+                    self._apply_upsert(entry["match_key"], entry["match_value"], entry["patch"])
+        self.dirty = True
+
+    def _log(self, entry: Dict[str, Any]) -> None:
+        if self._journal is None:
+            os.makedirs(os.path.dirname(self.journal_path) or ".", exist_ok=True)
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        self._journal.write(line)
+        self._journal.flush()
+        METRICS.count("bytes_written", len(line.encode("utf-8")))
+        self.dirty = True
+
+    def _match_index(self, match_key: str) -> Dict[Any, int]:
+        idx = self._match_idx.get(match_key)
+        if idx is None:
+            idx = {}
+            for i, obj in enumerate(self.data):
+                if isinstance(obj, dict) and match_key in obj:
+                    idx.setdefault(obj[match_key], i)
+            self._match_idx[match_key] = idx
+        return idx
+
+    def _dedup_index(self, dedup_key: Tuple[str, ...]) -> Set[bytes]:
+        idx = self._dedup_idx.get(dedup_key)
+        if idx is None:
+            idx = {_dedup_probe(obj, dedup_key) for obj in self.data if isinstance(obj, dict)}
+            self._dedup_idx[dedup_key] = idx
+        return idx
+
+    def _is_duplicate(self, item: Dict[str, Any], dedup_key: Tuple[str, ...]) -> bool:
+        return _dedup_probe(item, dedup_key) in self._dedup_index(dedup_key)
+
+    def _index_new(self, i: int, obj: Any) -> None:
+        if not isinstance(obj, dict):
+            return
+        for key, idx in self._match_idx.items():
+            if key in obj:
+                idx.setdefault(obj[key], i)
+        for key, idx in self._dedup_idx.items():
+            idx.add(_dedup_probe(obj, key))
+
+    def _apply_append(self, item: Dict[str, Any]) -> None:
+        self.data.append(item)
+        self._index_new(len(self.data) - 1, item)
+
+    def _apply_upsert(self, match_key: str, match_value: Any, patch: Dict[str, Any]) -> None:
+        i = self._match_index(match_key).get(match_value)
+        if i is None:
+            self._apply_append({match_key: match_value, **patch})
+            return
+        self.data[i].update(patch)
+        # Patched fields may feed other indexes; rebuild those lazily.
+        patched = set(patch)
+        for key in [k for k in self._match_idx if k in patched and k != match_key]:
+            del self._match_idx[key]
+        for key in [k for k in self._dedup_idx if any(p.split(".")[0] in patched for p in k)]:
+            del self._dedup_idx[key]
+
+    def append(self, item: Dict[str, Any], dedup_key: Optional[Tuple[str, ...]] = None) -> bool:
+        entry: Dict[str, Any] = {"op": "append", "item": item}
         if dedup_key:
-            def pluck(d: Dict[str, Any], dotted: str) -> Any:
-                cur: Any = d
-                for part in dotted.split("."):
-                    cur = cur.get(part, None) if isinstance(cur, dict) else None
-                return cur
-            probe = tuple(str(pluck(item, k)) for k in dedup_key)
-            for existing in data:
-                if tuple(str(pluck(existing, k)) for k in dedup_key) == probe:
-                    return False
-        data.append(item)
-        _atomic_write(path, data)
+            if self._is_duplicate(item, tuple(dedup_key)):
+                return False
+            entry["dedup_key"] = list(dedup_key)
+        self._apply_append(item)
+        self._log(entry)
         return True
 
+    def upsert(self, match_key: str, match_value: str, patch: Dict[str, Any]) -> None:
+        self._apply_upsert(match_key, match_value, patch)
+        self._log({"op": "upsert", "match_key": match_key, "match_value": match_value, "patch": patch})
+
+    def close(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def compact(self) -> None:
+        self.close()
+        if self.dirty:
+            _atomic_write(self.path, self.data)
+            self.signature = _file_signature(self.path)
+            self.dirty = False
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+
+_JSON_STORES: Dict[str, JsonStore] = {}
+
+def _json_store(path: str) -> JsonStore:
+    key = os.path.abspath(path)
+    store = _JSON_STORES.get(key)
+    if store is not None and store.signature != _file_signature(path):
+        # Edited outside this process: reload, then replay our journal on top.
+        store.close()
+        store = None
+    if store is None:
+        store = _JSON_STORES[key] = JsonStore(path)
+    return store
+
+def append_json_item(path: str, item: Dict[str, Any], dedup_key: Optional[Tuple[str, ...]] = None) -> bool:
+    with JSON_LOCK:
+        return _json_store(path).append(item, dedup_key)
+
 def upsert_json_item(path: str, match_key: str, match_value: str, patch: Dict[str, Any]) -> None:
     with JSON_LOCK:
-        data = _read_json_list(path)
-        for obj in data:
-            if isinstance(obj, dict) and obj.get(match_key) == match_value:
-                obj.update(patch)
-                _atomic_write(path, data)
-                return
-        data.append({match_key: match_value, **patch})
-        _atomic_write(path, data)
+        _json_store(path).upsert(match_key, match_value, patch)
+
+def flush_json_stores() -> None:
+    """Compact every open store into its final JSON asset (end of a scrape_* run)."""
+    with JSON_LOCK:
+        for store in _JSON_STORES.values():
+            store.compact()
 
 def _make_uma_key(name: str, nickname: str | None, slug: str | None) -> str:
     """Stable key to disambiguate variants."""
@@ -149,7 +419,7 @@ def _stats_blocks_after_caption(d, cap_el):
             return out;
         """, cap_el) or []
         # keep only visible nodes
-        return [b for b in blocks if is_visible(d, b)]
+        return filter_visible(d, blocks)
     except Exception:
         return []
 
@@ -271,33 +541,291 @@ def _ensure_dir(p: str) -> Path:
     d.mkdir(parents=True, exist_ok=True)
     return d
 
-def _save_thumb(url: str, thumbs_dir: str, slug: Optional[str], sup_id: Optional[str]) -> str:
-    if not url: return ""
-    _ensure_dir(thumbs_dir)
+def _thumb_dest(url: str, thumbs_dir: str, slug: Optional[str], sup_id: Optional[str]) -> Path:
     ext = Path(urlparse(url).path).suffix or ".png"
     base = slug or sup_id or _id_from_img_src(url) or "support"
     # keep it filesystem-safe
     safe = re.sub(r"[^a-z0-9\-_.]", "-", base.lower())
-    fname = f"{safe}{ext}"
-    dest = Path(thumbs_dir) / fname
-    with THUMB_LOCK:
-        if not dest.exists() or dest.stat().st_size == 0:
-            try:
-                r = requests.get(url, timeout=20)
-                r.raise_for_status()
-                dest.write_bytes(r.content)
-                time.sleep(0.05)  # be polite
-            except Exception as e:
-                print(f"[thumb] failed {url}: {e}")
-                return ""
+    return Path(thumbs_dir) / f"{safe}{ext}"
+
+def _thumb_rel(dest: Path) -> str:
     # return site-relative path for the front-end
     rel = "/" + str(dest.as_posix()).lstrip("/")
     # normalize to your site’s assets folder form:
     rel = rel.replace("//", "/")
     return rel
 
+
+class ThumbDownloader:
+    """
+    Thumbnail fetcher for one thumbs_dir: pooled HTTP sessions, bounded
+    concurrency and per-file locks. A sidecar manifest (THUMB_MANIFEST) keeps
+    url/ETag/Last-Modified/size per file so re-runs skip images that are
+    already on disk; with revalidate=True they send a conditional GET instead.
+    """
+    def __init__(self, thumbs_dir: str, workers: Optional[int] = None, revalidate: bool = False):
+        workers = max(1, int(workers or THUMB_WORKERS))
+        self.dir = _ensure_dir(thumbs_dir)
+        self.manifest_path = self.dir / THUMB_MANIFEST
+        self.revalidate = revalidate
+        self._slots = threading.BoundedSemaphore(workers)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="thumb")
+        self._lock = threading.Lock()
+        self._file_locks: Dict[str, threading.Lock] = {}
+        self._checked: Set[str] = set()  # files settled during this run
+        self._dirty = False
+        self.stats = {"downloaded": 0, "not_modified": 0, "skipped": 0, "failed": 0}
+        try:
+            self.manifest: Dict[str, Dict[str, Any]] = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.manifest = {}
+
+    def _file_lock(self, name: str) -> threading.Lock:
+        with self._lock:
+            lock = self._file_locks.get(name)
+            if lock is None:
+                lock = self._file_locks[name] = threading.Lock()
+            return lock
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def fetch(self, url: str, dest: Path) -> bool:
+        """Make sure dest holds url's image; False if it could not be fetched."""
+        name = dest.name
+        with self._file_lock(name):
+            with self._lock:
+                if name in self._checked:
+                    return True
+                entry = self.manifest.get(name)
+            size = dest.stat().st_size if dest.exists() else 0
+            fresh = bool(entry) and entry.get("url") == url and size > 0 and entry.get("size") == size
+            if fresh and not self.revalidate:
+                self._count("skipped")
+                with self._lock:
+                    self._checked.add(name)
+                return True
+            headers = {}
+            if fresh:
+                if entry.get("etag"): headers["If-None-Match"] = entry["etag"]
+                if entry.get("last_modified"): headers["If-Modified-Since"] = entry["last_modified"]
+            try:
+                with self._slots, METRICS.stage("thumbnail"):
+                    r = http_session().get(url, headers=headers, timeout=HTTP_TIMEOUT)
+                if r.status_code == 304 and fresh:
+                    self._count("not_modified")
+                else:
+                    r.raise_for_status()
+                    tmp = dest.with_name(name + ".tmp")
+                    tmp.write_bytes(r.content)
+                    os.replace(tmp, dest)
+                    with self._lock:
+                        self.manifest[name] = {
+                            "url": url,
+                            "etag": r.headers.get("ETag"),
+                            "last_modified": r.headers.get("Last-Modified"),
+                            "size": len(r.content),
+                        }
+                        self._dirty = True
+                    self._count("downloaded")
+            except Exception as e:
+                print(f"[thumb] failed {url}: {e}")
+                self._count("failed")
+                return size > 0  # keep serving a stale copy if we have one
+            with self._lock:
+                self._checked.add(name)
+            return True
+
+    def submit(self, url: str, dest: Path) -> Future:
+        return self._pool.submit(self.fetch, url, dest)
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = dict(sorted(self.manifest.items()))
+            self._dirty = False
+        _atomic_write(str(self.manifest_path), snapshot)
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+        self.flush()
+
+
+_THUMB_DOWNLOADERS: Dict[str, ThumbDownloader] = {}
+THUMB_REVALIDATE = False
+
+def thumb_downloader(thumbs_dir: str) -> ThumbDownloader:
+    key = os.path.abspath(thumbs_dir)
+    with THUMB_LOCK:
+        dl = _THUMB_DOWNLOADERS.get(key)
+        if dl is None:
+            dl = _THUMB_DOWNLOADERS[key] = ThumbDownloader(thumbs_dir, revalidate=THUMB_REVALIDATE)
+        return dl
+
+def flush_thumb_downloaders() -> None:
+    """Write every thumbnail manifest and print a one-line summary per directory."""
+    with THUMB_LOCK:
+        downloaders = list(_THUMB_DOWNLOADERS.values())
+    for dl in downloaders:
+        dl.flush()
+        st = dl.stats
+        if any(st.values()):
+            print(f"[thumb] {dl.dir}: {st['downloaded']} downloaded, {st['not_modified']} not modified, "
+                  f"{st['skipped']} skipped, {st['failed']} failed")
+
+def close_thumb_downloaders() -> None:
+    with THUMB_LOCK:
+        downloaders = list(_THUMB_DOWNLOADERS.values())
+        _THUMB_DOWNLOADERS.clear()
+    for dl in downloaders:
+        dl.close()
+
+def _avif_encoder() -> Optional[str]:
+    """'pil' when Pillow can write AVIF, 'avifenc' when the CLI encoder is on PATH, else None."""
+    try:
+        if pil_features is not None and pil_features.check("avif"):
+            return "pil"
+    except Exception:
+        pass
+    return "avifenc" if shutil.which("avifenc") else None
+
+def _save_avif(img, dest: Path, encoder: str, quality: int) -> bool:
+    try:
+        if encoder == "pil":
+            img.save(dest, "AVIF", quality=quality, speed=6)
+            return True
+        with tempfile.TemporaryDirectory() as tmp:
+            src = Path(tmp) / "in.png"
+            img.save(src, "PNG")
+            subprocess.run(["avifenc", "-q", str(quality), "-s", "6", str(src), str(dest)],
+                           check=True, capture_output=True, timeout=120)
+        return True
+    except Exception as e:
+        print(f"[thumb] avif encode failed for {dest.name}: {e}")
+        return False
+
+def _fit_tile(img, side: int):
+    img = img.convert("RGBA")
+    if max(img.size) > side:
+        img.thumbnail((side, side), Image.LANCZOS)
+    if img.size == (side, side):
+        return img
+    tile = Image.new("RGBA", (side, side), (0, 0, 0, 0))
+    tile.paste(img, ((side - img.width) // 2, (side - img.height) // 2))
+    return tile
+
+def optimize_thumbnails(thumbs_dir: str, max_side: int = THUMB_MAX_SIDE, quality: int = THUMB_WEBP_QUALITY,
+                        avif: bool = True) -> Optional[Dict[str, Any]]:
+    """
+    Post-scrape stage: re-encode thumbnails to size-bounded WebP (thumbs_dir/webp)
+    and pack them into sprite sheets (thumbs_dir/atlas) with an index.json the
+    front-end uses to place each card by col/row, like rank_badges.png.
+    Sheets are content-hashed so they can be cached forever; nothing is
+    rewritten when the sources and settings are unchanged. Atlas items and
+    per-file WebPs are keyed by file stem (thumbs.js looks tiles up the same
+    way), so two sources sharing a stem raise ValueError instead of silently
+    overwriting each other. Requires Pillow; AVIF sheets are added when
+    Pillow or avifenc can encode them.
+    """
+    if Image is None:
+        print("[thumb] Pillow not installed; skipping thumbnail optimization (pip install pillow)")
+        return None
+    root = Path(thumbs_dir)
+    sources = sorted(p for p in root.glob("*") if p.is_file() and p.suffix.lower() in (".png", ".jpg", ".jpeg", ".webp"))
+    if not sources:
+        return None
+    by_stem: Dict[str, List[str]] = {}
+    for p in sources:
+        by_stem.setdefault(p.stem, []).append(p.name)
+    clashes = sorted(", ".join(names) for names in by_stem.values() if len(names) > 1)
+    if clashes:
+        raise ValueError(f"Thumbnails in {thumbs_dir} share a file stem (atlas keys would collide): "
+                         + "; ".join(clashes))
+    webp_dir = _ensure_dir(str(root / "webp"))
+    atlas_dir = _ensure_dir(str(root / ATLAS_DIR))
+    index_path = atlas_dir / "index.json"
+    encoder = _avif_encoder() if avif else None
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{max_side}:{quality}:{THUMB_AVIF_QUALITY}:{ATLAS_COLUMNS}:{ATLAS_TILES_PER_SHEET}:{encoder or ''}".encode())
+    for p in sources:
+        h.update(p.name.encode() + b"\0" + p.read_bytes())
+    source_digest = h.hexdigest()
+    try:
+        prev = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        prev = {}
+    webp_settings = {"max_side": max_side, "quality": quality}
+    reencode = prev.get("webp_settings") != webp_settings  # stale per-file WebPs otherwise survive a settings change
+    if not reencode and prev.get("source") == source_digest and all((atlas_dir / sh["webp"]).exists() for sh in prev.get("sheets", [])):
+        print(f"[thumb] atlas up to date ({len(prev.get('items', {}))} thumbnails)")
+        return prev
+
+    tiles: List[Tuple[str, Any]] = []
+    src_bytes = out_bytes = 0
+    for p in sources:
+        try:
+            with Image.open(p) as im:
+                tile = _fit_tile(im, max_side)
+        except Exception as e:
+            print(f"[thumb] unreadable {p.name}: {e}")
+            continue
+        dest = webp_dir / f"{p.stem}.webp"
+        if reencode or not dest.exists() or dest.stat().st_mtime < p.stat().st_mtime:
+            tile.save(dest, "WEBP", quality=quality, method=4)
+        src_bytes += p.stat().st_size
+        out_bytes += dest.stat().st_size
+        tiles.append((p.stem, tile))
+
+    items: Dict[str, Dict[str, Any]] = {}
+    sheets: List[Dict[str, Any]] = []
+    keep: Set[str] = {index_path.name}
+    for start in range(0, len(tiles), ATLAS_TILES_PER_SHEET):
+        chunk = tiles[start:start + ATLAS_TILES_PER_SHEET]
+        cols = min(ATLAS_COLUMNS, len(chunk))
+        rows = (len(chunk) + cols - 1) // cols
+        sheet = Image.new("RGBA", (cols * max_side, rows * max_side), (0, 0, 0, 0))
+        sheet_no = len(sheets)
+        for i, (stem, tile) in enumerate(chunk):
+            col, row = i % cols, i // cols
+            sheet.paste(tile, (col * max_side, row * max_side))
+            items[stem] = {"sheet": sheet_no, "col": col, "row": row}
+        tmp_webp = atlas_dir / f"sheet-{sheet_no}.tmp"
+        sheet.save(tmp_webp, "WEBP", quality=quality, method=4)
+        digest = hashlib.blake2b(tmp_webp.read_bytes(), digest_size=6).hexdigest()
+        entry = {"webp": f"sheet-{sheet_no}.{digest}.webp", "columns": cols, "rows": rows}
+        os.replace(tmp_webp, atlas_dir / entry["webp"])
+        if encoder:
+            name = f"sheet-{sheet_no}.{digest}.avif"
+            if (atlas_dir / name).exists() or _save_avif(sheet, atlas_dir / name, encoder, THUMB_AVIF_QUALITY):
+                entry["avif"] = name
+        keep.update(v for k, v in entry.items() if k in ("webp", "avif"))
+        sheets.append(entry)
+
+    for stale in atlas_dir.iterdir():
+        if stale.name not in keep:
+            stale.unlink()
+    index = {"version": 1, "source": source_digest, "tile": max_side, "webp_settings": webp_settings,
+             "sheets": sheets, "items": items}
+    _atomic_write(str(index_path), index)
+    sheet_bytes = sum((atlas_dir / sh["webp"]).stat().st_size for sh in sheets)
+    print(f"[thumb] {len(items)} thumbnails -> {len(sheets)} atlas sheet(s) ({sheet_bytes // 1024} KiB webp"
+          f"{', +avif' if encoder else ''}); per-file webp {out_bytes // 1024} KiB vs {src_bytes // 1024} KiB source")
+    return index
+
+def _save_thumb(url: str, thumbs_dir: str, slug: Optional[str], sup_id: Optional[str]) -> str:
+    if not url: return ""
+    dest = _thumb_dest(url, thumbs_dir, slug, sup_id)
+    if not thumb_downloader(thumbs_dir).fetch(url, dest):
+        return ""
+    return _thumb_rel(dest)
+
 def collect_support_previews(driver, thumbs_dir: str) -> dict[str, dict]:
     previews: dict[str, dict] = {}
+    pending: dict[str, tuple] = {}
+    dl = thumb_downloader(thumbs_dir)
     anchors = _wait_support_cards(driver)
     if not anchors:
         _scroll_page_until_stable(driver)
@@ -309,8 +837,14 @@ def collect_support_previews(driver, thumbs_dir: str) -> dict[str, dict]:
             continue
         img = safe_find(a, By.CSS_SELECTOR, "img[src*='/images/umamusume/supports/']")
         src = _abs_url(driver, img.get_attribute("src") or "") if img else ""
-        local = _save_thumb(src, thumbs_dir, slug, sid)
-        previews[slug] = {"SupportImage": local or src, "SupportId": sid or _id_from_img_src(src)}
+        previews[slug] = {"SupportImage": src, "SupportId": sid or _id_from_img_src(src)}
+        if src:
+            dest = _thumb_dest(src, thumbs_dir, slug, sid)
+            pending[slug] = (dest, dl.submit(src, dest))
+    # downloads run concurrently; point previews at the local copies once they land
+    for slug, (dest, fut) in pending.items():
+        if fut.result():
+            previews[slug]["SupportImage"] = _thumb_rel(dest)
     return previews
 
 
@@ -329,10 +863,21 @@ class RateLimiter:
                 sleep_for = self._next_time - now
             self._next_time = max(self._next_time, now) + self.min_interval_s
         if sleep_for > 0:
-            time.sleep(sleep_for)
+            pause(sleep_for, "rate_limit")
         if self.jitter_s > 0:
-            time.sleep(random.uniform(0.0, self.jitter_s))
+            pause(random.uniform(0.0, self.jitter_s), "rate_limit")
+
 
+_CHROMEDRIVER_PATH: Optional[str] = None
+_CHROMEDRIVER_LOCK = threading.Lock()
+
+def _chromedriver_path() -> str:
+    """Resolve (and download if needed) the chromedriver binary once per process."""
+    global _CHROMEDRIVER_PATH
+    with _CHROMEDRIVER_LOCK:
+        if _CHROMEDRIVER_PATH is None:
+            _CHROMEDRIVER_PATH = ChromeDriverManager().install()
+        return _CHROMEDRIVER_PATH
 
 def new_driver(headless: bool = True) -> webdriver.Chrome:
     opts = Options()
@@ -340,9 +885,7 @@ def new_driver(headless: bool = True) -> webdriver.Chrome:
         opts.add_argument("--headless=new")
     opts.add_argument("--window-size=1920,1080")
 
-    opts.add_argument(
-        "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
-    )
+    opts.add_argument(f"--user-agent={USER_AGENT}")
 
     # Force SwiftShader / software GPU (Chrome 139+)
     opts.add_argument("--enable-unsafe-swiftshader")
@@ -359,7 +902,7 @@ def new_driver(headless: bool = True) -> webdriver.Chrome:
     opts.add_experimental_option("excludeSwitches", ["enable-logging"])
     opts.set_capability("pageLoadStrategy", "eager")
 
-    service = Service(ChromeDriverManager().install())
+    service = Service(_chromedriver_path())
     driver = webdriver.Chrome(service=service, options=opts)
     driver.set_page_load_timeout(NAV_TIMEOUT)
     driver.set_script_timeout(JS_TIMEOUT)
@@ -376,6 +919,103 @@ def new_driver(headless: bool = True) -> webdriver.Chrome:
 
     return driver
 
+class DriverPool:
+    """
+    Warm Chrome sessions shared by every scrape pass. New browsers are primed
+    once (cookies accepted, server settings stored in localStorage) and handed
+    back after a soft reset; a browser is only recycled after max_failures
+    failed pages or max_pages pages.
+    """
+    def __init__(self, headless: bool = True, server: str = "global",
+                 max_pages: Optional[int] = None, max_failures: Optional[int] = None):
+        self.headless = headless
+        self.server = server
+        self.max_pages = max(1, int(max_pages or DRIVER_MAX_PAGES))
+        self.max_failures = max(1, int(max_failures or DRIVER_MAX_FAILURES))
+        self._lock = threading.Lock()
+        self._idle: List[Any] = []
+        self._usage: Dict[int, List[int]] = {}  # id(driver) -> [pages, failures]
+
+    def _prime(self, driver) -> None:
+        nav(driver, f"{SITE_ORIGIN}/umamusume", "body")
+        ensure_server(driver, server=self.server, keep_raw_en=True)
+
+    def acquire(self):
+        with self._lock:
+            driver = self._idle.pop() if self._idle else None
+        if driver is not None:
+            return driver
+        driver = new_driver(headless=self.headless)
+        try:
+            self._prime(driver)
+        except Exception:
+            _quit_quietly(driver)
+            raise
+        with self._lock:
+            self._usage[id(driver)] = [0, 0]
+        return driver
+
+    def release(self, driver, failed: bool = False) -> None:
+        if driver is None:
+            return
+        with self._lock:
+            usage = self._usage.setdefault(id(driver), [0, 0])
+            usage[0] += 1
+            usage[1] += 1 if failed else 0
+            worn = usage[0] >= self.max_pages or usage[1] >= self.max_failures
+        if worn or not _soft_reset(driver):
+            self.discard(driver)
+            return
+        with self._lock:
+            self._idle.append(driver)
+
+    def discard(self, driver) -> None:
+        with self._lock:
+            self._usage.pop(id(driver), None)
+        _quit_quietly(driver)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._usage.clear()
+        for driver in idle:
+            _quit_quietly(driver)
+
+
+def _quit_quietly(driver) -> None:
+    try: driver.quit()
+    except Exception: pass
+
+def _soft_reset(driver) -> bool:
+    """Close stray windows and stop pending loads; False if the session is unusable."""
+    try:
+        handles = driver.window_handles
+        for h in handles[1:]:
+            driver.switch_to.window(h)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.execute_script("window.stop();")
+        return driver.execute_script("return 1;") == 1
+    except Exception:
+        return False
+
+_DRIVER_POOLS: Dict[Tuple[bool, str], DriverPool] = {}
+
+def driver_pool(headless: bool = True, server: str = "global") -> DriverPool:
+    key = (headless, server)
+    with _CHROMEDRIVER_LOCK:
+        pool = _DRIVER_POOLS.get(key)
+        if pool is None:
+            pool = _DRIVER_POOLS[key] = DriverPool(headless=headless, server=server)
+        return pool
+
+def close_driver_pools() -> None:
+    with _CHROMEDRIVER_LOCK:
+        pools = list(_DRIVER_POOLS.values())
+        _DRIVER_POOLS.clear()
+    for pool in pools:
+        pool.close()
+
 def safe_find(driver, by, sel):
     try: return driver.find_element(by, sel)
     except NoSuchElementException: return None
@@ -392,6 +1032,7 @@ def wait_css(driver, css: str, timeout: int = 8):
     except (TimeoutException, WebDriverException, ReadTimeoutError):
         return None
 
+@METRICS.timed("nav")
 def nav(driver, url: str, wait_for_css: Optional[str] = None) -> bool:
     try:
         driver.get(url)
@@ -432,63 +1073,373 @@ def extract_next_data(driver) -> Optional[Dict[str, Any]]:
         pass
     return None
 
+@METRICS.timed("get_page_props")
 def get_page_props(driver) -> Optional[Dict[str, Any]]:
     """Get pageProps from __NEXT_DATA__."""
     data = extract_next_data(driver)
     if data:
-        return data.get("props", {}).get("pageProps", {})
+        props = data.get("props", {}).get("pageProps", {})
+        if FIXTURE_DIR and props:
+            try: record_fixture(driver.current_url, props)
+            except WebDriverException: pass
+        return props
+    return None
+
+# ---------- Recorded pageProps fixtures (offline replay / bench) ----------
+FIXTURE_DIR: Optional[str] = None  # set by --record-fixtures
+
+def _fixture_kind(url: str) -> Optional[str]:
+    path = urlparse(url).path
+    if "/umamusume/characters/" in path:
+        return "character"
+    if "/umamusume/supports/" in path:
+        return "support"
     return None
 
+def record_fixture(url: str, page_props: Dict[str, Any]) -> None:
+    """Save a detail page's pageProps under FIXTURE_DIR/<kind>/<slug>.json.gz (no-op unless recording)."""
+    kind = _fixture_kind(url) if FIXTURE_DIR else None
+    if not kind:
+        return
+    slug, _ = _slug_and_id_from_url(url)
+    dest = _ensure_dir(os.path.join(FIXTURE_DIR, kind)) / f"{re.sub(r'[^a-z0-9._-]', '-', slug.lower())}.json.gz"
+    payload = {"url": url, "kind": kind, "buildId": _BUILD_ID,
+               "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"), "pageProps": page_props}
+    tmp = dest.with_name(dest.name + ".tmp")
+    with gzip.open(tmp, "wt", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False)
+    os.replace(tmp, dest)
+
+def load_fixtures(fixture_dir: str) -> List[Dict[str, Any]]:
+    fixtures = []
+    for p in sorted(Path(fixture_dir).rglob("*.json*")):
+        if not p.name.endswith((".json", ".json.gz")):
+            continue
+        opener = gzip.open if p.suffix == ".gz" else open
+        try:
+            with opener(p, "rt", encoding="utf-8") as f:
+                fx = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[replay] unreadable fixture {p}: {e}")
+            continue
+        if isinstance(fx, dict) and isinstance(fx.get("pageProps"), dict):
+            fx.setdefault("kind", _fixture_kind(fx.get("url", "")))
+            fixtures.append(fx)
+    return fixtures
+
+# ---------- HTTP fast path (no browser) ----------
+_HTTP_LOCAL = threading.local()
+_NEXT_DATA_RE = re.compile(r'<script[^>]*\bid=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>', re.S | re.I)
+_BUILD_ID: Optional[str] = None
+
+def http_session() -> requests.Session:
+    """Per-thread pooled session (requests.Session is not safe to share across threads)."""
+    sess = getattr(_HTTP_LOCAL, "session", None)
+    if sess is None:
+        sess = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        sess.mount("http://", adapter)
+        sess.mount("https://", adapter)
+        sess.headers.update({"User-Agent": USER_AGENT, "Accept-Language": "en"})
+        _HTTP_LOCAL.session = sess
+    return sess
+
+def parse_next_data_html(html: str) -> Optional[Dict[str, Any]]:
+    m = _NEXT_DATA_RE.search(html or "")
+    if not m:
+        return None
+    try:
+        data = json.loads(m.group(1))
+    except json.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+def _next_data_url(url: str, build_id: str) -> str:
+    u = urlparse(url)
+    path = u.path.rstrip("/") or "/index"
+    return f"{u.scheme}://{u.netloc}/_next/data/{build_id}{path}.json"
+
+def _retry_after(r: requests.Response) -> Optional[float]:
+    try:
+        return max(0.0, float(r.headers.get("Retry-After", "")))
+    except ValueError:
+        return None
+
+def _overloaded(status: int) -> bool:
+    """Statuses that mean "slow down": 429, 5xx, or 0 for timeouts/connection errors."""
+    return status == 0 or status == 429 or status >= 500
+
+@METRICS.timed("http_fetch")
+def fetch_page_props_status(url: str, session: Optional[requests.Session] = None
+                            ) -> Tuple[Optional[Dict[str, Any]], int, Optional[float]]:
+    """
+    Fetch a page's Next.js pageProps without a browser. Uses the
+    /_next/data/<buildId>/... JSON route once a buildId is known, and falls
+    back to GETting the HTML and parsing __NEXT_DATA__ (which also refreshes
+    the buildId after a site deploy).
+
+    Returns (pageProps or None, HTTP status, Retry-After seconds); status is
+    0 on timeouts and connection errors. An overloaded JSON route is reported
+    as-is instead of retrying against the HTML page.
+    """
+    global _BUILD_ID
+    sess = session or http_session()
+    build_id = _BUILD_ID
+    if build_id:
+        try:
+            r = sess.get(_next_data_url(url, build_id), timeout=HTTP_TIMEOUT)
+            if _overloaded(r.status_code):
+                return None, r.status_code, _retry_after(r)
+            if r.status_code == 200:
+                body = r.json()
+                props = body.get("pageProps") if isinstance(body, dict) else None
+                if isinstance(props, dict) and props:
+                    record_fixture(url, props)
+                    return props, 200, None
+        except requests.RequestException:
+            return None, 0, None
+        except ValueError:
+            pass
+    try:
+        r = sess.get(url, timeout=HTTP_TIMEOUT)
+    except requests.RequestException:
+        return None, 0, None
+    if r.status_code != 200:
+        return None, r.status_code, _retry_after(r)
+    data = parse_next_data_html(r.text)
+    if not data:
+        return None, r.status_code, None
+    if isinstance(data.get("buildId"), str) and data["buildId"]:
+        _BUILD_ID = data["buildId"]
+    props = data.get("props")
+    props = props.get("pageProps") if isinstance(props, dict) else None
+    if not isinstance(props, dict):
+        return None, r.status_code, None
+    if props:
+        record_fixture(url, props)
+    return props or None, r.status_code, None
+
+def fetch_page_props_http(url: str, session: Optional[requests.Session] = None) -> Optional[Dict[str, Any]]:
+    return fetch_page_props_status(url, session)[0]
+
+def list_page_build_id(driver) -> Optional[str]:
+    """buildId of the page loaded in driver; also primes the HTTP fast path with it."""
+    global _BUILD_ID
+    data = extract_next_data(driver) or {}
+    build_id = data.get("buildId") or None
+    if build_id:
+        _BUILD_ID = build_id
+    return build_id
+
+def http_build_id(path: str) -> Optional[str]:
+    """
+    buildId of SITE_ORIGIN + path fetched over plain HTTP, for runs that skip
+    the browser list page (--resume); also primes the HTTP fast path with it.
+    """
+    global _BUILD_ID
+    try:
+        r = http_session().get(SITE_ORIGIN + path, timeout=HTTP_TIMEOUT)
+    except requests.RequestException:
+        return None
+    data = parse_next_data_html(r.text) if r.status_code == 200 else None
+    build_id = (data or {}).get("buildId") or None
+    if build_id:
+        _BUILD_ID = build_id
+    return build_id
+
+def page_fingerprint(page_props: Dict[str, Any]) -> str:
+    blob = json.dumps(page_props, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class FingerprintManifest:
+    """
+    Per-URL pageProps fingerprints for --incremental runs, stored next to the
+    output file (<out>.fingerprints.json). Pages recorded under the current
+    Next.js buildId are skipped without a request; other pages are fetched
+    and only re-parsed when their pageProps hash changed. The manifest is
+    ignored when the output file itself is missing.
+    """
+    def __init__(self, out_path: str, build_id: Optional[str] = None):
+        self.path = out_path + ".fingerprints.json"
+        self.build_id = build_id
+        self._lock = threading.Lock()
+        self.pages: Dict[str, str] = {}
+        self.verified: Set[str] = set()  # pages confirmed against the current build
+        self.prev_build_id: Optional[str] = None
+        if os.path.exists(out_path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self.pages = dict(data.get("pages") or {})
+                self.prev_build_id = data.get("buildId")
+            except (OSError, ValueError, AttributeError):
+                pass
+        self.stats = {"same_build": 0, "same_props": 0, "changed": 0}
+
+    def pending(self, urls: List[str]) -> List[str]:
+        """Drop URLs already recorded under an unchanged buildId."""
+        if not self.build_id or self.build_id != self.prev_build_id:
+            return urls
+        todo = [u for u in urls if u not in self.pages]
+        self.verified.update(u for u in urls if u in self.pages)
+        self.stats["same_build"] += len(urls) - len(todo)
+        return todo
+
+    def unchanged(self, url: str, page_props: Dict[str, Any]) -> bool:
+        same = self.pages.get(url) == page_fingerprint(page_props)
+        if same:
+            with self._lock:
+                self.verified.add(url)
+                self.stats["same_props"] += 1
+        return same
+
+    def record(self, url: str, page_props: Dict[str, Any]) -> None:
+        fp = page_fingerprint(page_props)
+        with self._lock:
+            self.pages[url] = fp
+            self.verified.add(url)
+            self.stats["changed"] += 1
+
+    def save(self) -> None:
+        with self._lock:
+            pages = self.pages
+            if self.build_id and self.build_id != self.prev_build_id:
+                # pages that failed this run must not ride along under the new buildId
+                pages = {u: fp for u, fp in pages.items() if u in self.verified}
+            data = {"buildId": self.build_id or self.prev_build_id, "pages": dict(sorted(pages.items()))}
+        _atomic_write(self.path, data)
+
+    def summary(self) -> str:
+        st = self.stats
+        skipped = st["same_build"] + st["same_props"]
+        return (f"{skipped} unchanged pages skipped ({st['same_build']} same buildId, "
+                f"{st['same_props']} same pageProps), {st['changed']} re-parsed")
+
+# ---------- Event normalization ----------
+_REWARD_STR_RE = re.compile(r"([a-z]{2})([+-]?\d+)")
+_STAT_NAMES = {sys.intern(k): sys.intern(v) for k, v in STAT_KEY_MAP.items()}
+
+CHARACTER_EVENT_CATEGORIES = ("wchoice", "nochoice", "version", "outings", "secret", "random", "arrows")
+SUPPORT_EVENT_CATEGORIES = ("random", "arrows", "chain")
+
 def _format_stat_rewards(rewards: List[Any]) -> str:
     """Convert reward abbreviations to readable format like 'Speed +10, Stamina +5'."""
     if not rewards:
         return ""
-    parts = []
+    names = _STAT_NAMES
+    parts: List[str] = []
+    add = parts.append
     for r in rewards:
         if isinstance(r, dict):
             for k, v in r.items():
-                stat_name = STAT_KEY_MAP.get(k, k)
+                stat_name = names.get(k, k)
                 if isinstance(v, (int, float)) and v != 0:
-                    sign = "+" if v > 0 else ""
-                    parts.append(f"{stat_name} {sign}{v}")
+                    add(f"{stat_name} +{v}" if v > 0 else f"{stat_name} {v}")
                 elif isinstance(v, str):
-                    parts.append(f"{stat_name}: {v}")
+                    add(f"{stat_name}: {v}")
         elif isinstance(r, str):
             # Handle string format like "sp+10"
-            m = re.match(r"([a-z]{2})([+-]?\d+)", r)
+            m = _REWARD_STR_RE.match(r)
             if m:
-                stat_name = STAT_KEY_MAP.get(m.group(1), m.group(1))
+                stat_name = names.get(m.group(1), m.group(1))
                 val = int(m.group(2))
-                sign = "+" if val > 0 else ""
-                parts.append(f"{stat_name} {sign}{val}")
-    return ", ".join(parts) if parts else ""
+                add(f"{stat_name} +{val}" if val > 0 else f"{stat_name} {val}")
+    return ", ".join(parts)
+
+def option_groups(choices: Iterable[Tuple[str, str]]) -> List[Dict[str, str]]:
+    """
+    Collect the (label, value) choices of one source event (a JSON event
+    node or one DOM event item) into EventOptions dicts. Callers group per
+    source event, never by title, so two events that share a name stay
+    separate rows. A label that repeats within the event starts a new dict,
+    so the event becomes several consecutive rows instead of losing a choice.
+    """
+    groups: List[Dict[str, str]] = [{}]
+    for label, value in choices:
+        if label in groups[-1]:
+            groups.append({})
+        groups[-1][label] = value
+    return [g for g in groups if g]
+
+def normalize_events(event_data: Dict[str, Any], categories: Tuple[str, ...], lang: str = "en") -> List[Dict[str, Any]]:
+    """
+    Turn a pageProps eventData blob into one {"EventName", "EventOptions"} row
+    per event, with every choice grouped under EventOptions (no-choice events
+    get a single "(Auto)" option). Events that repeat a choice label are split
+    over consecutive rows, see option_groups().
+    """
+    events: List[Dict[str, Any]] = []
+    if not event_data:
+        return events
+
+    # Get the language-specific data
+    lang_data = event_data.get(lang) or event_data.get("en") or event_data.get("ja") or {}
+    # If lang_data is not a dict (might be string or other), try event_data directly
+    if not isinstance(lang_data, dict):
+        lang_data = event_data if isinstance(event_data, dict) else {}
+
+    for category in categories:
+        cat_events = lang_data.get(category)
+        if not isinstance(cat_events, list):
+            continue
+        for evt in cat_events:
+            if not isinstance(evt, dict):
+                continue
+            event_name = evt.get("n") or evt.get("name")
+            if not event_name:
+                continue
+            choices = evt.get("c") or evt.get("choices")
+            if not choices:
+                groups = [{"(Auto)": _format_stat_rewards(evt.get("r") or evt.get("rewards")) or "See details"}]
+            else:
+                groups = option_groups(
+                    (choice.get("n") or choice.get("name") or "Option",
+                     _format_stat_rewards(choice.get("r") or choice.get("rewards")) or "See details")
+                    for choice in choices if isinstance(choice, dict))
+            events.extend({"EventName": event_name, "EventOptions": opts} for opts in groups)
+    return events
 
 # ---------- Visibility helpers ----------
+_IS_VISIBLE_JS = """
+    function isVisible(e){
+      if(!e) return false;
+      const doc=e.ownerDocument||document;
+      function vis(n){
+        if(!n||n.nodeType!==1) return true;
+        const cs=doc.defaultView.getComputedStyle(n);
+        if(cs.display==='none'||cs.visibility==='hidden'||parseFloat(cs.opacity)===0) return false;
+        return vis(n.parentElement);
+      }
+      if(!vis(e)) return false;
+      const r=e.getBoundingClientRect();
+      return r.width>0&&r.height>0;
+    }
+"""
+
 def is_visible(driver, el) -> bool:
     if el is None: return False
     try:
-        return bool(driver.execute_script("""
-            function isVisible(e){
-              if(!e) return false;
-              const doc=e.ownerDocument||document;
-              function vis(n){
-                if(!n||n.nodeType!==1) return true;
-                const cs=doc.defaultView.getComputedStyle(n);
-                if(cs.display==='none'||cs.visibility==='hidden'||parseFloat(cs.opacity)===0) return false;
-                return vis(n.parentElement);
-              }
-              if(!vis(e)) return false;
-              const r=e.getBoundingClientRect();
-              return r.width>0&&r.height>0;
-            }
-            return isVisible(arguments[0]);
-        """, el))
+        return bool(driver.execute_script(_IS_VISIBLE_JS + "return isVisible(arguments[0]);", el))
     except Exception:
         try: return el.is_displayed()
         except Exception: return False
 
+def visible_flags(driver, elements: List[Any]) -> List[bool]:
+    """Visibility of every element in one execute_script round trip."""
+    if not elements:
+        return []
+    try:
+        flags = driver.execute_script(_IS_VISIBLE_JS + "return Array.from(arguments[0], isVisible);", list(elements))
+        if isinstance(flags, list) and len(flags) == len(elements):
+            return [bool(f) for f in flags]
+    except Exception:
+        pass
+    # e.g. one stale element fails the whole batch: fall back to per-element checks
+    return [is_visible(driver, e) for e in elements]
+
 def filter_visible(driver, elements: List[Any]) -> List[Any]:
-    return [e for e in elements if is_visible(driver, e)]
+    return [e for e, ok in zip(elements, visible_flags(driver, elements)) if ok]
 
 def _scroll_page_until_stable(driver, max_rounds: int = 10, delay: float = 0.2) -> None:
     """Scroll to trigger lazy-loaded content; stop when height stabilizes."""
@@ -501,7 +1452,7 @@ def _scroll_page_until_stable(driver, max_rounds: int = 10, delay: float = 0.2)
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
         except Exception:
             break
-        time.sleep(delay)
+        pause(delay)
         try:
             new_height = driver.execute_script("return document.body.scrollHeight")
         except Exception:
@@ -551,7 +1502,7 @@ def _wait_support_cards(driver, timeout_s: float = 8.0) -> List[Any]:
         anchors = _collect_support_card_anchors(driver)
         if anchors:
             return anchors
-        time.sleep(0.2)
+        pause(0.2)
     return []
 
 
@@ -565,13 +1516,13 @@ def accept_cookies(driver):
     _click(driver, 'body > div#__next > div[class*=legal_cookie_banner_wrapper__] '
                    '> div > div[class*=legal_cookie_banner_selection__] '
                    '> div:last-child > button[class*=legal_cookie_banner_button__]')
-    time.sleep(0.2)
+    pause(0.2)
 
 def open_settings(driver):
     _click(driver, 'body > div#__next > div > div[class*=styles_page__] '
                    '> header[id*=styles_page-header__] '
                    '> div[class*=styles_header_settings__]')
-    time.sleep(0.15)
+    pause(0.15)
 
 def _click_label_by_partial_text(driver, *candidates: str) -> bool:
     try: labels = driver.find_elements(By.CSS_SELECTOR, 'div[data-tippy-root] label')
@@ -580,7 +1531,7 @@ def _click_label_by_partial_text(driver, *candidates: str) -> bool:
         t = (lb.text or "").strip().lower()
         for want in candidates:
             if want.lower() in t:
-                try: lb.click(); time.sleep(0.1); return True
+                try: lb.click(); pause(0.1); return True
                 except Exception: pass
     return False
 
@@ -604,7 +1555,7 @@ def ensure_server(driver, server: str = "global", keep_raw_en: bool = True):
     """, "global" if server == "global" else "japan")
     try: driver.find_element(By.TAG_NAME, "body").click()
     except Exception: pass
-    time.sleep(0.15); driver.refresh(); time.sleep(0.3)
+    pause(0.15); driver.refresh(); pause(0.3)
 
 
 def tippy_show_and_get_popper(driver, ref_el):
@@ -617,7 +1568,7 @@ def tippy_show_and_get_popper(driver, ref_el):
             t.show();
             return t.popper || null;
         """, ref_el)
-        time.sleep(0.05)
+        pause(0.05)
         return popper
     except Exception:
         return None
@@ -654,6 +1605,79 @@ def parse_event_from_tippy_popper(popper_el) -> List[Dict[str, str]]:
     return results
 
 
+_TIPPY_HARVEST_JS = """
+    const items = arguments[0];
+    const done = arguments[arguments.length - 1];
+    const text = n => n ? (n.innerText || '').trim().replace(/\\u00a0/g, ' ') : '';
+    const frame = () => new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)));
+    const readPopper = (p) => {
+      if (!p) return [];
+      const trs = p.querySelectorAll('table[class*="tooltips_ttable__"] > tbody > tr');
+      if (trs.length) {
+        const out = [];
+        for (const tr of trs) {
+          const a = tr.querySelector('td:nth-of-type(1)'), b = tr.querySelector('td:nth-of-type(2)');
+          if (!a || !b) continue;
+          const opt = text(a), val = text(b);
+          if (opt || val) out.push([opt, val]);
+        }
+        return out;
+      }
+      const many = p.querySelectorAll('div[class*="tooltips_ttable_cell___"] > div');
+      if (many.length) return Array.from(many, text).filter(Boolean).map(s => ['', s]);
+      const single = text(p.querySelector('div[class*="tooltips_ttable_cell__"]'));
+      return single ? [['', single]] : [];
+    };
+    (async () => {
+      const out = [];
+      for (const el of items) {
+        const name = text(el);
+        let rows = [];
+        const t = el && el._tippy;
+        if (name && t) {
+          try {
+            t.setProps({ trigger: 'manual', allowHTML: true, interactive: true, placement: 'bottom' });
+            t.show();
+            await frame();
+            rows = readPopper(t.popper);
+          } catch (e) {}
+          try { t.hide(); } catch (e) {}
+        }
+        out.push([name, rows]);
+      }
+      return out;
+    })().then(done, () => done(null));
+"""
+
+@METRICS.timed("tippy_harvest")
+def harvest_tippy_events(driver, items: List[Any]) -> List[Tuple[str, List[Dict[str, str]]]]:
+    """
+    (event name, option rows) for each element: one async script shows every
+    element's tippy in turn, reads its tooltips_ttable rows and hides it.
+    Falls back to the per-element show/parse/hide round trips if the script fails.
+    """
+    if not items:
+        return []
+    try:
+        raw = driver.execute_async_script(_TIPPY_HARVEST_JS, list(items))
+    except Exception:
+        raw = None
+    if isinstance(raw, list) and len(raw) == len(items):
+        return [(name, [{opt: val} for opt, val in rows]) for name, rows in raw]
+    out = []
+    for it in items:
+        name = txt(it)
+        if not name:
+            out.append(("", []))
+            continue
+        pop = tippy_show_and_get_popper(driver, it)
+        try:
+            out.append((name, parse_event_from_tippy_popper(pop)))
+        finally:
+            tippy_hide(driver, it)
+    return out
+
+
 def _first_tippy_anchor_under(driver, root):
     """Return the first descendant element that has a Tippy instance (._tippy), if any."""
     try:
@@ -701,7 +1725,7 @@ def parse_support_hints_on_page(d) -> List[Dict[str, Any]]:
             "//*[contains(translate(normalize-space(.),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),"
             f"'{label}')]"
         )
-        captions.extend([c for c in found if is_visible(d, c)])
+        captions.extend(filter_visible(d, found))
     if not captions:
         return hints
 
@@ -761,9 +1785,7 @@ def parse_support_hints_on_page(d) -> List[Dict[str, Any]]:
         block_hint_lv = parse_hint_level_from_text(block_text)
 
         # Turn images into tiles (climb to the element that contains <b>name</b>)
-        for img in imgs:
-            if not is_visible(d, img):
-                continue
+        for img in filter_visible(d, imgs):
 
             # climb to the tile block that has a <b> name
             tile = img
@@ -885,62 +1907,315 @@ def with_retries(func, *args, **kwargs):
             return func(*args, **kwargs)
         except (TimeoutException, WebDriverException, StaleElementReferenceException, ReadTimeoutError) as e:
             last_exc = e
-            time.sleep(0.6 + attempt * 0.4)
+            METRICS.count("retries")
+            pause(0.6 + attempt * 0.4, "retry_backoff")
             continue
     if last_exc:
         raise last_exc
     return None
 
 
-def _parse_events_from_json(event_data: Dict[str, Any], lang: str = "en") -> List[Dict[str, Any]]:
-    """Parse events from the new JSON structure (wchoice, nochoice, version, outings, secret)."""
-    events: List[Dict[str, Any]] = []
-    if not event_data:
-        return events
+class ScrapeCheckpoint:
+    """
+    Crash-recovery state for one --what target, kept in a shared JSON file
+    (one section per target): the URL list collected from the list page plus
+    the completed and failed URLs. Progress is written at most every
+    save_interval seconds; resuming rebuilds the queue from the URLs that
+    are not completed yet (failed ones are retried).
+    """
+    def __init__(self, path: str, target: str, resume: bool = False, save_interval: float = 2.0):
+        self.path = path
+        self.target = target
+        self.save_interval = save_interval
+        self._lock = threading.Lock()
+        self._last_save = 0.0
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self._all = json.load(f)
+            if not isinstance(self._all, dict):
+                self._all = {}
+        except (OSError, ValueError):
+            self._all = {}
+        state = self._all.get(target) if resume else None
+        self.resuming = bool(state and state.get("urls"))
+        self.urls: List[str] = list(state.get("urls") or []) if self.resuming else []
+        self.done: Set[str] = set(state.get("done") or []) if self.resuming else set()
+        self.failed: Dict[str, str] = dict(state.get("failed") or {}) if self.resuming else {}
+
+    def start(self, urls: List[str]) -> None:
+        """Begin a fresh pass over urls (discards earlier progress for this target)."""
+        with self._lock:
+            self.urls = list(urls)
+            self.done.clear()
+            self.failed.clear()
+        self.save(force=True)
 
-    # Get the language-specific data
-    lang_data = event_data.get(lang) or event_data.get("en") or event_data.get("ja") or {}
+    def pending(self) -> List[str]:
+        with self._lock:
+            return [u for u in self.urls if u not in self.done]
 
-    # If lang_data is not a dict (might be string or other), try event_data directly
-    if not isinstance(lang_data, dict):
-        lang_data = event_data if isinstance(event_data, dict) else {}
+    def mark_done(self, url: str) -> None:
+        with self._lock:
+            self.done.add(url)
+            self.failed.pop(url, None)
+        self.save()
 
-    # Process different event categories
-    for category in ["wchoice", "nochoice", "version", "outings", "secret", "random", "arrows"]:
-        cat_events = lang_data.get(category, []) if isinstance(lang_data, dict) else []
-        if not isinstance(cat_events, list):
-            continue
+    def mark_failed(self, url: str, error: str) -> None:
+        with self._lock:
+            self.failed[url] = error.strip()[:300]
+        self.save()
 
-        for evt in cat_events:
-            if not isinstance(evt, dict):
-                continue
+    def save(self, force: bool = False) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_save < self.save_interval:
+                return
+            self._last_save = now
+            self._all[self.target] = {
+                "urls": self.urls,
+                "done": [u for u in self.urls if u in self.done],
+                "failed": dict(self.failed),
+                "updated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            }
+            _atomic_write(self.path, self._all)
 
-            event_name = evt.get("n") or evt.get("name") or ""
-            if not event_name:
-                continue
+    def summary(self) -> str:
+        with self._lock:
+            pending = sum(1 for u in self.urls if u not in self.done)
+            return f"{len(self.done)}/{len(self.urls)} done, {len(self.failed)} failed, {pending} pending"
 
-            choices = evt.get("c") or evt.get("choices") or []
-            if not choices:
-                # No-choice event - just record the rewards
-                rewards = evt.get("r") or evt.get("rewards") or []
-                reward_str = _format_stat_rewards(rewards)
-                events.append({
-                    "EventName": event_name,
-                    "EventOptions": {"(Auto)": reward_str or "See details"}
-                })
-            else:
-                # Event with choices
-                for choice in choices:
-                    if isinstance(choice, dict):
-                        choice_name = choice.get("n") or choice.get("name") or "Option"
-                        rewards = choice.get("r") or choice.get("rewards") or []
-                        reward_str = _format_stat_rewards(rewards)
-                        events.append({
-                            "EventName": event_name,
-                            "EventOptions": {choice_name: reward_str or "See details"}
-                        })
 
-    return events
+DEFAULT_CHECKPOINT = "Assets/.scrape_checkpoint.json"
+
+def open_checkpoint(path: Optional[str], target: str, resume: bool) -> Optional[ScrapeCheckpoint]:
+    """
+    The checkpoint for one --what target, or None for a plain run: only
+    --resume or an explicit --checkpoint makes a run write progress.
+    """
+    path = path or (DEFAULT_CHECKPOINT if resume else None)
+    return ScrapeCheckpoint(path, target, resume=resume) if path else None
+
+
+def run_scrape_pool(urls: List[str], label: str, pool: DriverPool, scrape_browser, scrape_http=None,
+                    workers: int = 2, min_interval: float = 0.9, jitter: float = 0.25,
+                    checkpoint: Optional[ScrapeCheckpoint] = None) -> None:
+    """
+    Scrape detail pages with a pool of worker threads sharing one RateLimiter.
+
+    Browsers come from the (warm) DriverPool only for pages that need one and
+    go back after each page. scrape_http(url) -> summary or None is tried
+    first when given; scrape_browser(driver, url) -> summary is the browser path.
+    Finished and failed URLs are reported to checkpoint when given.
+    """
+    total = len(urls)
+    if total == 0:
+        return
+    worker_count = max(1, min(int(workers), total))
+    rate_limiter = RateLimiter(min_interval_s=min_interval, jitter_s=jitter)
+    q = queue.Queue()
+    for i, url in enumerate(urls, 1):
+        q.put((i, url))
+
+    def scrape_one(idx: int, url: str) -> None:
+        if scrape_http is not None:
+            rate_limiter.wait()
+            try:
+                summary = scrape_http(url)
+            except Exception as e:  # a bad payload shouldn't cost the page its browser attempt
+                print(f"[{idx}/{total}] {label} http error {url}: {e!r}; using the browser")
+                summary = None
+            if summary:
+                print(f"[{idx}/{total}] {label} {summary} [http]")
+                METRICS.count("pages"); METRICS.count("http_pages")
+                if checkpoint: checkpoint.mark_done(url)
+                return
+        for attempt in range(RETRIES + 1):
+            d_local = None
+            failed = True
+            try:
+                d_local = pool.acquire()
+                rate_limiter.wait()
+                ok = with_retries(nav, d_local, url, "body")
+                if not ok:
+                    raise TimeoutException("no body")
+                print(f"[{idx}/{total}] {label} {scrape_browser(d_local, url)}")
+                failed = False
+                METRICS.count("pages"); METRICS.count("browser_pages")
+                if checkpoint: checkpoint.mark_done(url)
+                return
+            except (TimeoutException, WebDriverException, StaleElementReferenceException, ReadTimeoutError) as e:
+                if attempt < RETRIES:
+                    METRICS.count("retries")
+                    pause(0.5 * (2 ** attempt), "retry_backoff")
+                    continue
+                print(f"[{idx}/{total}] {label} ERROR {url}: {e}")
+                METRICS.count("failed_pages")
+                if checkpoint: checkpoint.mark_failed(url, str(e))
+                return
+            except Exception as e:  # parser bugs, OSError, ...: not worth a retry, but the worker lives on
+                print(f"[{idx}/{total}] {label} ERROR {url}: {e!r}")
+                METRICS.count("failed_pages")
+                if checkpoint: checkpoint.mark_failed(url, repr(e))
+                return
+            finally:
+                # Always hand the browser back; failures count toward recycling it
+                pool.release(d_local, failed=failed)
+
+    def worker_loop(worker_id: int) -> None:
+        while True:
+            try:
+                idx, url = q.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                scrape_one(idx, url)
+            finally:
+                q.task_done()
+
+    threads = []
+    for wid in range(worker_count):
+        t = threading.Thread(target=worker_loop, args=(wid,), daemon=True)
+        t.start()
+        threads.append(t)
+
+    q.join()
+    for t in threads:
+        t.join()
+
+
+class AdaptiveLimiter:
+    """
+    AIMD limiter for the async HTTP engine. Concurrency grows by one after a
+    window of fast successes; a 429, 5xx or timeout halves it. The gap
+    between request starts doubles on each of those and halves again on
+    every fast success, and Retry-After pauses new starts outright. Like TCP,
+    it reacts once per congestion event: failures of requests started before
+    the last backoff do not shrink it again.
+    """
+    def __init__(self, start: int = ASYNC_START_CONCURRENCY, max_limit: int = ASYNC_MAX_CONCURRENCY,
+                 min_interval: float = 0.1, max_interval: float = 10.0, jitter: float = 0.1,
+                 target_latency: float = ASYNC_TARGET_LATENCY):
+        self.max_limit = max(1, int(max_limit))
+        self.limit = max(1, min(int(start), self.max_limit))
+        self.min_interval = max(0.0, float(min_interval))
+        self.max_interval = max(self.min_interval, float(max_interval))
+        self.interval = self.min_interval
+        self.jitter = max(0.0, float(jitter))
+        self.target_latency = target_latency
+        self.peak = self.limit
+        self.backoffs = 0
+        self._inflight = 0
+        self._streak = 0
+        self._next_start = 0.0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> int:
+        """Wait for a slot; returns the backoff epoch to pass back to release()."""
+        loop = asyncio.get_running_loop()
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._inflight < self.limit)
+            self._inflight += 1
+            now = loop.time()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval + random.uniform(0, self.jitter)
+            epoch = self.backoffs
+        if start > now:
+            await asyncio.sleep(start - now)
+        return epoch
+
+    async def release(self, epoch: int, status: Optional[int], latency: float,
+                      retry_after: Optional[float] = None) -> None:
+        """Free the slot; status None means the request failed locally and says nothing about the server."""
+        loop = asyncio.get_running_loop()
+        async with self._cond:
+            self._inflight -= 1
+            if status is None:
+                self._cond.notify_all()
+                return
+            if _overloaded(status):
+                METRICS.count("http_overloaded")
+            if _overloaded(status) and epoch != self.backoffs:
+                pass  # same congestion event we already backed off for
+            elif _overloaded(status):
+                self.backoffs += 1
+                self._streak = 0
+                self.limit = max(1, self.limit // 2)
+                self.interval = min(self.max_interval, max(self.interval * 2, 0.25))
+                delay = retry_after if retry_after is not None else self.interval
+                self._next_start = max(self._next_start, loop.time() + delay)
+            elif latency <= self.target_latency:
+                self.interval = max(self.min_interval, self.interval * 0.5)
+                self._streak += 1
+                if self._streak >= self.limit:
+                    self._streak = 0
+                    self.limit = min(self.max_limit, self.limit + 1)
+                    self.peak = max(self.peak, self.limit)
+            else:
+                self._streak = 0
+            self._cond.notify_all()
+
+
+async def _async_http_pass(urls: List[str], label: str, from_props, limiter: AdaptiveLimiter,
+                           executor: ThreadPoolExecutor, checkpoint: Optional[ScrapeCheckpoint]) -> List[str]:
+    loop = asyncio.get_running_loop()
+    total = len(urls)
+    leftovers: List[Tuple[int, str]] = []
+
+    async def one(idx: int, url: str) -> None:
+        props = None
+        try:
+            for _ in range(RETRIES + 1):
+                epoch = await limiter.acquire()
+                t0 = loop.time()
+                try:
+                    props, status, retry_after = await loop.run_in_executor(executor, fetch_page_props_status, url)
+                except Exception:
+                    await limiter.release(epoch, None, loop.time() - t0)
+                    raise
+                await limiter.release(epoch, status, loop.time() - t0, retry_after)
+                if not _overloaded(status):
+                    break
+            summary = await loop.run_in_executor(executor, from_props, url, props) if props else None
+        except Exception as e:  # one bad page must not abort the pass; the browser gets another go
+            print(f"[{idx}/{total}] {label} async error {url}: {e!r}; leaving it for the browser")
+            METRICS.count("async_errors")
+            summary = None
+        if summary:
+            print(f"[{idx}/{total}] {label} {summary} [async]")
+            METRICS.count("pages"); METRICS.count("http_pages")
+            if checkpoint:  # its periodic file write must not stall the event loop
+                await loop.run_in_executor(executor, checkpoint.mark_done, url)
+        else:
+            leftovers.append((idx, url))
+
+    await asyncio.gather(*(one(i, u) for i, u in enumerate(urls, 1)), return_exceptions=True)
+    return [u for _, u in sorted(leftovers)]
+
+def run_async_http_pass(urls: List[str], label: str, from_props,
+                        start: int = ASYNC_START_CONCURRENCY, max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+                        checkpoint: Optional[ScrapeCheckpoint] = None) -> List[str]:
+    """
+    asyncio engine for the JSON fast path: fetch pageProps for every URL under
+    an AdaptiveLimiter, hand them to from_props(url, page_props) -> summary or
+    None, and return the URLs that still need a browser. Blocking requests and
+    parsing run on a small thread pool so the existing session/JsonStore code
+    is reused unchanged.
+    """
+    if not urls:
+        return []
+    limiter = AdaptiveLimiter(start=start, max_limit=max_concurrency)
+    with ThreadPoolExecutor(max_workers=limiter.max_limit + 1, thread_name_prefix="async-http") as executor:
+        t0 = time.monotonic()
+        leftovers = asyncio.run(_async_http_pass(urls, label, from_props, limiter, executor, checkpoint))
+    print(f"[{label.lower()}] async pass: {len(urls) - len(leftovers)}/{len(urls)} pages in "
+          f"{time.monotonic() - t0:.1f}s (peak concurrency {limiter.peak}, {limiter.backoffs} backoffs), "
+          f"{len(leftovers)} left for the browser")
+    return leftovers
+
+
+def _parse_events_from_json(event_data: Dict[str, Any], lang: str = "en") -> List[Dict[str, Any]]:
+    """Parse events from the new JSON structure (wchoice, nochoice, version, outings, secret)."""
+    return normalize_events(event_data, CHARACTER_EVENT_CATEGORIES, lang)
 
 def _parse_character_events_from_page(d) -> List[Dict[str, Any]]:
     events: List[Dict[str, Any]] = []
@@ -949,26 +2224,13 @@ def _parse_character_events_from_page(d) -> List[Dict[str, Any]]:
     if not lists:
         # Fallback: broader selectors seen on event helper pages
         lists = safe_find_all(d, By.CSS_SELECTOR, '[class*=eventhelper_] [class*=elist], [class*=eventhelper_] [class*=eventlist]')
-    for elist in lists:
-        if not is_visible(d, elist):
-            continue
+    for elist in filter_visible(d, lists):
         items = elist.find_elements(By.CSS_SELECTOR, 'div[class*=compatibility_viewer_item], [class*=eventhelper_item], [class*=event_item]')
-        for it in items:
-            if not is_visible(d, it):
-                continue
-            ev_name = txt(it)
+        for ev_name, rows in harvest_tippy_events(d, filter_visible(d, items)):
             if not ev_name:
                 continue
-            pop = tippy_show_and_get_popper(d, it)
-            try:
-                rows = parse_event_from_tippy_popper(pop)
-                if rows:
-                    for kv in rows:
-                        events.append(make_support_card(ev_name, kv))
-                else:
-                    events.append(make_support_card(ev_name, {"(Auto)": "See details"}))
-            finally:
-                tippy_hide(d, it)
+            groups = option_groups(item for kv in rows for item in kv.items()) or [{"(Auto)": "See details"}]
+            events.extend(make_support_card(ev_name, opts) for opts in groups)
     return events
 
 def _open_support_hints_tab(d) -> bool:
@@ -977,9 +2239,7 @@ def _open_support_hints_tab(d) -> bool:
                  "[contains(translate(normalize-space(.),"
                  "'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),"
                  f"'{label.lower()}')]")
-        for el in safe_find_all(d, By.XPATH, xpath):
-            if not is_visible(d, el):
-                continue
+        for el in filter_visible(d, safe_find_all(d, By.XPATH, xpath)):
             try:
                 ok = d.execute_script("""
                     const el = arguments[0];
@@ -996,7 +2256,7 @@ def _open_support_hints_tab(d) -> bool:
                 pass
             try:
                 el.click()
-                time.sleep(0.25)
+                pause(0.25)
                 return True
             except Exception:
                 continue
@@ -1036,9 +2296,7 @@ def _open_character_events_tab(d) -> bool:
                  "[contains(translate(normalize-space(.),"
                  "'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),"
                  f"'{label.lower()}')]")
-        for el in safe_find_all(d, By.XPATH, xpath):
-            if not is_visible(d, el):
-                continue
+        for el in filter_visible(d, safe_find_all(d, By.XPATH, xpath)):
             try:
                 ok = d.execute_script("""
                     const el = arguments[0];
@@ -1055,7 +2313,7 @@ def _open_character_events_tab(d) -> bool:
                 pass
             try:
                 el.click()
-                time.sleep(0.25)
+                pause(0.25)
                 return True
             except Exception:
                 continue
@@ -1248,173 +2506,260 @@ def _parse_sizes_from_item(item_data: Dict[str, Any]) -> Dict:
         return {"B": item_data["bust"], "W": item_data["waist"], "H": item_data["hip"]}
     return {}
 
-def scrape_characters(save_path: str, server: str, headless: bool = True):
-    d = new_driver(headless=headless)
-    try:
-        with_retries(nav, d, "https://gametora.com/umamusume/characters", "body")
-        ensure_server(d, server=server, keep_raw_en=True)
-        time.sleep(1)  # Wait for page to fully load
+def _character_record(page_props: Dict[str, Any], url: str, d=None) -> Optional[Dict[str, Any]]:
+    """
+    Build a uma_data.json record from pageProps. With a driver, fields the
+    JSON lacks are filled from the DOM; without one (HTTP fast path) they
+    stay empty and _character_gaps() names them. Returns None only when the
+    JSON has no character name and there is no DOM to read it from.
+    """
+    slug, uma_id = _slug_and_id_from_url(url)
+    item_data = page_props.get("itemData", {})
+    event_data = (
+        page_props.get("eventData")
+        or page_props.get("events")
+        or page_props.get("event")
+        or page_props.get("event_data")
+        or {}
+    )
+    objective_data = page_props.get("objectiveData", [])
+
+    # Get character name
+    name = item_data.get("name_en") or item_data.get("name") or ""
+    if not name and d is not None:
+        # Fallback to DOM
+        name_el = safe_find(d, By.CSS_SELECTOR, "h1, [class*='name']")
+        name = (txt(name_el) or "").replace("\n", "")
+
+    if not name:
+        if d is None:
+            return None
+        raise WebDriverException("Missing character name")
+
+    nickname = item_data.get("title_en") or item_data.get("title") or ""
+    uma_key = _make_uma_key(name, nickname, slug)
+
+    # Parse stats (JSON first, DOM fallback)
+    base_stats, stat_bonuses, aptitudes = _parse_stats_from_json(item_data)
+    if d is not None and not (base_stats and stat_bonuses and aptitudes):
+        METRICS.count("dom_fallbacks")
+        if not base_stats:
+            base_stats = _parse_base_stats_from_page(d)
+        if not stat_bonuses:
+            stat_bonuses = _parse_stat_bonuses_from_page(d)
+        if not aptitudes:
+            aptitudes = _parse_aptitudes_from_page(d)
+    aptitudes = _normalize_strategy_names(aptitudes)
+
+    # Get base stars from rarity field
+    base_stars = item_data.get("rarity") or item_data.get("stars") or 0
+
+    # Height and sizes
+    height_cm = item_data.get("height") or item_data.get("height_cm") or item_data.get("heightCm") or None
+    if height_cm is None and d is not None:
+        height_cm = _parse_height_from_page(d)
+    sizes = _parse_sizes_from_item(item_data)
+    if not sizes and d is not None:
+        sizes = _parse_three_sizes(_label_value(d, "Three sizes") or _label_value(d, "Three Sizes"))
+
+    # Parse objectives
+    objectives = _parse_objectives_from_json(objective_data)
+
+    # Parse events
+    events = _parse_events_from_json(event_data, lang="en")
+    if not events and d is not None:
+        _open_character_events_tab(d)
+        events = _parse_character_events_from_page(d)
+
+    return _make_uma_record(uma_key, name, nickname, slug, uma_id, base_stars, base_stats,
+                            stat_bonuses, aptitudes, height_cm, sizes, objectives, events)
+
+# Record fields only the DOM can fill when pageProps lacks them. Events are
+# not among them: most character pages have none (in JSON or on the page).
+CHARACTER_DOM_FIELDS = ("UmaBaseStats", "UmaStatBonuses", "UmaAptitudes", "UmaHeightCm", "UmaThreeSizes")
+
+def _character_gaps(record: Dict[str, Any]) -> List[str]:
+    return [k for k in CHARACTER_DOM_FIELDS if record.get(k) in (None, {}, [])]
+
+@METRICS.timed("dom_fallback")
+def _character_record_from_dom(d, url: str) -> Dict[str, Any]:
+    slug, uma_id = _slug_and_id_from_url(url)
+    name_el = safe_find(d, By.CSS_SELECTOR, 'h1, div[class*=character] [class*=name]')
+    name = (txt(name_el) or "").replace("\n", "")
+    if not name:
+        raise WebDriverException("Missing character name")
+
+    nickname, base_stars = _parse_top_meta(d)
+    uma_key = _make_uma_key(name, nickname, slug)
+
+    base_stats = _parse_base_stats_from_page(d)
+    stat_bonuses = _parse_stat_bonuses_from_page(d)
+    aptitudes = _normalize_strategy_names(_parse_aptitudes_from_page(d))
+    height_cm = _parse_height_from_page(d)
+    sizes = _parse_three_sizes(_label_value(d, "Three sizes") or _label_value(d, "Three Sizes"))
+    return _make_uma_record(uma_key, name, nickname, slug, uma_id, base_stars, base_stats,
+                            stat_bonuses, aptitudes, height_cm, sizes, [], [])
+
+def _make_uma_record(uma_key, name, nickname, slug, uma_id, base_stars, base_stats,
+                     stat_bonuses, aptitudes, height_cm, sizes, objectives, events) -> Dict[str, Any]:
+    return {
+        "UmaKey": uma_key,
+        "UmaName": name,
+        "UmaNickname": nickname or None,
+        "UmaSlug": slug,
+        "UmaId": uma_id,
+        "UmaBaseStars": base_stars or None,
+        "UmaBaseStats": base_stats,
+        "UmaStatBonuses": stat_bonuses,
+        "UmaAptitudes": aptitudes,
+        "UmaHeightCm": height_cm,
+        "UmaThreeSizes": sizes,
+        "UmaObjectives": objectives,
+        "UmaEvents": events
+    }
+
+def _uma_summary(rec: Dict[str, Any]) -> str:
+    return (f"✓ {rec['UmaName']} ({rec['UmaNickname'] or rec['UmaSlug'] or 'default'})  "
+        f"(★{rec['UmaBaseStars'] or 0} | base:{'/'.join(rec['UmaBaseStats'].keys()) or '-'} "
+        f"| bonuses:{len(rec['UmaStatBonuses'])} | apt:{len(rec['UmaAptitudes'])} "
+        f"| {len(rec['UmaObjectives'])} objectives, {len(rec['UmaEvents'])} events)")
+
+def _skip_unchanged(urls: List[str], manifest: FingerprintManifest,
+                    checkpoint: Optional[ScrapeCheckpoint]) -> List[str]:
+    """Apply the incremental buildId skip; skipped pages count as done for the checkpoint."""
+    todo = manifest.pending(urls)
+    if checkpoint:
+        keep = set(todo)
+        for url in urls:
+            if url not in keep:
+                checkpoint.mark_done(url)
+    return todo
+
+def _collect_character_urls(d) -> List[str]:
+    with_retries(nav, d, "https://gametora.com/umamusume/characters", "body")
+    pause(1)  # Wait for page to fully load
+
+    # Find character links - use broader selector since classes are hashed
+    anchors = safe_find_all(d, By.CSS_SELECTOR, "a[href*='/umamusume/characters/']")
+    anchors = filter_visible(d, anchors)
+    urls = []
+    for a in anchors:
+        href = a.get_attribute("href") or ""
+        # Filter out the main list page and duplicates
+        if href and "/umamusume/characters/" in href and href != "https://gametora.com/umamusume/characters" and href not in urls:
+            # Make sure it's a specific character page (has ID in URL)
+            if re.search(r'/characters/\d+-', href) or re.search(r'/characters/[a-z]+-[a-z]+', href):
+                urls.append(href)
 
-        # Find character links - use broader selector since classes are hashed
+    urls = list(dict.fromkeys(urls))  # Remove duplicates while preserving order
+    urls = list(reversed(urls))
+
+    if not urls:
+        print("[character] No character links found; trying to scroll and reload...")
+        _scroll_page_until_stable(d)
+        pause(1)
         anchors = safe_find_all(d, By.CSS_SELECTOR, "a[href*='/umamusume/characters/']")
         anchors = filter_visible(d, anchors)
-        urls = []
         for a in anchors:
             href = a.get_attribute("href") or ""
-            # Filter out the main list page and duplicates
-            if href and "/umamusume/characters/" in href and href != "https://gametora.com/umamusume/characters" and href not in urls:
-                # Make sure it's a specific character page (has ID in URL)
-                if re.search(r'/characters/\d+-', href) or re.search(r'/characters/[a-z]+-[a-z]+', href):
-                    urls.append(href)
-
-        urls = list(dict.fromkeys(urls))  # Remove duplicates while preserving order
-        urls = list(reversed(urls))
-        total = len(urls)
-
-        if total == 0:
-            print("[character] No character links found; trying to scroll and reload...")
-            _scroll_page_until_stable(d)
-            time.sleep(1)
-            anchors = safe_find_all(d, By.CSS_SELECTOR, "a[href*='/umamusume/characters/']")
-            anchors = filter_visible(d, anchors)
-            for a in anchors:
-                href = a.get_attribute("href") or ""
-                if href and "/umamusume/characters/" in href and "characters" != href.split("/")[-1] and href not in urls:
-                    urls.append(href)
-            urls = list(dict.fromkeys(urls))
-            total = len(urls)
-
-        print(f"[character] Found {total} character URLs to scrape")
-
-        for i, url in enumerate(urls, 1):
-            for attempt in range(RETRIES + 1):
-                try:
-                    ok = with_retries(nav, d, url, "body")
-                    slug, uma_id = _slug_and_id_from_url(url)
-                    if not ok: raise TimeoutException("no body")
-
-                    time.sleep(0.5)  # Wait for JS to load
-
-                    # Try to get data from __NEXT_DATA__ JSON first
-                    page_props = get_page_props(d)
-
-                    if page_props:
-                        # New JSON-based extraction
-                        item_data = page_props.get("itemData", {})
-                        event_data = (
-                            page_props.get("eventData")
-                            or page_props.get("events")
-                            or page_props.get("event")
-                            or page_props.get("event_data")
-                            or {}
-                        )
-                        objective_data = page_props.get("objectiveData", [])
-
-                        # Get character name
-                        name = item_data.get("name_en") or item_data.get("name") or ""
-                        if not name:
-                            # Fallback to DOM
-                            name_el = safe_find(d, By.CSS_SELECTOR, "h1, [class*='name']")
-                            name = (txt(name_el) or "").replace("\n", "")
-
-                        if not name:
-                            raise WebDriverException("Missing character name")
-
-                        nickname = item_data.get("title_en") or item_data.get("title") or ""
-                        uma_key = _make_uma_key(name, nickname, slug)
-
-                        # Parse stats (JSON first, DOM fallback)
-                        base_stats, stat_bonuses, aptitudes = _parse_stats_from_json(item_data)
-                        if not base_stats:
-                            base_stats = _parse_base_stats_from_page(d)
-                        if not stat_bonuses:
-                            stat_bonuses = _parse_stat_bonuses_from_page(d)
-                        if not aptitudes:
-                            aptitudes = _parse_aptitudes_from_page(d)
-                        aptitudes = _normalize_strategy_names(aptitudes)
-
-                        # Get base stars from rarity field
-                        base_stars = item_data.get("rarity") or item_data.get("stars") or 0
-
-                        # Height and sizes
-                        height_cm = item_data.get("height") or item_data.get("height_cm") or item_data.get("heightCm") or None
-                        if height_cm is None:
-                            height_cm = _parse_height_from_page(d)
-                        sizes = _parse_sizes_from_item(item_data)
-                        if not sizes:
-                            sizes = _parse_three_sizes(_label_value(d, "Three sizes") or _label_value(d, "Three Sizes"))
-
-                        # Parse objectives
-                        objectives = _parse_objectives_from_json(objective_data)
-
-                        # Parse events
-                        events = _parse_events_from_json(event_data, lang="en")
-                        if not events:
-                            _open_character_events_tab(d)
-                            events = _parse_character_events_from_page(d)
-
-                    else:
-                        # Fallback to old DOM-based parsing (may not work with new UI)
-                        print(f"  [warn] No __NEXT_DATA__ found for {url}, trying DOM fallback...")
-
-                        name_el = safe_find(d, By.CSS_SELECTOR, 'h1, div[class*=character] [class*=name]')
-                        name = (txt(name_el) or "").replace("\n", "")
-                        if not name:
-                            raise WebDriverException("Missing character name")
-
-                        nickname, base_stars = _parse_top_meta(d)
-                        uma_key = _make_uma_key(name, nickname, slug)
-
-                        base_stats = _parse_base_stats_from_page(d)
-                        stat_bonuses = _parse_stat_bonuses_from_page(d)
-                        aptitudes = _normalize_strategy_names(_parse_aptitudes_from_page(d))
-                        height_cm = _parse_height_from_page(d)
-                        sizes = _parse_three_sizes(_label_value(d, "Three sizes") or _label_value(d, "Three Sizes"))
-                        objectives = []
-                        events = []
-
-                    # --- Upsert record ---
-                    upsert_json_item(save_path, "UmaKey", uma_key, {
-                        "UmaKey": uma_key,
-                        "UmaName": name,
-                        "UmaNickname": nickname or None,
-                        "UmaSlug": slug,
-                        "UmaId": uma_id,
-                        "UmaBaseStars": base_stars or None,
-                        "UmaBaseStats": base_stats,
-                        "UmaStatBonuses": stat_bonuses,
-                        "UmaAptitudes": aptitudes,
-                        "UmaHeightCm": height_cm,
-                        "UmaThreeSizes": sizes,
-                        "UmaObjectives": objectives,
-                        "UmaEvents": events
-                    })
+            if href and "/umamusume/characters/" in href and "characters" != href.split("/")[-1] and href not in urls:
+                urls.append(href)
+        urls = list(dict.fromkeys(urls))
+    return urls
+
+def scrape_characters(save_path: str, server: str, headless: bool = True, http_fast: bool = True,
+                      workers: int = 2, min_interval: float = 0.9, jitter: float = 0.25,
+                      incremental: bool = False, checkpoint: Optional[ScrapeCheckpoint] = None,
+                      engine: str = "threads", async_max_concurrency: int = ASYNC_MAX_CONCURRENCY):
+    METRICS.reset()
+    pool = driver_pool(headless=headless, server=server)
+    manifest = None
+    if checkpoint and checkpoint.resuming:
+        urls = checkpoint.pending()
+        print(f"[character] Resuming from checkpoint: {checkpoint.summary()}")
+        manifest = FingerprintManifest(save_path, http_build_id("/umamusume/characters")) if incremental else None
+    else:
+        d = pool.acquire()
+        try:
+            urls = _collect_character_urls(d)
+            print(f"[character] Found {len(urls)} character URLs to scrape")
+            manifest = FingerprintManifest(save_path, list_page_build_id(d)) if incremental else None
+        finally:
+            pool.release(d)
+        if checkpoint:
+            checkpoint.start(urls)
+
+    if manifest:
+        urls = _skip_unchanged(urls, manifest, checkpoint)
+
+    def from_props(url: str, page_props: Dict[str, Any]) -> Optional[str]:
+        if manifest and manifest.unchanged(url, page_props):
+            return f"= unchanged {url}"
+        record = _character_record(page_props, url)
+        if not record:
+            return None
+        gaps = _character_gaps(record)
+        if gaps:
+            # Keep what the JSON had; the browser pass fills in only the gaps
+            # (leaving them out of the patch keeps any values already stored).
+            METRICS.count("json_incomplete")
+            upsert_json_item(save_path, "UmaKey", record["UmaKey"],
+                             {k: v for k, v in record.items() if k not in gaps})
+            return None
+        upsert_json_item(save_path, "UmaKey", record["UmaKey"], record)
+        if manifest:
+            manifest.record(url, page_props)
+        return _uma_summary(record)
+
+    def scrape_http(url: str) -> Optional[str]:
+        page_props = fetch_page_props_http(url)
+        return from_props(url, page_props) if page_props else None
+
+    def scrape_browser(d_local, url: str) -> str:
+        pause(0.5)  # Wait for JS to load
+
+        # Try to get data from __NEXT_DATA__ JSON first
+        page_props = get_page_props(d_local)
+        if page_props and manifest and manifest.unchanged(url, page_props):
+            return f"= unchanged {url}"
+        if page_props:
+            record = _character_record(page_props, url, d_local)
+        else:
+            # Fallback to old DOM-based parsing (may not work with new UI)
+            print(f"  [warn] No __NEXT_DATA__ found for {url}, trying DOM fallback...")
+            METRICS.count("dom_fallbacks")
+            record = _character_record_from_dom(d_local, url)
 
-                    print(f"[{i}/{total}] UMA ✓ {name} ({nickname or slug or 'default'})  "
-                        f"(★{base_stars} | base:{'/'.join(base_stats.keys()) or '-'} "
-                        f"| bonuses:{len(stat_bonuses)} | apt:{len(aptitudes)} "
-                        f"| {len(objectives)} objectives, {len(events)} events)")
-                    break
+        # --- Upsert record ---
+        upsert_json_item(save_path, "UmaKey", record["UmaKey"], record)
+        if manifest and page_props:
+            manifest.record(url, page_props)
+        return _uma_summary(record)
 
-                except (TimeoutException, WebDriverException, StaleElementReferenceException, ReadTimeoutError) as e:
-                    if attempt < RETRIES:
-                        try: d.quit()
-                        except Exception: pass
-                        d = new_driver(headless=headless)
-                        with_retries(nav, d, "https://gametora.com/umamusume/characters", "body")
-                        ensure_server(d, server=server, keep_raw_en=True)
-                        continue
-                    else:
-                        print(f"[{i}/{total}] UMA ERROR {url}: {e}")
-                        break
+    try:
+        if http_fast and engine == "async":
+            urls = run_async_http_pass(urls, "UMA", from_props, max_concurrency=async_max_concurrency,
+                                       checkpoint=checkpoint)
+        run_scrape_pool(urls, "UMA", pool, scrape_browser,
+                        scrape_http=scrape_http if http_fast and engine == "threads" else None,
+                        workers=workers, min_interval=min_interval, jitter=jitter,
+                        checkpoint=checkpoint)
     finally:
-        try: d.quit()
-        except Exception: pass
+        flush_json_stores()
+        if checkpoint:
+            checkpoint.save(force=True)
+            print(f"[character] checkpoint: {checkpoint.summary()}")
+        if manifest:
+            manifest.save()
+            print(f"[character] incremental: {manifest.summary()}")
+        METRICS.report("characters")
 
 
 def scrape_supports(out_events_path: str, out_hints_path: str, server: str, headless: bool = True,
                     thumbs_dir: str = "assets/support_thumbs", workers: int = 2,
-                    min_interval: float = 0.9, jitter: float = 0.25):
+                    min_interval: float = 0.9, jitter: float = 0.25, http_fast: bool = True,
+                    incremental: bool = False, checkpoint: Optional[ScrapeCheckpoint] = None,
+                    engine: str = "threads", async_max_concurrency: int = ASYNC_MAX_CONCURRENCY):
     return scrape_supports_threaded(
         out_events_path,
         out_hints_path,
@@ -1423,7 +2768,12 @@ def scrape_supports(out_events_path: str, out_hints_path: str, server: str, head
         thumbs_dir=thumbs_dir,
         workers=workers,
         min_interval=min_interval,
-        jitter=jitter
+        jitter=jitter,
+        http_fast=http_fast,
+        incremental=incremental,
+        checkpoint=checkpoint,
+        engine=engine,
+        async_max_concurrency=async_max_concurrency
     )
     d = new_driver(headless=headless)
     try:
@@ -1540,50 +2890,7 @@ def scrape_supports(out_events_path: str, out_hints_path: str, server: str, head
 
 def _parse_support_events_from_json(event_data: Dict[str, Any], lang: str = "en") -> List[Dict[str, Any]]:
     """Parse support card events from JSON (random events and chain/arrow events)."""
-    events: List[Dict[str, Any]] = []
-    if not event_data:
-        return events
-
-    # Get language-specific data
-    lang_data = event_data.get(lang) or event_data.get("en") or event_data.get("ja") or {}
-    if not isinstance(lang_data, dict):
-        lang_data = event_data if isinstance(event_data, dict) else {}
-
-    # Process random events and arrows (chain events)
-    for category in ["random", "arrows", "chain"]:
-        cat_events = lang_data.get(category, []) if isinstance(lang_data, dict) else []
-        if not isinstance(cat_events, list):
-            continue
-
-        for evt in cat_events:
-            if not isinstance(evt, dict):
-                continue
-
-            event_name = evt.get("n") or evt.get("name") or ""
-            if not event_name:
-                continue
-
-            choices = evt.get("c") or evt.get("choices") or []
-            if not choices:
-                # No-choice event
-                rewards = evt.get("r") or evt.get("rewards") or []
-                reward_str = _format_stat_rewards(rewards)
-                events.append({
-                    "EventName": event_name,
-                    "EventOptions": {"(Auto)": reward_str or "See details"}
-                })
-            else:
-                for choice in choices:
-                    if isinstance(choice, dict):
-                        choice_name = choice.get("n") or choice.get("name") or "Option"
-                        rewards = choice.get("r") or choice.get("rewards") or []
-                        reward_str = _format_stat_rewards(rewards)
-                        events.append({
-                            "EventName": event_name,
-                            "EventOptions": {choice_name: reward_str or "See details"}
-                        })
-
-    return events
+    return normalize_events(event_data, SUPPORT_EVENT_CATEGORIES, lang)
 
 def _parse_support_hints_from_json(item_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Parse support hints/skills from JSON."""
@@ -1624,14 +2931,133 @@ def _parse_support_hints_from_json(item_data: Dict[str, Any]) -> List[Dict[str,
 
     return hints
 
+def _support_event_skills_raw(item_data: Dict[str, Any]) -> Optional[List[Any]]:
+    """The "Skills from events" list in itemData, or None when the payload doesn't carry one at all."""
+    hints_data = item_data.get("hints")
+    for src, key in ((item_data, "event_skills"), (item_data, "skills_from_events"), (hints_data, "event_skills")):
+        if isinstance(src, dict) and isinstance(src.get(key), list):
+            return src[key]
+    return None
+
+def _parse_support_event_skills_from_json(item_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Skills granted by support events ("Skills from events"), when the JSON carries them."""
+    raw = _support_event_skills_raw(item_data) or []
+    name_map = _load_skill_name_map()
+    out: List[Dict[str, Any]] = []
+    for entry in raw:
+        sid = (entry.get("id") or entry.get("skill_id")) if isinstance(entry, dict) else entry
+        if sid is None:
+            continue
+        sid = str(sid)
+        out.append({"SkillId": sid, "Name": name_map.get(sid, ""), "HintLevel": None})
+    return out
+
+def _support_fields_from_json(item_data: Dict[str, Any], sname: str, sup_id: Optional[str]) -> tuple[str, Optional[str]]:
+    """Return (rarity, sup_id) from itemData, falling back to the name for rarity."""
+    # Get rarity from JSON
+    rarity_map = {1: "R", 2: "SR", 3: "SSR"}
+    rarity_num = item_data.get("rarity") or 0
+    rarity = rarity_map.get(rarity_num, "UNKNOWN")
+
+    # If rarity not in JSON, try to parse from name
+    if rarity == "UNKNOWN":
+        m = re.search(r"\((SSR|SR|R)\)", sname, flags=re.I)
+        rarity = m.group(1).upper() if m else "UNKNOWN"
+
+    # Get support ID from JSON if not from URL
+    if not sup_id:
+        sup_id = str(item_data.get("id") or item_data.get("support_id") or "")
+    return rarity, sup_id
+
+def _store_support(slug: str, sname: str, sup_id: Optional[str], rarity: str, img_url: str,
+                   hints: List[Dict[str, Any]], events: List[Dict[str, Any]],
+                   out_events_path: str, out_hints_path: str) -> int:
+    # Save events
+    added = 0
+    for evt in events:
+        if append_json_item(
+            out_events_path,
+            make_support_card(evt["EventName"], evt["EventOptions"]),
+            dedup_key=("EventName", "EventOptions")
+        ):
+            added += 1
+
+    # Upsert hints
+    upsert_json_item(out_hints_path, "SupportSlug", slug or sname, {
+        "SupportSlug": slug or sname,
+        "SupportId": sup_id,
+        "SupportName": sname,
+        "SupportRarity": rarity,
+        "SupportImage": img_url,
+        "SupportHints": hints,
+    })
+    return added
+
+def _support_from_props(url: str, page_props: Dict[str, Any]):
+    """(name, slug, id, rarity, hints, events) parsed from pageProps alone; None without a name."""
+    item_data = page_props.get("itemData", {})
+    sname = item_data.get("name_en") or item_data.get("name") or ""
+    if not sname:
+        return None
+    slug, sup_id = _slug_and_id_from_url(url)
+    rarity, sup_id = _support_fields_from_json(item_data, sname, sup_id)
+    hints = _merge_support_hints(_parse_support_hints_from_json(item_data),
+                                 _parse_support_event_skills_from_json(item_data))
+    events = _parse_support_events_from_json(page_props.get("eventData", {}), lang="en")
+    return sname, slug, sup_id, rarity, hints, events
+
+def _support_json_gaps(page_props: Dict[str, Any], events: List[Dict[str, Any]]) -> List[str]:
+    """
+    What _scrape_support_detail would still fill from the DOM. SupportHints
+    is replaced wholesale on upsert, so storing a card without its event
+    skills would drop the ones an earlier browser pass found.
+    """
+    gaps = []
+    if _support_event_skills_raw(page_props.get("itemData") or {}) is None:
+        gaps.append("event skills")
+    if not events:
+        gaps.append("events")
+    return gaps
+
+def _scrape_support_http(url: str, previews: dict, thumbs_dir: str, out_events_path: str, out_hints_path: str,
+                         page_props: Optional[Dict[str, Any]] = None) -> Optional[tuple[str, str, Optional[str], int, int]]:
+    """
+    Browser-free variant of _scrape_support_detail; None when the page JSON
+    is missing or incomplete (see _support_json_gaps), so the caller falls
+    back to the browser.
+    """
+    page_props = page_props or fetch_page_props_http(url)
+    parsed = _support_from_props(url, page_props) if page_props else None
+    if not parsed:
+        return None
+    sname, slug, sup_id, rarity, hints, events = parsed
+    if _support_json_gaps(page_props, events):
+        METRICS.count("json_incomplete")
+        return None
+
+    img_url = ""
+    if slug in previews:
+        img_url = previews[slug].get("SupportImage", "") or ""
+        if not sup_id:
+            sup_id = previews[slug].get("SupportId", None)
+    if not img_url and sup_id:
+        src = f"{SITE_ORIGIN}/images/umamusume/supports/support_card_s_{sup_id}.png"
+        img_url = _save_thumb(src, thumbs_dir, slug, sup_id)
+
+    added = _store_support(slug, sname, sup_id, rarity, img_url, hints, events, out_events_path, out_hints_path)
+    return sname, slug, sup_id, added, len(hints)
+
 def _scrape_support_detail(d, url: str, previews: dict, thumbs_dir: str,
-                           out_events_path: str, out_hints_path: str) -> tuple[str, str, Optional[str], int, int]:
+                           out_events_path: str, out_hints_path: str,
+                           page_props: Optional[Dict[str, Any]] = None) -> tuple[str, str, Optional[str], int, int]:
+    """Scrape the support page loaded in d; page_props skips re-reading __NEXT_DATA__ when the caller has it."""
     slug, sup_id = _slug_and_id_from_url(url)
 
-    time.sleep(0.3)  # Wait for page to load
+    if page_props is None:
+        pause(0.3)  # Wait for page to load
 
-    # Try to get data from __NEXT_DATA__ JSON first
-    page_props = get_page_props(d)
+        # Try to get data from __NEXT_DATA__ JSON first
+        page_props = get_page_props(d)
 
     if page_props:
         # New JSON-based extraction
@@ -1645,24 +3071,14 @@ def _scrape_support_detail(d, url: str, previews: dict, thumbs_dir: str,
             name_el = safe_find(d, By.CSS_SELECTOR, "h1, [class*='name']")
             sname = txt(name_el) or url.rstrip("/").split("/")[-1]
 
-        # Get rarity from JSON
-        rarity_map = {1: "R", 2: "SR", 3: "SSR"}
-        rarity_num = item_data.get("rarity") or 0
-        rarity = rarity_map.get(rarity_num, "UNKNOWN")
-
-        # If rarity not in JSON, try to parse from name
-        if rarity == "UNKNOWN":
-            m = re.search(r"\((SSR|SR|R)\)", sname, flags=re.I)
-            rarity = m.group(1).upper() if m else "UNKNOWN"
-
-        # Get support ID from JSON if not from URL
-        if not sup_id:
-            sup_id = str(item_data.get("id") or item_data.get("support_id") or "")
+        rarity, sup_id = _support_fields_from_json(item_data, sname, sup_id)
 
         # Parse hints from JSON first, then enrich from DOM (includes "Skills from events")
-        hints = _parse_support_hints_from_json(item_data)
-        _open_support_hints_tab(d)
-        dom_hints = parse_support_hints_on_page(d)
+        hints = _merge_support_hints(_parse_support_hints_from_json(item_data),
+                                     _parse_support_event_skills_from_json(item_data))
+        with METRICS.stage("dom_hints"):
+            _open_support_hints_tab(d)
+            dom_hints = parse_support_hints_on_page(d)
         if dom_hints:
             hints = _merge_support_hints(hints, dom_hints)
 
@@ -1672,15 +3088,17 @@ def _scrape_support_detail(d, url: str, previews: dict, thumbs_dir: str,
     else:
         # Fallback to DOM-based parsing
         print(f"  [warn] No __NEXT_DATA__ found for {url}, trying DOM fallback...")
+        METRICS.count("dom_fallbacks")
 
-        name_el = safe_find(d, By.CSS_SELECTOR, 'h1, div[class*=support] [class*="name"]')
-        sname = txt(name_el) or url.rstrip("/").split("/")[-1]
+        with METRICS.stage("dom_fallback"):
+            name_el = safe_find(d, By.CSS_SELECTOR, 'h1, div[class*=support] [class*="name"]')
+            sname = txt(name_el) or url.rstrip("/").split("/")[-1]
 
-        m = re.search(r"\((SSR|SR|R)\)", sname, flags=re.I)
-        rarity = m.group(1).upper() if m else "UNKNOWN"
+            m = re.search(r"\((SSR|SR|R)\)", sname, flags=re.I)
+            rarity = m.group(1).upper() if m else "UNKNOWN"
 
-        _open_support_hints_tab(d)
-        hints = parse_support_hints_on_page(d)
+            _open_support_hints_tab(d)
+            hints = parse_support_hints_on_page(d)
         events = []
 
     # Handle image
@@ -1694,153 +3112,143 @@ def _scrape_support_detail(d, url: str, previews: dict, thumbs_dir: str,
         src = _abs_url(d, big.get_attribute("src") or "") if big else ""
         img_url = _save_thumb(src, thumbs_dir, slug, sup_id)
 
-    # Save events
-    added = 0
-    for evt in events:
-        if append_json_item(
-            out_events_path,
-            make_support_card(evt["EventName"], evt["EventOptions"]),
-            dedup_key=("EventName", "EventOptions")
-        ):
-            added += 1
-
-    # Upsert hints
-    upsert_json_item(out_hints_path, "SupportSlug", slug or sname, {
-        "SupportSlug": slug or sname,
-        "SupportId": sup_id,
-        "SupportName": sname,
-        "SupportRarity": rarity,
-        "SupportImage": img_url,
-        "SupportHints": hints,
-    })
-
+    added = _store_support(slug, sname, sup_id, rarity, img_url, hints, events, out_events_path, out_hints_path)
     return sname, slug, sup_id, added, len(hints)
 
 
-def scrape_supports_threaded(out_events_path: str, out_hints_path: str, server: str, headless: bool = True,
-                             thumbs_dir: str = "assets/support_thumbs", workers: int = 2,
-                             min_interval: float = 0.9, jitter: float = 0.25) -> None:
-    d = new_driver(headless=headless)
-    try:
-        with_retries(nav, d, "https://gametora.com/umamusume/supports", "body")
-        ensure_server(d, server=server, keep_raw_en=True)
-        time.sleep(1)  # Wait for JS to load
-
-        # collect preview thumbnails by slug/id once
-        previews = collect_support_previews(d, thumbs_dir)
+def _collect_support_urls(d, thumbs_dir: str) -> tuple[List[str], dict]:
+    """Support detail URLs from the list page, plus list thumbnails keyed by slug."""
+    with_retries(nav, d, "https://gametora.com/umamusume/supports", "body")
+    pause(1)  # Wait for JS to load
 
-        # Scroll to load all cards
-        _scroll_page_until_stable(d)
-        time.sleep(0.5)
+    # collect preview thumbnails by slug/id once
+    previews = collect_support_previews(d, thumbs_dir)
 
-        cards = _wait_support_cards(d)
-        if not cards:
-            _scroll_page_until_stable(d)
-            cards = _wait_support_cards(d, timeout_s=4.0)
+    # Scroll to load all cards
+    _scroll_page_until_stable(d)
+    pause(0.5)
 
-        urls = []
-        seen = set()
-        for a in cards:
-            href = a.get_attribute("href") or ""
-            if href and href not in seen:
-                # Validate it's a specific support page
-                if re.search(r'/supports/\d+-', href):
-                    seen.add(href)
-                    urls.append(href)
-
-        # Also try to get URLs from __NEXT_DATA__ if available
-        if not urls:
-            page_props = get_page_props(d)
-            if page_props:
-                items = page_props.get("items") or page_props.get("supports") or []
-                for item in items:
-                    if isinstance(item, dict):
-                        item_id = item.get("id") or item.get("support_id")
-                        slug = item.get("slug") or ""
-                        if item_id:
-                            url = f"https://gametora.com/umamusume/supports/{item_id}-{slug}" if slug else f"https://gametora.com/umamusume/supports/{item_id}"
-                            if url not in seen:
-                                seen.add(url)
-                                urls.append(url)
+    cards = _wait_support_cards(d)
+    if not cards:
+        _scroll_page_until_stable(d)
+        cards = _wait_support_cards(d, timeout_s=4.0)
 
-        total = len(urls)
-        if total == 0:
-            print("[support] No support cards found on list page; site layout may have changed.")
-            return
+    urls = []
+    seen = set()
+    for a in cards:
+        href = a.get_attribute("href") or ""
+        if href and href not in seen:
+            # Validate it's a specific support page
+            if re.search(r'/supports/\d+-', href):
+                seen.add(href)
+                urls.append(href)
 
-        print(f"[support] Found {total} support card URLs to scrape")
-    finally:
-        try: d.quit()
-        except Exception: pass
+    # Also try to get URLs from __NEXT_DATA__ if available
+    if not urls:
+        page_props = get_page_props(d)
+        if page_props:
+            items = page_props.get("items") or page_props.get("supports") or []
+            for item in items:
+                if isinstance(item, dict):
+                    item_id = item.get("id") or item.get("support_id")
+                    slug = item.get("slug") or ""
+                    if item_id:
+                        url = f"https://gametora.com/umamusume/supports/{item_id}-{slug}" if slug else f"https://gametora.com/umamusume/supports/{item_id}"
+                        if url not in seen:
+                            seen.add(url)
+                            urls.append(url)
+    return urls, previews
 
-    worker_count = max(1, min(int(workers), total))
-    rate_limiter = RateLimiter(min_interval_s=min_interval, jitter_s=jitter)
-    q = queue.Queue()
-    for i, url in enumerate(urls, 1):
-        q.put((i, url))
-
-    def worker_loop(worker_id: int) -> None:
-        d_local = new_driver(headless=headless)
+def scrape_supports_threaded(out_events_path: str, out_hints_path: str, server: str, headless: bool = True,
+                             thumbs_dir: str = "assets/support_thumbs", workers: int = 2,
+                             min_interval: float = 0.9, jitter: float = 0.25, http_fast: bool = True,
+                             incremental: bool = False, checkpoint: Optional[ScrapeCheckpoint] = None,
+                             engine: str = "threads", async_max_concurrency: int = ASYNC_MAX_CONCURRENCY) -> None:
+    METRICS.reset()
+    pool = driver_pool(headless=headless, server=server)
+    manifest = None
+    if checkpoint and checkpoint.resuming:
+        # detail pages fall back to the card id for thumbnails, so the list page can be skipped
+        urls, previews = checkpoint.pending(), {}
+        print(f"[support] Resuming from checkpoint: {checkpoint.summary()}")
+        manifest = FingerprintManifest(out_events_path, http_build_id("/umamusume/supports")) if incremental else None
+    else:
+        d = pool.acquire()
         try:
-            with_retries(nav, d_local, "https://gametora.com/umamusume/supports", "main main")
-            ensure_server(d_local, server=server, keep_raw_en=True)
-            while True:
-                try:
-                    idx, url = q.get_nowait()
-                except queue.Empty:
-                    return
-                try:
-                    for attempt in range(RETRIES + 1):
-                        try:
-                            rate_limiter.wait()
-                            ok = with_retries(nav, d_local, url, "body")
-                            if not ok:
-                                raise TimeoutException("no body")
-                            sname, slug, sup_id, added, hint_count = _scrape_support_detail(
-                                d_local, url, previews, thumbs_dir, out_events_path, out_hints_path
-                            )
-                            print(f"[{idx}/{total}] SUPPORT {sname} (slug:{slug or '-'} id:{sup_id or '-'} "
-                                  f"+{added} events, {hint_count} hints)")
-                            break
-                        except (TimeoutException, WebDriverException, StaleElementReferenceException, ReadTimeoutError) as e:
-                            if attempt < RETRIES:
-                                try: d_local.quit()
-                                except Exception: pass
-                                d_local = new_driver(headless=headless)
-                                with_retries(nav, d_local, "https://gametora.com/umamusume/supports", "main main")
-                                ensure_server(d_local, server=server, keep_raw_en=True)
-                                time.sleep(0.5 * (2 ** attempt))
-                                continue
-                            else:
-                                print(f"[{idx}/{total}] SUPPORT ERROR {url}: {e}")
-                                break
-                finally:
-                    q.task_done()
+            urls, previews = _collect_support_urls(d, thumbs_dir)
+            if not urls:
+                print("[support] No support cards found on list page; site layout may have changed.")
+                return
+            print(f"[support] Found {len(urls)} support card URLs to scrape")
+            manifest = FingerprintManifest(out_events_path, list_page_build_id(d)) if incremental else None
         finally:
-            try: d_local.quit()
-            except Exception: pass
-
-    threads = []
-    for wid in range(worker_count):
-        t = threading.Thread(target=worker_loop, args=(wid,), daemon=True)
-        t.start()
-        threads.append(t)
+            pool.release(d)
+        if checkpoint:
+            checkpoint.start(urls)
+
+    if manifest:
+        urls = _skip_unchanged(urls, manifest, checkpoint)
+
+    def summarize(res) -> str:
+        sname, slug, sup_id, added, hint_count = res
+        return (f"{sname} (slug:{slug or '-'} id:{sup_id or '-'} "
+                f"+{added} events, {hint_count} hints)")
+
+    def from_props(url: str, page_props: Dict[str, Any]) -> Optional[str]:
+        if manifest and manifest.unchanged(url, page_props):
+            return f"= unchanged {url}"
+        res = _scrape_support_http(url, previews, thumbs_dir, out_events_path, out_hints_path, page_props)
+        if res and manifest:
+            manifest.record(url, page_props)
+        return summarize(res) if res else None
+
+    def scrape_http(url: str) -> Optional[str]:
+        page_props = fetch_page_props_http(url)
+        return from_props(url, page_props) if page_props else None
+
+    def scrape_browser(d_local, url: str) -> str:
+        pause(0.3)  # Wait for page to load
+        page_props = get_page_props(d_local) or {}
+        if page_props and manifest and manifest.unchanged(url, page_props):
+            return f"= unchanged {url}"
+        res = _scrape_support_detail(d_local, url, previews, thumbs_dir, out_events_path, out_hints_path,
+                                     page_props)
+        if page_props and manifest:
+            manifest.record(url, page_props)
+        return summarize(res)
 
-    q.join()
-    for t in threads:
-        t.join()
+    try:
+        if http_fast and engine == "async":
+            urls = run_async_http_pass(urls, "SUPPORT", from_props, max_concurrency=async_max_concurrency,
+                                       checkpoint=checkpoint)
+        run_scrape_pool(urls, "SUPPORT", pool, scrape_browser,
+                        scrape_http=scrape_http if http_fast and engine == "threads" else None,
+                        workers=workers, min_interval=min_interval, jitter=jitter,
+                        checkpoint=checkpoint)
+    finally:
+        flush_json_stores()
+        flush_thumb_downloaders()
+        if checkpoint:
+            checkpoint.save(force=True)
+            print(f"[support] checkpoint: {checkpoint.summary()}")
+        if manifest:
+            manifest.save()
+            print(f"[support] incremental: {manifest.summary()}")
+        METRICS.report("supports")
 
 
 def scrape_career(save_path: str, server: str, headless: bool = True):
-    d = new_driver(headless=headless)
+    METRICS.reset()
+    pool = driver_pool(headless=headless, server=server)
+    d = pool.acquire()
     try:
         with_retries(nav, d, "https://gametora.com/umamusume/training-event-helper", "body")
-        time.sleep(1)  # Wait for JS to load
+        pause(1)  # Wait for JS to load
 
         # Pre-set deck
         d.execute_script('localStorage.setItem("u-eh-d1","[\\"Deck 1\\",106101,1,30024,30024,30009,30024,30009,30008]")')
         d.refresh()
-        time.sleep(1)
+        pause(1)
         ensure_server(d, server=server, keep_raw_en=True)
 
         # Find scenario dropdown - try multiple selectors
@@ -1848,7 +3256,7 @@ def scrape_career(save_path: str, server: str, headless: bool = True):
         if scenario_btn:
             try: scenario_btn.click()
             except Exception: pass
-            time.sleep(DELAY)
+            pause(DELAY)
 
         # Find scenario entries - use more flexible selectors
         scenario_entries = safe_find_all(d, By.CSS_SELECTOR, '[data-tippy-root] > div > div > div')
@@ -1864,7 +3272,7 @@ def scrape_career(save_path: str, server: str, headless: bool = True):
             if scenario_btn:
                 try: scenario_btn.click()
                 except Exception: pass
-                time.sleep(DELAY)
+                pause(DELAY)
 
             # Re-find entries
             entries = safe_find_all(d, By.CSS_SELECTOR, '[data-tippy-root] > div > div > div')
@@ -1880,14 +3288,14 @@ def scrape_career(save_path: str, server: str, headless: bool = True):
 
             try: entry.click()
             except Exception: pass
-            time.sleep(DELAY)
+            pause(DELAY)
 
             # Find filter buttons by ID
             btn = safe_find(d, By.CSS_SELECTOR, f'[id="{idx + 1}"]') or safe_find(d, By.ID, str(idx + 1))
             if btn:
                 try: btn.click()
                 except Exception: pass
-                time.sleep(DELAY)
+                pause(DELAY)
 
                 added = 0
                 # Find event items - use broader selectors
@@ -1895,25 +3303,20 @@ def scrape_career(save_path: str, server: str, headless: bool = True):
                 if not event_items:
                     event_items = safe_find_all(d, By.CSS_SELECTOR, '[class*="elist"] > div')
 
-                for it in event_items:
-                    if not is_visible(d, it):
-                        continue
-                    name = txt(it)
-                    if not name:
+                for name, rows in harvest_tippy_events(d, filter_visible(d, event_items)):
+                    if not name or not rows:
                         continue
-                    pop = tippy_show_and_get_popper(d, it)
-                    try:
-                        for kv in parse_event_from_tippy_popper(pop):
-                            if append_json_item(save_path, make_career(name, kv),
-                                                dedup_key=("EventName", "EventOptions")):
-                                added += 1
-                    finally:
-                        tippy_hide(d, it)
+                    for opts in option_groups(item for kv in rows for item in kv.items()):
+                        if append_json_item(save_path, make_career(name, opts),
+                                            dedup_key=("EventName", "EventOptions")):
+                            added += 1
 
                 print(f"[{idx + 1}/{total}] CAREER +{added} rows")
+                METRICS.count("pages")
     finally:
-        try: d.quit()
-        except Exception: pass
+        pool.release(d)
+        flush_json_stores()
+        METRICS.report("career")
 
 
 def _parse_schedule(year_label: str, month_label: str) -> str:
@@ -1928,40 +3331,166 @@ def _parse_schedule(year_label: str, month_label: str) -> str:
         month_text = month_label
     return f"{year_text} {month_text}"
 
+_RACE_ROWS_JS = _IS_VISIBLE_JS + """
+    const sels = ['[class*="race"] [class*="row"]', '[class*="list"] > div[class*="row"]', 'a[href*="/umamusume/races/"]'];
+    let rows = [];
+    for (const sel of sels) {
+      rows = Array.from(document.querySelectorAll(sel));
+      if (rows.length) break;
+    }
+    const text = n => n ? (n.innerText || '').trim().replace(/\\u00a0/g, ' ') : '';
+    return rows.filter(isVisible).map(row => {
+      const nameEl = row.querySelector('[class*="name"]') || row.querySelector('div > div:first-child');
+      const dateEl = row.querySelector('[class*="date"]');
+      let year = '', month = '';
+      if (dateEl && isVisible(dateEl)) {
+        const divs = dateEl.querySelectorAll('div');
+        if (divs.length >= 2) { year = text(divs[0]); month = text(divs[1]); }
+      }
+      const btn = row.querySelector('[class*="detail"]') || row.querySelector('button');
+      const gradeEl = row.querySelector('[class*="grade"]');
+      return {
+        el: row,
+        tag: row.tagName.toLowerCase(),
+        href: row.getAttribute('href') ? row.href : '',
+        name: text(nameEl),
+        year: year,
+        month: month,
+        grade: gradeEl && gradeEl !== nameEl ? text(gradeEl) : '',
+        desc: Array.from(row.querySelectorAll('[class*="desc"] > div'), text),
+        text: text(row),
+        details: btn && isVisible(btn) ? btn : null,
+      };
+    });
+"""
+
+def _extract_race_rows(d) -> List[Dict[str, Any]]:
+    """Every visible race row as a plain dict, in one execute_script call."""
+    try:
+        rows = d.execute_script(_RACE_ROWS_JS)
+    except Exception:
+        return []
+    return [r for r in rows or [] if isinstance(r, dict)]
+
+def _race_fields_from_text(text: str) -> Dict[str, str]:
+    """Grade/season/fans as shown in a race row or its details dialog."""
+    out: Dict[str, str] = {}
+    m = re.search(r"(G1|G2|G3|OP|Pre-OP|Maiden|Pre Debut)", text)
+    if m: out["Grade"] = m.group(1)
+    m = re.search(r"(Spring|Summer|Autumn|Winter|Fall)", text)
+    if m: out["Season"] = m.group(1)
+    m = re.search(r"Fans required[:\s]*(\d[\d,]*)", text)
+    if m: out["FansRequired"] = m.group(1)
+    m = re.search(r"Fans gained[:\s]*(\d[\d,]*)", text)
+    if m: out["FansGained"] = m.group(1)
+    return out
+
+def _race_fields_from_row(row: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Fields a race row can supply from its grade and desc cells. The name is
+    never matched ("Spring Stakes" is not a season), and Season is left to
+    the details dialog, which the scraper has always treated as authoritative.
+    """
+    desc = [t for t in row.get("desc") or [] if t]
+    fields = _race_fields_from_desc(desc)
+    cells = " | ".join([row.get("grade") or ""] + desc)
+    fields.update({k: v for k, v in _race_fields_from_text(cells).items() if k != "Season"})
+    return fields
+
+def _race_fields_from_desc(desc: List[str]) -> Dict[str, str]:
+    out: Dict[str, str] = {}
+    for t in desc:
+        if "Turf" in t or "Dirt" in t:
+            out["Terrain"] = "Turf" if "Turf" in t else "Dirt"
+        for dt in ["Short", "Mile", "Medium", "Long"]:
+            if dt in t:
+                out["DistanceType"] = dt
+                break
+        m = re.search(r"(\d{3,4})\s*m", t)
+        if m:
+            out["DistanceMeter"] = m.group(1) + "m"
+    return out
+
+def _race_fields_from_json(item: Dict[str, Any]) -> Dict[str, str]:
+    """Whatever string-valued race fields a __NEXT_DATA__ race entry carries."""
+    out: Dict[str, str] = {}
+    grade = item.get("grade_en") or item.get("grade")
+    if isinstance(grade, str) and grade:
+        out["Grade"] = grade
+    terrain = item.get("terrain") or item.get("ground") or item.get("track")
+    if isinstance(terrain, str) and terrain in ("Turf", "Dirt"):
+        out["Terrain"] = terrain
+    season = item.get("season_en") or item.get("season")
+    if isinstance(season, str) and season in ("Spring", "Summer", "Autumn", "Winter"):
+        out["Season"] = season
+    distance = item.get("distance") or item.get("distance_m")
+    if isinstance(distance, (int, float)) and distance > 0:
+        out["DistanceMeter"] = f"{int(distance)}m"
+    for key, field in (("fans_required", "FansRequired"), ("fans_needed", "FansRequired"), ("fans_gained", "FansGained")):
+        v = item.get(key)
+        if isinstance(v, (int, str)) and str(v) and field not in out:
+            out[field] = str(v)
+    return out
+
+def _races_from_next_data(d) -> Dict[str, Dict[str, str]]:
+    page_props = get_page_props(d) or {}
+    items = page_props.get("races") or page_props.get("raceData") or page_props.get("items") or []
+    by_name: Dict[str, Dict[str, str]] = {}
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict):
+            continue
+        name = item.get("name_en") or item.get("name") or ""
+        if name:
+            by_name.setdefault(name, _race_fields_from_json(item))
+    return by_name
+
+@METRICS.timed("race_dialog")
+def _read_race_dialog(d, details_btn) -> Dict[str, str]:
+    try: details_btn.click()
+    except Exception: pass
+    pause(DELAY)
+
+    dialog = safe_find(d, By.CSS_SELECTOR, 'div[role="dialog"]') or safe_find(d, By.CSS_SELECTOR, '[class*="modal"]')
+    if not dialog:
+        return {}
+    fields = _race_fields_from_text(txt(dialog))
+
+    # Close dialog
+    close_btn = safe_find(dialog, By.CSS_SELECTOR, "img, button, [class*='close']")
+    if close_btn:
+        try: close_btn.click()
+        except Exception: pass
+    pause(DELAY)
+    return fields
+
+_RACE_DIALOG_FIELDS = ("Grade", "Season", "FansRequired", "FansGained")
+
 def scrape_races(save_path: str, server: str, headless: bool = True):
-    d = new_driver(headless=headless)
+    METRICS.reset()
+    pool = driver_pool(headless=headless, server=server)
+    d = pool.acquire()
     try:
         with_retries(nav, d, "https://gametora.com/umamusume/races", "body")
-        time.sleep(1)  # Wait for JS to load
+        pause(1)  # Wait for JS to load
         ensure_server(d, server=server, keep_raw_en=True)
-        time.sleep(0.5)
+        pause(0.5)
 
         # Scroll to load all races
         _scroll_page_until_stable(d)
-        time.sleep(0.5)
+        pause(0.5)
 
-        # Find race rows - use flexible selectors
-        rows = safe_find_all(d, By.CSS_SELECTOR, '[class*="race"] [class*="row"]')
-        if not rows:
-            rows = safe_find_all(d, By.CSS_SELECTOR, '[class*="list"] > div[class*="row"]')
-        if not rows:
-            # Try to find any clickable race items
-            rows = safe_find_all(d, By.CSS_SELECTOR, 'a[href*="/umamusume/races/"]')
-
-        rows = filter_visible(d, rows)
+        json_races = _races_from_next_data(d)
+        rows = _extract_race_rows(d)
         total = len(rows)
-        print(f"[races] Found {total} race rows")
+        print(f"[races] Found {total} race rows" + (f" ({len(json_races)} in __NEXT_DATA__)" if json_races else ""))
 
+        dialogs = 0
         for idx, row in enumerate(rows, 1):
-            # Find race name - look for text in various locations
-            name_el = safe_find(row, By.CSS_SELECTOR, '[class*="name"]') or safe_find(row, By.CSS_SELECTOR, 'div > div:first-child')
-            race_name = txt(name_el) if name_el else ""
-
-            if not race_name:
+            race_name = row.get("name") or ""
+            if not race_name and row.get("tag") == "a":
                 # If this is a link, try to extract name from the URL or inner text
-                if row.tag_name == "a":
-                    href = row.get_attribute("href") or ""
-                    race_name = txt(row) or href.split("/")[-1].replace("-", " ").title()
+                href = row.get("href") or ""
+                race_name = row.get("text") or href.split("/")[-1].replace("-", " ").title()
 
             if not race_name:
                 print(f"[{idx}/{total}] (skip unnamed race)")
@@ -1976,97 +3505,133 @@ def scrape_races(save_path: str, server: str, headless: bool = True):
                 print(f"[{idx}/{total}] {race_name} (special) ✓")
                 continue
 
-            # Try to find date info
-            date_el = safe_find(row, By.CSS_SELECTOR, '[class*="date"]')
-            year = ""
-            month = ""
-            if date_el and is_visible(d, date_el):
-                divs = safe_find_all(date_el, By.CSS_SELECTOR, "div")
-                if len(divs) >= 2:
-                    year = txt(divs[0])
-                    month = txt(divs[1])
-
+            year, month = row.get("year") or "", row.get("month") or ""
             schedule = _parse_schedule(year, month) if (year and month) else "Unknown"
 
-            # Try to find terrain and distance
-            terrain = ""
-            distance_type = ""
-            distance_meter = ""
-
-            # Look for descriptors
-            desc_divs = safe_find_all(row, By.CSS_SELECTOR, '[class*="desc"] > div')
-            for dv in desc_divs:
-                t = txt(dv)
-                if "Turf" in t or "Dirt" in t:
-                    terrain = "Turf" if "Turf" in t else "Dirt"
-                if any(x in t for x in ["Short", "Mile", "Medium", "Long"]):
-                    for dt in ["Short", "Mile", "Medium", "Long"]:
-                        if dt in t:
-                            distance_type = dt
-                            break
-                if re.search(r"\d{3,4}\s*m", t):
-                    m = re.search(r"(\d{3,4})\s*m", t)
-                    if m:
-                        distance_meter = m.group(1) + "m"
-
-            # Try to click for details
-            details_btn = safe_find(row, By.CSS_SELECTOR, '[class*="detail"]') or safe_find(row, By.CSS_SELECTOR, 'button')
-            if details_btn and is_visible(d, details_btn):
-                try: details_btn.click()
-                except Exception: pass
-                time.sleep(DELAY)
-
-            dialog = safe_find(d, By.CSS_SELECTOR, 'div[role="dialog"]') or safe_find(d, By.CSS_SELECTOR, '[class*="modal"]')
-
-            grade_text = ""
-            season_text = ""
-            fans_required = ""
-            fans_gained = ""
-
-            if dialog:
-                # Extract info from dialog
-                dialog_text = txt(dialog)
-
-                # Try to find grade
-                grade_match = re.search(r"(G1|G2|G3|OP|Pre-OP|Maiden|Pre Debut)", dialog_text)
-                if grade_match:
-                    grade_text = grade_match.group(1)
-
-                # Try to find season
-                season_match = re.search(r"(Spring|Summer|Autumn|Winter|Fall)", dialog_text)
-                if season_match:
-                    season_text = season_match.group(1)
-
-                # Try to find fans info
-                fans_req_match = re.search(r"Fans required[:\s]*(\d[\d,]*)", dialog_text)
-                if fans_req_match:
-                    fans_required = fans_req_match.group(1)
-
-                fans_gain_match = re.search(r"Fans gained[:\s]*(\d[\d,]*)", dialog_text)
-                if fans_gain_match:
-                    fans_gained = fans_gain_match.group(1)
-
-                # Close dialog
-                close_btn = safe_find(dialog, By.CSS_SELECTOR, "img, button, [class*='close']")
-                if close_btn:
-                    try: close_btn.click()
-                    except Exception: pass
-                time.sleep(DELAY)
+            # Row cells first, then __NEXT_DATA__; the details dialog is opened
+            # only for fields neither supplies, and its values win when it is.
+            fields = _race_fields_from_row(row)
+            for k, v in json_races.get(race_name, {}).items():
+                fields.setdefault(k, v)
+            if any(f not in fields for f in _RACE_DIALOG_FIELDS) and row.get("details") is not None:
+                fields.update(_read_race_dialog(d, row["details"]))
+                dialogs += 1
+                METRICS.count("race_dialogs")
 
             item = make_race(
-                race_name, schedule, grade_text or "Unknown", terrain or "Unknown",
-                distance_type or "Unknown", distance_meter or "Unknown", season_text or "Unknown",
-                fans_required or "Unknown", fans_gained or "Unknown"
+                race_name, schedule, fields.get("Grade") or "Unknown", fields.get("Terrain") or "Unknown",
+                fields.get("DistanceType") or "Unknown", fields.get("DistanceMeter") or "Unknown",
+                fields.get("Season") or "Unknown",
+                fields.get("FansRequired") or "Unknown", fields.get("FansGained") or "Unknown"
             )
             append_json_item(save_path, item, dedup_key=("RaceName", "Schedule", "DistanceMeter"))
 
             print(f"[{idx}/{total}] {race_name} ✓")
+        print(f"[races] opened {dialogs}/{total} detail dialogs")
     finally:
-        try: d.quit()
-        except Exception: pass
+        pool.release(d)
+        flush_json_stores()
+        METRICS.report("races")
+
+
+def replay_fixture(fx: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Run one recorded page through the same browser-free parsing the scraper uses."""
+    url, props = fx.get("url", ""), fx["pageProps"]
+    if fx.get("kind") == "character":
+        return _character_record(props, url)
+    if fx.get("kind") == "support":
+        parsed = _support_from_props(url, props)
+        if not parsed:
+            return None
+        sname, slug, sup_id, rarity, hints, events = parsed
+        return {"SupportName": sname, "SupportSlug": slug, "SupportId": sup_id,
+                "SupportRarity": rarity, "SupportHints": hints, "SupportEvents": events}
+    return None
+
+def replay_fixtures(fixture_dir: str, out_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Replay every fixture offline and print per-kind counts plus a digest of
+    the parsed output, so parser changes can be checked for identical
+    results (write the records with out_path to diff them).
+    """
+    fixtures = load_fixtures(fixture_dir)
+    results, incomplete, errors = [], 0, 0
+    for fx in fixtures:
+        try:
+            rec = replay_fixture(fx)
+        except Exception as e:
+            errors += 1
+            print(f"[replay] ERROR {fx.get('url')}: {type(e).__name__}: {e}")
+            continue
+        if rec is None:
+            incomplete += 1
+            continue
+        results.append({"url": fx.get("url"), "kind": fx.get("kind"), "record": rec})
+    blob = json.dumps(results, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    digest = hashlib.blake2b(blob, digest_size=8).hexdigest()
+    kinds = Counter(r["kind"] for r in results)
+    print(f"[replay] {len(fixtures)} fixtures: " + ", ".join(f"{n} {k}" for k, n in sorted(kinds.items()))
+          + f", {incomplete} incomplete, {errors} errors; output digest {digest}")
+    if out_path:
+        _atomic_write(out_path, results, record=False)
+    return {"fixtures": len(fixtures), "records": len(results), "incomplete": incomplete,
+            "errors": errors, "digest": digest}
+
+def _bench_inputs(fixtures: List[Dict[str, Any]]) -> Dict[str, Tuple[Any, List[tuple]]]:
+    """Per-parser argument lists pulled out of the recorded pageProps."""
+    chars = [fx["pageProps"] for fx in fixtures if fx.get("kind") == "character"]
+    sups = [fx["pageProps"] for fx in fixtures if fx.get("kind") == "support"]
+    char_events = [p.get("eventData") or p.get("events") or p.get("event") or p.get("event_data") or {} for p in chars]
+    rewards: List[tuple] = []
+    for ev_data in char_events + [p.get("eventData", {}) for p in sups]:
+        for lang_data in (ev_data.values() if isinstance(ev_data, dict) else ()):
+            for evts in (lang_data.values() if isinstance(lang_data, dict) else ()):
+                for evt in (evts if isinstance(evts, list) else ()):
+                    if not isinstance(evt, dict):
+                        continue
+                    rewards.append((evt.get("r") or evt.get("rewards") or [],))
+                    for ch in evt.get("c") or evt.get("choices") or []:
+                        if isinstance(ch, dict):
+                            rewards.append((ch.get("r") or ch.get("rewards") or [],))
+    return {
+        "_parse_events_from_json": (_parse_events_from_json, [(e,) for e in char_events]),
+        "_parse_objectives_from_json": (_parse_objectives_from_json, [(p.get("objectiveData", []),) for p in chars]),
+        "_parse_stats_from_json": (_parse_stats_from_json, [(p.get("itemData", {}),) for p in chars]),
+        "_parse_support_events_from_json": (_parse_support_events_from_json, [(p.get("eventData", {}),) for p in sups]),
+        "_parse_support_hints_from_json": (_parse_support_hints_from_json, [(p.get("itemData", {}),) for p in sups]),
+        "_format_stat_rewards": (_format_stat_rewards, rewards),
+        "replay_fixture": (replay_fixture, [(fx,) for fx in fixtures]),
+    }
+
+def bench_parsers(fixture_dir: str, rounds: int = 20) -> Dict[str, Any]:
+    """Time each JSON parser over the recorded fixtures; prints best/median µs per call."""
+    fixtures = load_fixtures(fixture_dir)
+    report: Dict[str, Any] = {"label": "bench", "fixtures": len(fixtures), "rounds": rounds, "parsers": {}}
+    print(f"[bench] {len(fixtures)} fixtures, {rounds} rounds")
+    for name, (fn, calls) in _bench_inputs(fixtures).items():
+        if not calls:
+            continue
+        per_call = []
+        for _ in range(max(1, rounds)):
+            t0 = time.perf_counter()
+            for args in calls:
+                fn(*args)
+            per_call.append((time.perf_counter() - t0) / len(calls))
+        per_call.sort()
+        best, median = per_call[0] * 1e6, per_call[len(per_call) // 2] * 1e6
+        report["parsers"][name] = {"calls": len(calls), "best_us": round(best, 2), "median_us": round(median, 2),
+                                   "calls_per_s": round(1e6 / median) if median else None}
+        print(f"[bench]   {name:<32} calls={len(calls):<6} best={best:>9.2f}µs median={median:>9.2f}µs "
+              f"({report['parsers'][name]['calls_per_s']}/s)")
+    if METRICS.export_path:
+        runs = _read_json_list(METRICS.export_path)
+        runs.append(report)
+        _atomic_write(METRICS.export_path, runs, record=False)
+    return report
 
 
 def main():
+    global DRIVER_MAX_PAGES, DRIVER_MAX_FAILURES, THUMB_WORKERS, THUMB_REVALIDATE, FIXTURE_DIR
     ap = argparse.ArgumentParser(description="GameTora scraper (robust + accurate Support hints; UMA skills removed)")
     ap.add_argument("--out-uma", default="Assets/uma_data.json", help="Output JSON for characters (objectives/events only)")
     ap.add_argument("--out-supports", default="Assets/support_card.json", help="Output JSON for support events")
@@ -2074,19 +3639,60 @@ def main():
     ap.add_argument("--out-career", default="Assets/career.json", help="Output JSON for career events")
     ap.add_argument("--out-races", default="Assets/races.json", help="Output JSON for races")
     ap.add_argument("--thumb-dir", default="assets/support_thumbs", help="Where to save support thumbnails")
-    ap.add_argument("--what", choices=["uma","supports","career","races","all"], default="all")
+    ap.add_argument("--what", choices=["uma","supports","thumbs","career","races","all"], default="all")
     ap.add_argument("--server", choices=["global","japan"], default="global")
     ap.add_argument("--headful", action="store_true")
     ap.add_argument("--supports-workers", type=int, default=2, help="Parallel workers for support scraping (1 disables threading)")
     ap.add_argument("--supports-min-interval", type=float, default=0.9, help="Min seconds between support page navigations across workers")
     ap.add_argument("--supports-jitter", type=float, default=0.25, help="Random jitter added to support navigation delays")
+    ap.add_argument("--uma-workers", type=int, default=2, help="Parallel workers for character scraping (1 disables threading)")
+    ap.add_argument("--uma-min-interval", type=float, default=0.9, help="Min seconds between character page fetches across workers")
+    ap.add_argument("--checkpoint", default=None, help=f"Record progress in this file for --resume (one section per --what target; --resume alone uses {DEFAULT_CHECKPOINT})")
+    ap.add_argument("--resume", action="store_true", help="Continue the last character/support run from --checkpoint instead of re-reading the list pages")
+    ap.add_argument("--engine", choices=["threads","async"], default="threads", help="HTTP fast path engine: per-worker threads, or one asyncio pass with an adaptive limiter before the browser pass")
+    ap.add_argument("--async-max-concurrency", type=int, default=ASYNC_MAX_CONCURRENCY, help="Upper bound the async engine may widen to")
+    ap.add_argument("--metrics-json", default=None, help="Append each pass's timing/throughput summary to this JSON file")
+    ap.add_argument("--record-fixtures", metavar="DIR", default=None, help="Save every detail page's pageProps under DIR for offline replay")
+    ap.add_argument("--replay", metavar="DIR", default=None, help="Parse recorded fixtures offline (no browser, no network) and exit")
+    ap.add_argument("--replay-out", metavar="FILE", default=None, help="With --replay: write the parsed records here for diffing")
+    ap.add_argument("--bench", type=int, default=0, metavar="ROUNDS", help="With --replay: also time each parser over the fixtures")
+    ap.add_argument("--incremental", action="store_true", help="Skip character/support pages whose pageProps are unchanged since the last run")
+    ap.add_argument("--no-http", action="store_true", help="Always drive Chrome for detail pages (skip the HTTP __NEXT_DATA__ fast path)")
+    ap.add_argument("--driver-max-pages", type=int, default=DRIVER_MAX_PAGES, help="Recycle a pooled browser after this many pages")
+    ap.add_argument("--driver-max-failures", type=int, default=DRIVER_MAX_FAILURES, help="Recycle a pooled browser after this many failed pages")
+    ap.add_argument("--thumb-workers", type=int, default=THUMB_WORKERS, help="Concurrent thumbnail downloads")
+    ap.add_argument("--no-thumb-optimize", action="store_true", help="Skip the WebP/atlas thumbnail stage after scraping supports")
+    ap.add_argument("--thumb-revalidate", action="store_true", help="Revalidate cached thumbnails with conditional GETs instead of trusting the manifest")
     args = ap.parse_args()
     headless = not args.headful
+    DRIVER_MAX_PAGES = args.driver_max_pages
+    DRIVER_MAX_FAILURES = args.driver_max_failures
+    THUMB_WORKERS = args.thumb_workers
+    THUMB_REVALIDATE = args.thumb_revalidate
+    METRICS.export_path = args.metrics_json
+    FIXTURE_DIR = args.record_fixtures
+
+    if args.replay:
+        replay_fixtures(args.replay, args.replay_out)
+        if args.bench:
+            bench_parsers(args.replay, args.bench)
+        return
 
     try:
         if args.what in ("uma","all"):
             print("\n=== Characters (objectives/events only) ===")
-            scrape_characters(args.out_uma, server=args.server, headless=headless)
+            scrape_characters(
+                args.out_uma,
+                server=args.server,
+                headless=headless,
+                http_fast=not args.no_http,
+                workers=args.uma_workers,
+                min_interval=args.uma_min_interval,
+                incremental=args.incremental,
+                checkpoint=open_checkpoint(args.checkpoint, "uma", args.resume),
+                engine=args.engine,
+                async_max_concurrency=args.async_max_concurrency
+            )
         if args.what in ("supports","all"):
             print("\n=== Supports (events + support hints) ===")
             scrape_supports(
@@ -2097,8 +3703,16 @@ def main():
                 thumbs_dir=args.thumb_dir,
                 workers=args.supports_workers,
                 min_interval=args.supports_min_interval,
-                jitter=args.supports_jitter
+                jitter=args.supports_jitter,
+                http_fast=not args.no_http,
+                incremental=args.incremental,
+                checkpoint=open_checkpoint(args.checkpoint, "supports", args.resume),
+                engine=args.engine,
+                async_max_concurrency=args.async_max_concurrency
             )
+        if args.what == "thumbs" or (args.what in ("supports","all") and not args.no_thumb_optimize):
+            print("\n=== Thumbnails (webp + atlas) ===")
+            optimize_thumbnails(args.thumb_dir)
         if args.what in ("career","all"):
             print("\n=== Career ===")
             scrape_career(args.out_career, server=args.server, headless=headless)
@@ -2107,6 +3721,9 @@ def main():
             scrape_races(args.out_races, server=args.server, headless=headless)
     except WebDriverException as e:
         print(f"[fatal] WebDriver error: {e}", file=sys.stderr); sys.exit(2)
+    finally:
+        close_driver_pools()
+        close_thumb_downloaders()
 
 if __name__ == "__main__":
     main()
@@ -175,7 +175,9 @@
     results.innerHTML = list.map((card) => {
       const rarityClass = `badge-${card.rarity}`; // badge-SSR | badge-SR | badge-R
       const thumb = card.img
-        ? `<img src="${card.img}" alt="${card.name}" loading="lazy">`
+        ? (window.ThumbAtlas
+            ? window.ThumbAtlas.html(card.img, card.name)
+            : `<img src="${card.img}" alt="${card.name}" loading="lazy">`)
         : `<span>${initialsOf(card.name)}</span>`;
       return `
         <div class="card card-support">
@@ -285,4 +287,6 @@
   // Init
   readFromURL();
   update();
+  // Sprite sheets for thumbnails (thumbs.js), if built; never block the first render on them
+  window.ThumbAtlas?.ready.then(() => window.ThumbAtlas.upgrade(results));
 })();
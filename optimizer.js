@@ -238,8 +238,24 @@
     });
   }
 
+  // The slim skills_core shard (see build_assets.py) carries every field read
+  // below; its hashed name comes from the manifest. skills_all.json is the fallback.
+  async function skillCoreShardUrls() {
+    for (const base of ['/assets/skills/', './assets/skills/']) {
+      try {
+        const res = await fetch(`${base}manifest.json`);
+        if (!res.ok) throw new Error(`HTTP ${res.status}`);
+        const manifest = await res.json();
+        if (manifest && typeof manifest.core === 'string') return [`${base}${manifest.core}`];
+      } catch (err) {
+        console.warn('Skill shard manifest unavailable', base, err);
+      }
+    }
+    return [];
+  }
+
   async function loadSkillCostsJSON() {
-    const candidates = ['/assets/skills_all.json', './assets/skills_all.json'];
+    const candidates = [...await skillCoreShardUrls(), '/assets/skills_all.json', './assets/skills_all.json'];
     for (const url of candidates) {
       try {
         // Use default caching - Vercel headers control TTL
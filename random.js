@@ -157,9 +157,16 @@ function getSpeedFactorUma(){ return (els.speed2xUma && els.speed2xUma.checked)
       `<div class="inline-note">No cards available. Adjust filters or exclusions.</div>`;
   }
 
+  // Sprite from the thumbnail atlas when loaded (thumbs.js), else a plain <img>
+  function thumbMarkup(s){
+    return window.ThumbAtlas
+      ? window.ThumbAtlas.html(s.img, s.name)
+      : `<img src="${s.img}" alt="${s.name}" loading="lazy">`;
+  }
+
   function cardMarkup(s, extraClass=""){
     const img = s.img
-      ? `<img src="${s.img}" alt="${s.name}" loading="lazy">`
+      ? thumbMarkup(s)
       : `<span>${initialsOf(s.name)}</span>`;
     return `
       <div class="card card-support ${extraClass}">
@@ -233,7 +240,7 @@ for (let i = 0; i < N; i++){
         titleEl.textContent = s.name;
         badgeEl.className = `badge ${rarityClass(s.rarity)}`;
         badgeEl.textContent = s.rarity;
-        const live = s.img ? `<img src="${s.img}" alt="${s.name}" loading="lazy">` : `<span>${initialsOf(s.name)}</span>`;
+        const live = s.img ? thumbMarkup(s) : `<span>${initialsOf(s.name)}</span>`;
         thumbEl.innerHTML = live;
       }, SPIN_MS);
       cycles.push(cycle);
@@ -426,6 +433,8 @@ const duration = Math.max(600, Math.round(durationBase * getSpeedFactorUma()));
       buildDatalist();
       renderExclusions();
       renderDeckStatic();  // initial deck render
+      // Sprite sheets (thumbs.js) swap in when they arrive; the deck never waits on them
+      window.ThumbAtlas?.ready.then(() => window.ThumbAtlas.upgrade(els.deckResults));
       wireEvents();        // <-- attach all listeners
       // Uma area starts idle until user rolls
       els.umaResult.innerHTML = `<div class="inline-note">Click "Pick Random Uma" to roll.</div>`;
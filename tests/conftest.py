@@ -0,0 +1,105 @@
+import importlib.util
+import json
+import sys
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(scope="session")
+def api():
+    """The API module (its file name isn't importable with a plain import)."""
+    spec = importlib.util.spec_from_file_location("umatools_api", ROOT / "api" / "[...path].py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def client(api):
+    from fastapi.testclient import TestClient
+    return TestClient(api.app)
+
+
+class StubSite:
+    """
+    Local stand-in for gametora.com. Each path answers with a queue of
+    (status, body, headers) responses; the last one repeats. page() serves
+    a Next.js-style HTML page with __NEXT_DATA__.
+    """
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.routes = {}
+        self.hits = Counter()
+        self._lock = threading.Lock()
+
+    def url(self, path: str) -> str:
+        return self.base_url + path
+
+    def respond(self, path: str, *responses) -> None:
+        self.routes[path] = list(responses)
+
+    def page(self, path: str, page_props, build_id: str = "test-build") -> None:
+        data = {"buildId": build_id, "props": {"pageProps": page_props}}
+        html = ('<html><body><div id="__next"></div><script id="__NEXT_DATA__" type="application/json">'
+                f"{json.dumps(data)}</script></body></html>")
+        self.respond(path, (200, html, {"Content-Type": "text/html"}))
+
+    def next_response(self, path: str):
+        with self._lock:
+            self.hits[path] += 1
+            queue = self.routes.get(path)
+            if not queue:
+                return 404, "not found", {}
+            return queue.pop(0) if len(queue) > 1 else queue[0]
+
+
+@pytest.fixture
+def stub_site():
+    site = None
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            status, body, headers = site.next_response(self.path.split("?")[0])
+            payload = body.encode("utf-8") if isinstance(body, str) else body
+            self.send_response(status)
+            for k, v in headers.items():
+                self.send_header(k, v)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    site = StubSite(f"http://127.0.0.1:{server.server_port}")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield site
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def gametora(monkeypatch, tmp_path):
+    """The scraper module with module state (buildId, JSON stores, skill names) isolated per test."""
+    import gametora as module
+    monkeypatch.setattr(module, "_BUILD_ID", None)
+    monkeypatch.setattr(module, "_SKILL_NAME_MAP", {"200012": "Right-Handed ○", "200352": "Focus"})
+    monkeypatch.setattr(module, "FIXTURE_DIR", None)
+    monkeypatch.setattr(module, "_HTTP_LOCAL", threading.local())
+    monkeypatch.setattr(module, "pause", lambda seconds, stage="sleep": None)
+    monkeypatch.setattr(module, "_save_thumb", lambda url, thumbs_dir, slug, sup_id: "")  # never reach the real site
+    module.METRICS.reset()
+    yield module
+    module.flush_json_stores()
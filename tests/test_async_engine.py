@@ -0,0 +1,62 @@
+import json
+
+from test_http_fast_path import _support_props
+
+JSON = {"Content-Type": "application/json"}
+
+
+def _from_props(url, props):
+    if url.endswith("/boom"):
+        raise KeyError("itemData")
+    return props["itemData"]["name_en"]
+
+
+def test_one_bad_page_does_not_abort_the_pass(gametora, stub_site, tmp_path):
+    gametora._BUILD_ID = "b1"
+    paths = ["/umamusume/supports/ok", "/umamusume/supports/list-body", "/umamusume/supports/boom",
+             "/umamusume/supports/throttled"]
+    for path in paths:
+        stub_site.page(path, _support_props(), build_id="b1")
+    good = json.dumps({"pageProps": _support_props()})
+    stub_site.respond("/_next/data/b1/umamusume/supports/ok.json", (200, good, JSON))
+    stub_site.respond("/_next/data/b1/umamusume/supports/list-body.json", (200, "[1, 2]", JSON))
+    stub_site.respond("/_next/data/b1/umamusume/supports/boom.json", (200, good, JSON))
+    stub_site.respond("/_next/data/b1/umamusume/supports/throttled.json",
+                      (429, "slow down", {"Retry-After": "0"}), (200, good, JSON))
+    urls = [stub_site.url(p) for p in paths]
+    checkpoint = gametora.ScrapeCheckpoint(str(tmp_path / "ckpt.json"), "supports")
+    checkpoint.start(urls)
+
+    leftovers = gametora.run_async_http_pass(urls, "SUPPORT", _from_props, start=2, max_concurrency=2,
+                                             checkpoint=checkpoint)
+
+    assert leftovers == [stub_site.url("/umamusume/supports/boom")]
+    assert stub_site.hits["/umamusume/supports/list-body"] == 1  # non-dict JSON fell back to the HTML page
+    assert stub_site.hits["/_next/data/b1/umamusume/supports/throttled.json"] == 2
+    assert gametora.METRICS.counters["async_errors"] == 1
+    assert gametora.METRICS.counters["http_overloaded"] == 1
+    assert checkpoint.pending() == leftovers
+
+
+def test_non_dict_page_props_are_ignored(gametora, stub_site):
+    stub_site.respond("/umamusume/supports/odd",
+                      (200, '<script id="__NEXT_DATA__" type="application/json">'
+                            '{"buildId": "b2", "props": ["pageProps"]}</script>', {}))
+    props, status, _ = gametora.fetch_page_props_status(stub_site.url("/umamusume/supports/odd"))
+    assert props is None and status == 200
+
+
+def test_checkpoint_writes_run_off_the_event_loop(gametora, stub_site, tmp_path):
+    import threading
+
+    stub_site.page("/umamusume/supports/ok", _support_props())
+    url = stub_site.url("/umamusume/supports/ok")
+    checkpoint = gametora.ScrapeCheckpoint(str(tmp_path / "ckpt.json"), "supports")
+    checkpoint.start([url])
+    threads = []
+    mark_done = checkpoint.mark_done
+    checkpoint.mark_done = lambda u: threads.append(threading.current_thread().name) or mark_done(u)
+
+    assert gametora.run_async_http_pass([url], "SUPPORT", _from_props, checkpoint=checkpoint) == []
+    assert len(threads) == 1 and threads[0].startswith("async-http")
+    assert checkpoint.pending() == []
@@ -0,0 +1,52 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(api):
+    api.MATCH_CACHE.clear()
+    yield
+    api.MATCH_CACHE.clear()
+
+
+def test_noisy_queries_match_the_single_endpoint(api, client):
+    name = api.EVENT_NAMES[len(api.EVENT_NAMES) // 2]
+    noisy = f"  {name[:-1]}   "
+    r = client.post("/event_by_name/batch", json={"queries": [noisy, name], "limit": 3})
+    assert r.status_code == 200
+    first, second = r.json()["results"]
+    assert first["query"] == noisy
+    assert first["match"]["event_name"] == second["match"]["event_name"] == name
+
+    single = client.get("/event_by_name", params={"event_name": noisy, "limit": 3}).json()
+    assert single["match"] == first["match"]
+    assert single["other_matches"] == first["other_matches"]
+
+
+def test_batch_shares_the_match_cache(api, client):
+    name = api.EVENT_NAMES[0]
+    client.get("/event_by_name", params={"event_name": name})
+    hits = api.MATCH_CACHE.hits
+    client.post("/event_by_name/batch", json={"queries": [f" {name} "]})
+    assert api.MATCH_CACHE.hits == hits + 1
+
+
+def test_unmatched_query_gets_null_match(api, client):
+    name = api.EVENT_NAMES[0]
+    r = client.post("/event_by_name/batch", json={"queries": [name, "zzzzzzzzzzzz"], "min_score": 90})
+    hit, miss = r.json()["results"]
+    assert hit["match"]["event_name"] == name
+    assert miss == {"query": "zzzzzzzzzzzz", "match": None, "other_matches": []}
+
+
+@pytest.mark.parametrize("body", [
+    {"queries": []},
+    {"queries": ["x"] * 33},
+    {"queries": ["x"], "limit": 0},
+    {"queries": ["x"], "limit": 51},
+    {"queries": ["x"], "min_score": -1},
+    {"queries": ["x"], "min_score": 101},
+])
+def test_out_of_range_bodies_are_rejected(client, body):
+    r = client.post("/event_by_name/batch", json=body)
+    assert r.status_code == 422
+    assert isinstance(r.json()["detail"], list)  # FastAPI's standard validation error
@@ -0,0 +1,47 @@
+def _event(name, *choices):
+    return {"n": name, "c": [{"n": label, "r": [reward]} for label, reward in choices]}
+
+
+def test_repeated_labels_start_a_new_row(gametora):
+    data = {"en": {"random": [
+        _event("Fan Letter", ("Top Option", {"sp": 10}), ("Bottom Option", "st+5"), ("Top Option", {"gu": 5})),
+        _event("Morning Run", ("Top Option", {"sp": 5})),
+    ]}}
+    rows = gametora.normalize_events(data, gametora.SUPPORT_EVENT_CATEGORIES)
+    assert rows == [
+        {"EventName": "Fan Letter", "EventOptions": {"Top Option": "Speed +10", "Bottom Option": "Stamina +5"}},
+        {"EventName": "Fan Letter", "EventOptions": {"Top Option": "Guts +5"}},
+        {"EventName": "Morning Run", "EventOptions": {"Top Option": "Speed +5"}},
+    ]
+    assert not any("(2)" in label for row in rows for label in row["EventOptions"])
+
+
+def test_same_titled_events_stay_separate(gametora):
+    data = {"en": {"random": [
+        _event("Morning Run", ("Top Option", {"sp": 5})),
+        _event("Morning Run", ("Bottom Option", {"st": 5})),
+    ]}}
+    rows = gametora.normalize_events(data, gametora.SUPPORT_EVENT_CATEGORIES)
+    assert [r["EventOptions"] for r in rows] == [{"Top Option": "Speed +5"}, {"Bottom Option": "Stamina +5"}]
+
+
+def test_option_groups_split_on_repeated_labels(gametora):
+    choices = [("A", "1"), ("B", "2"), ("A", "3"), ("C", "4"), ("C", "5")]
+    assert gametora.option_groups(choices) == [{"A": "1", "B": "2"}, {"A": "3", "C": "4"}, {"C": "5"}]
+    assert gametora.option_groups([]) == []
+
+
+def test_dom_items_with_the_same_title_stay_separate(gametora, monkeypatch):
+    monkeypatch.setattr(gametora, "filter_visible", lambda d, els: els)
+
+    class EventList:
+        def find_elements(self, by, sel):
+            return [object(), object()]
+
+    monkeypatch.setattr(gametora, "safe_find_all", lambda d, by, sel: [EventList()])
+    monkeypatch.setattr(gametora, "harvest_tippy_events", lambda d, items: [
+        ("Morning Run", [{"Top Option": "Speed +5"}]),
+        ("Morning Run", [{"Bottom Option": "Stamina +5"}]),
+    ])
+    rows = gametora._parse_character_events_from_page(None)
+    assert [r["EventOptions"] for r in rows] == [{"Top Option": "Speed +5"}, {"Bottom Option": "Stamina +5"}]
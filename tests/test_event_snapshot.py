@@ -0,0 +1,42 @@
+import os
+
+import pytest
+
+
+def test_snapshot_round_trip(api, tmp_path):
+    hashes = api._source_hashes()
+    path = tmp_path / "events.snapshot.json"
+    assert api._write_snapshot(path, hashes, api.EVENTS)
+    assert api._read_snapshot(path, hashes) == api.EVENTS
+    assert api._read_snapshot(path, {**hashes, "career.json": "stale"}) is None
+
+
+def test_bundled_snapshot_is_current(api):
+    assert api._read_snapshot(api.SNAPSHOT_FILE, api._source_hashes()) == api.load_all_events()
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions only")
+def test_fallback_dir_is_private(api, tmp_path, monkeypatch):
+    monkeypatch.setattr(api.tempfile, "gettempdir", lambda: str(tmp_path))
+    cache_dir = api._private_cache_dir()
+    assert cache_dir == tmp_path / f"umatools-{os.getuid()}"
+    assert cache_dir.stat().st_mode & 0o777 == 0o700
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions only")
+def test_fallback_dir_rejected_when_shared(api, tmp_path, monkeypatch):
+    monkeypatch.setattr(api.tempfile, "gettempdir", lambda: str(tmp_path))
+    planted = tmp_path / f"umatools-{os.getuid()}"
+    planted.mkdir()
+    planted.chmod(0o777)
+    assert api._private_cache_dir() is None
+    assert api._snapshot_paths() == [api.SNAPSHOT_FILE]
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions only")
+def test_fallback_dir_rejected_when_symlink(api, tmp_path, monkeypatch):
+    monkeypatch.setattr(api.tempfile, "gettempdir", lambda: str(tmp_path))
+    target = tmp_path / "elsewhere"
+    target.mkdir(mode=0o700)
+    (tmp_path / f"umatools-{os.getuid()}").symlink_to(target)
+    assert api._private_cache_dir() is None
@@ -0,0 +1,44 @@
+import gzip
+import json
+
+import pytest
+
+
+def test_identity_body_and_etag(api, client):
+    r = client.get("/events", headers={"Accept-Encoding": "identity"})
+    assert r.status_code == 200
+    assert "Content-Encoding" not in r.headers
+    assert r.json() == {"events": api.EVENT_NAMES}
+    assert r.headers["ETag"] == api.EVENTS_BODY.etags["identity"]
+    assert r.headers["Vary"] == "Accept-Encoding"
+
+
+def test_if_none_match_returns_304(client):
+    etag = client.get("/events", headers={"Accept-Encoding": "identity"}).headers["ETag"]
+    r = client.get("/events", headers={"Accept-Encoding": "identity", "If-None-Match": f'W/"x", {etag}'})
+    assert r.status_code == 304
+    assert r.content == b""
+    assert r.headers["ETag"] == etag
+    stale = client.get("/events", headers={"Accept-Encoding": "identity", "If-None-Match": '"stale"'})
+    assert stale.status_code == 200
+
+
+def test_encoding_follows_accept_encoding(api):
+    brotli = pytest.importorskip("brotli")
+    body = api.EVENTS_BODY
+    raw = body.variants["identity"]
+
+    class FakeRequest:
+        def __init__(self, accept):
+            self.headers = {"accept-encoding": accept}
+
+    r = body.response(FakeRequest("gzip, br"))
+    assert r.headers["Content-Encoding"] == "br"
+    assert brotli.decompress(r.body) == raw
+    r = body.response(FakeRequest("gzip, br;q=0"))
+    assert r.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(r.body) == raw
+    r = body.response(FakeRequest("deflate"))
+    assert "Content-Encoding" not in r.headers
+    assert json.loads(r.body) == {"events": api.EVENT_NAMES}
+    assert len({body.etags[c] for c in ("identity", "gzip", "br")}) == 3
@@ -0,0 +1,147 @@
+import json
+
+
+def _events():
+    return {"en": {"random": [
+        {"n": "Morning Run", "c": [{"n": "Top Option", "r": [{"sp": 10}]}, {"n": "Bottom Option", "r": ["st+5"]}]},
+    ]}}
+
+
+def _support_props(event_skills=True):
+    item = {"name_en": "Card (SSR)", "rarity": 3, "id": 30001,
+            "hints": {"hint_skills": [200012], "hint_others": ["Speed +6"]}}
+    if event_skills:
+        item["event_skills"] = [200352]
+    return {"itemData": item, "eventData": _events()}
+
+
+def _character_props(**drop):
+    item = {"name_en": "Special Week", "title_en": "[Special Dreamer]", "rarity": 3,
+            "status_3": [83, 88, 98, 83, 98], "status_5": [102, 108, 120, 102, 118], "bonus": [0, 20, 0, 0, 10],
+            "apt": list("AAGAAGAACG"), "height": 158, "three_sizes": [80, 55, 81]}
+    for key in drop:
+        item.pop(key, None)
+    return {"itemData": item, "eventData": {"en": {"wchoice": [
+        {"n": "Dream Big", "c": [{"n": "Top Option", "r": [{"gu": 10}]}]}]}}}
+
+
+def _store_paths(tmp_path):
+    return str(tmp_path / "support_card.json"), str(tmp_path / "support_hints.json")
+
+
+def _previews(slug):
+    return {slug: {"SupportImage": "/assets/support_thumbs/card.png", "SupportId": "30001"}}
+
+
+def test_fetch_page_props_from_html_then_next_data_route(gametora, stub_site):
+    stub_site.page("/umamusume/supports/30001-card", _support_props(), build_id="b1")
+    props = gametora.fetch_page_props_http(stub_site.url("/umamusume/supports/30001-card"))
+    assert props["itemData"]["id"] == 30001
+    assert gametora._BUILD_ID == "b1"
+
+    stub_site.respond("/_next/data/b1/umamusume/supports/30002-card.json",
+                      (200, json.dumps({"pageProps": _support_props()}), {"Content-Type": "application/json"}))
+    assert gametora.fetch_page_props_http(stub_site.url("/umamusume/supports/30002-card"))["itemData"]["id"] == 30001
+    assert stub_site.hits["/umamusume/supports/30002-card"] == 0
+
+
+def test_missing_next_data_returns_none(gametora, stub_site):
+    stub_site.respond("/umamusume/supports/1-x", (200, "<html>no data</html>", {}))
+    assert gametora.fetch_page_props_http(stub_site.url("/umamusume/supports/1-x")) is None
+
+
+def test_complete_support_is_stored_over_http(gametora, stub_site, tmp_path):
+    url = stub_site.url("/umamusume/supports/30001-card")
+    stub_site.page("/umamusume/supports/30001-card", _support_props())
+    events_path, hints_path = _store_paths(tmp_path)
+    res = gametora._scrape_support_http(url, _previews("30001-card"), str(tmp_path), events_path, hints_path)
+    assert res is not None
+    gametora.flush_json_stores()
+    hints = json.loads((tmp_path / "support_hints.json").read_text(encoding="utf-8"))[0]["SupportHints"]
+    assert {h["Name"] for h in hints} >= {"Right-Handed ○", "Focus", "Speed +6"}
+    events = json.loads((tmp_path / "support_card.json").read_text(encoding="utf-8"))
+    assert events == [{"EventName": "Morning Run",
+                       "EventOptions": {"Top Option": "Speed +10", "Bottom Option": "Stamina +5"}}]
+
+
+def test_support_without_event_skills_goes_to_browser(gametora, stub_site, tmp_path):
+    url = stub_site.url("/umamusume/supports/30001-card")
+    stub_site.page("/umamusume/supports/30001-card", _support_props(event_skills=False))
+    events_path, hints_path = _store_paths(tmp_path)
+    assert gametora._scrape_support_http(url, _previews("30001-card"), str(tmp_path), events_path, hints_path) is None
+    assert not (tmp_path / "support_hints.json").exists()
+    assert gametora.METRICS.counters["json_incomplete"] == 1
+
+
+def test_character_record_reports_what_the_dom_must_fill(gametora):
+    url = "https://gametora.com/umamusume/characters/100101-special-week"
+    record = gametora._character_record(_character_props(), url)
+    assert record["UmaHeightCm"] == 158 and gametora._character_gaps(record) == []
+    assert gametora._character_gaps(gametora._character_record(_character_props(height=True), url)) == ["UmaHeightCm"]
+    no_sizes = gametora._character_record(_character_props(three_sizes=True), url)
+    assert gametora._character_gaps(no_sizes) == ["UmaThreeSizes"]
+    assert no_sizes["UmaBaseStats"] and no_sizes["UmaEvents"]
+    no_events = _character_props()
+    no_events["eventData"] = {}
+    assert gametora._character_gaps(gametora._character_record(no_events, url)) == []
+
+
+def test_character_without_sizes_fills_only_sizes_from_dom(gametora, stub_site, tmp_path, monkeypatch):
+    from test_scrape_pool import CountingPool
+
+    path = "/umamusume/characters/100101-special-week"
+    url = stub_site.url(path)
+    stub_site.page(path, _character_props(three_sizes=True))
+    dom_reads = []
+    monkeypatch.setattr(gametora, "driver_pool", lambda headless, server: CountingPool())
+    monkeypatch.setattr(gametora, "nav", lambda d, url, css: True)
+    monkeypatch.setattr(gametora, "get_page_props", lambda d: _character_props(three_sizes=True))
+    monkeypatch.setattr(gametora, "_label_value", lambda d, label: dom_reads.append(label) or "80-55-81")
+    monkeypatch.setattr(gametora, "_open_character_events_tab", lambda d: dom_reads.append("events"))
+    save_path = tmp_path / "uma_data.json"
+    checkpoint = gametora.ScrapeCheckpoint(str(tmp_path / "ckpt.json"), "characters")
+    checkpoint.start([url])
+    checkpoint.save(force=True)
+
+    gametora.scrape_characters(str(save_path), server="global", workers=1, min_interval=0, jitter=0,
+                               checkpoint=gametora.ScrapeCheckpoint(str(tmp_path / "ckpt.json"), "characters",
+                                                                    resume=True))
+
+    assert stub_site.hits[path] == 1  # HTTP fast path tried first
+    assert dom_reads == ["Three sizes"]
+    [record] = json.loads(save_path.read_text(encoding="utf-8"))
+    assert record["UmaThreeSizes"] == {"B": 80, "W": 55, "H": 81}
+    assert record["UmaHeightCm"] == 158 and record["UmaEvents"]
+
+
+def test_scrape_pool_sends_incomplete_pages_to_browser(gametora, stub_site, tmp_path, monkeypatch):
+    complete = stub_site.url("/umamusume/supports/30001-card")
+    partial = stub_site.url("/umamusume/supports/30002-other")
+    stub_site.page("/umamusume/supports/30001-card", _support_props())
+    stub_site.page("/umamusume/supports/30002-other", _support_props(event_skills=False))
+    events_path, hints_path = _store_paths(tmp_path)
+
+    class FakePool:
+        def acquire(self):
+            return object()
+
+        def release(self, driver, failed=False):
+            pass
+
+        def discard(self, driver):
+            pass
+
+    browser_urls = []
+    monkeypatch.setattr(gametora, "nav", lambda d, url, css: True)
+
+    def scrape_http(url):
+        res = gametora._scrape_support_http(url, {}, str(tmp_path), events_path, hints_path)
+        return res and res[0]
+
+    def scrape_browser(d, url):
+        browser_urls.append(url)
+        return "browser"
+
+    gametora.run_scrape_pool([complete, partial], "SUPPORT", FakePool(), scrape_browser,
+                             scrape_http=scrape_http, workers=1, min_interval=0, jitter=0)
+    assert browser_urls == [partial]
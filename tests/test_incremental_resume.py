@@ -0,0 +1,69 @@
+import json
+
+from test_http_fast_path import _character_props
+
+
+def test_resume_keeps_incremental_mode(gametora, stub_site, tmp_path, monkeypatch):
+    monkeypatch.setattr(gametora, "SITE_ORIGIN", stub_site.base_url)
+    stub_site.page("/umamusume/characters", {}, build_id="b1")
+    seen = stub_site.url("/umamusume/characters/100101-special-week")
+    new = stub_site.url("/umamusume/characters/100201-silence-suzuka")
+    stub_site.page("/umamusume/characters/100201-silence-suzuka", _character_props(), build_id="b1")
+
+    save_path = tmp_path / "uma_data.json"
+    save_path.write_text("[]", encoding="utf-8")
+    (tmp_path / "uma_data.json.fingerprints.json").write_text(
+        json.dumps({"buildId": "b1", "pages": {seen: "fp"}}), encoding="utf-8")
+    ckpt_path = str(tmp_path / "ckpt.json")
+    first = gametora.ScrapeCheckpoint(ckpt_path, "characters")
+    first.start([seen, new])
+    first.save(force=True)
+
+    checkpoint = gametora.ScrapeCheckpoint(ckpt_path, "characters", resume=True)
+    gametora.scrape_characters(str(save_path), server="global", incremental=True, checkpoint=checkpoint)
+
+    assert stub_site.hits["/umamusume/characters"] == 1
+    assert stub_site.hits["/umamusume/characters/100101-special-week"] == 0
+    assert stub_site.hits["/umamusume/characters/100201-silence-suzuka"] == 1
+    manifest = json.loads((tmp_path / "uma_data.json.fingerprints.json").read_text(encoding="utf-8"))
+    assert manifest["buildId"] == "b1" and set(manifest["pages"]) == {seen, new}
+    assert checkpoint.pending() == []
+
+
+def test_support_browser_path_reads_page_props_once(gametora, tmp_path, monkeypatch):
+    from test_http_fast_path import _support_props
+    from test_scrape_pool import CountingPool
+
+    pool = CountingPool()
+    calls = []
+    monkeypatch.setattr(gametora, "driver_pool", lambda headless, server: pool)
+    monkeypatch.setattr(gametora, "nav", lambda d, url, css: True)
+    monkeypatch.setattr(gametora, "get_page_props", lambda d: calls.append(d) or _support_props())
+    monkeypatch.setattr(gametora, "_open_support_hints_tab", lambda d: None)
+    monkeypatch.setattr(gametora, "parse_support_hints_on_page", lambda d: [])
+    monkeypatch.setattr(gametora, "safe_find", lambda *a, **k: None)
+    monkeypatch.setattr(gametora, "http_build_id", lambda path: "b1")
+
+    urls = ["https://gametora.com/umamusume/supports/30001-card", "https://gametora.com/umamusume/supports/30002-x"]
+    ckpt_path = str(tmp_path / "ckpt.json")
+    first = gametora.ScrapeCheckpoint(ckpt_path, "supports")
+    first.start(urls)
+    first.save(force=True)
+    checkpoint = gametora.ScrapeCheckpoint(ckpt_path, "supports", resume=True)
+    gametora.scrape_supports_threaded(str(tmp_path / "support_card.json"), str(tmp_path / "support_hints.json"),
+                                      server="global", http_fast=False, incremental=True, checkpoint=checkpoint,
+                                      workers=1, thumbs_dir=str(tmp_path))
+    assert len(calls) == len(urls)
+    assert checkpoint.pending() == []
+
+
+def test_plain_runs_get_no_checkpoint(gametora, tmp_path, monkeypatch):
+    default = tmp_path / "default_ckpt.json"
+    monkeypatch.setattr(gametora, "DEFAULT_CHECKPOINT", str(default))
+    assert gametora.open_checkpoint(None, "uma", resume=False) is None
+
+    resumed = gametora.open_checkpoint(None, "uma", resume=True)
+    assert resumed.path == str(default) and not resumed.resuming
+    explicit = gametora.open_checkpoint(str(tmp_path / "mine.json"), "uma", resume=False)
+    explicit.start(["https://example.test/a"])
+    assert (tmp_path / "mine.json").exists() and not default.exists()
@@ -0,0 +1,49 @@
+import json
+import shutil
+
+KEY = ("EventName", "EventOptions")
+
+
+def _rows(n):
+    return [{"EventName": f"Event {i}", "EventOptions": {"Top Option": f"Speed +{i}"}} for i in range(n)]
+
+
+def test_journal_replays_after_crash_before_compact(gametora, tmp_path):
+    path = str(tmp_path / "support_card.json")
+    store = gametora.JsonStore(path)
+    for row in _rows(3):
+        store.append(row, dedup_key=KEY)
+    store.close()  # crash: journal written, JSON never compacted
+
+    reopened = gametora.JsonStore(path)
+    assert reopened.data == _rows(3)
+
+
+def test_crash_between_compact_write_and_journal_removal(gametora, tmp_path):
+    path = str(tmp_path / "support_card.json")
+    store = gametora.JsonStore(path)
+    for row in _rows(3):
+        store.append(row, dedup_key=KEY)
+    store.upsert("EventName", "Event 1", {"Note": "patched"})
+    store.close()
+    shutil.copy(store.journal_path, str(tmp_path / "journal.bak"))
+    store.compact()
+    # The asset was replaced but the process died before os.remove(journal).
+    shutil.copy(str(tmp_path / "journal.bak"), store.journal_path)
+
+    reopened = gametora.JsonStore(path)
+    reopened.compact()
+    data = json.loads((tmp_path / "support_card.json").read_text(encoding="utf-8"))
+    assert [row["EventName"] for row in data] == ["Event 0", "Event 1", "Event 2"]
+    assert data[1]["Note"] == "patched"
+    assert not (tmp_path / "support_card.json.journal").exists()
+
+
+def test_append_dedups_against_existing_rows(gametora, tmp_path):
+    path = tmp_path / "support_card.json"
+    path.write_text(json.dumps(_rows(2)), encoding="utf-8")
+    store = gametora.JsonStore(str(path))
+    assert store.append(_rows(2)[1], dedup_key=KEY) is False
+    assert store.append(_rows(3)[2], dedup_key=KEY) is True
+    store.compact()
+    assert json.loads(path.read_text(encoding="utf-8")) == _rows(3)
@@ -0,0 +1,22 @@
+def test_lru_evicts_least_recently_used(api):
+    cache = api.LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.stats() == {"size": 2, "maxsize": 2, "hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_repeated_lookups_hit_the_cache(api, client):
+    api.MATCH_CACHE.clear()
+    name = api.EVENT_NAMES[0]
+    try:
+        client.get("/event_by_name", params={"event_name": name})
+        assert client.get("/event_by_name/cache").json()["misses"] == 1
+        client.get("/event_by_name", params={"event_name": f"  {name} "})  # same normalized key
+        client.get("/event_by_name", params={"event_name": name, "limit": 2})  # different key
+        stats = client.get("/event_by_name/cache").json()
+    finally:
+        api.MATCH_CACHE.clear()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 2, 2)
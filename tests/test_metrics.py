@@ -0,0 +1,39 @@
+import json
+
+
+def test_counters_timings_and_snapshot(gametora):
+    metrics = gametora.ScrapeMetrics()
+    metrics.count("pages")
+    metrics.count("pages", 2)
+    metrics.count("bytes_written", 2048)
+    metrics.count("dom_fallbacks")
+    with metrics.stage("http_fetch"):
+        pass
+
+    @metrics.timed("parse")
+    def parse(x):
+        return x * 2
+
+    assert parse(21) == 42
+    metrics.observe("parse", 0.5)
+    snap = metrics.snapshot("supports")
+    assert snap["pages"] == 3 and snap["bytes_written"] == 2048
+    assert snap["counters"] == {"dom_fallbacks": 1}
+    assert snap["stages"]["parse"]["n"] == 2 and snap["stages"]["http_fetch"]["n"] == 1
+    assert snap["stages"]["parse"]["p95_ms"] == 500.0
+    assert metrics.counters["pages"] == 3  # snapshot() doesn't consume the pass
+
+
+def test_report_exports_then_resets(gametora, tmp_path):
+    metrics = gametora.ScrapeMetrics()
+    metrics.export_path = str(tmp_path / "metrics.json")
+    metrics.count("pages", 4)
+    metrics.observe("sleep", 0.1)
+    metrics.report("characters")
+    metrics.count("pages")
+    metrics.report("supports")
+
+    runs = json.loads((tmp_path / "metrics.json").read_text(encoding="utf-8"))
+    assert [(r["label"], r["pages"]) for r in runs] == [("characters", 4), ("supports", 1)]
+    assert "sleep" not in runs[1]["stages"]
+    assert metrics.counters == {} and metrics.timings == {}
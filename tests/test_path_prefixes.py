@@ -0,0 +1,24 @@
+import asyncio
+
+import pytest
+
+
+@pytest.mark.parametrize("prefix", ["", "/api", "/index", "/api/index"])
+def test_routes_answer_under_every_prefix(api, client, prefix):
+    assert client.get(f"{prefix}/events").status_code == 200
+    name = api.EVENT_NAMES[0]
+    r = client.get(f"{prefix}/event_by_name", params={"event_name": name})
+    assert r.status_code == 200
+    assert r.json()["match"]["event_name"] == name
+
+
+def test_longest_prefix_wins(api):
+    seen = []
+
+    async def inner(scope, receive, send):
+        seen.append(scope["path"])
+
+    mw = api.StripPathPrefix(inner, prefixes=("/api", "/index", "/api/index"))
+    for path in ("/api/index/events", "/api/index", "/api/events", "/index/events", "/apix/events"):
+        asyncio.run(mw({"type": "http", "path": path}, None, None))
+    assert seen == ["/events", "/", "/events", "/events", "/apix/events"]
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+
+def _row(name, grade="G2", desc=("Turf", "Medium", "2000m"), details=True):
+    return {"tag": "div", "href": "", "name": name, "year": "Classic Year", "month": "March 1",
+            "grade": grade, "desc": list(desc), "text": f"{name}\n{grade}\n" + "\n".join(desc),
+            "details": object() if details else None}
+
+
+def test_row_fields_ignore_the_race_name(gametora):
+    fields = gametora._race_fields_from_row(_row("Spring Stakes", grade="G2"))
+    assert fields == {"Grade": "G2", "Terrain": "Turf", "DistanceType": "Medium", "DistanceMeter": "2000m"}
+    assert "Grade" not in gametora._race_fields_from_row(_row("OP Special", grade=""))
+
+
+@pytest.fixture
+def race_page(gametora, monkeypatch):
+    from test_scrape_pool import CountingPool
+
+    monkeypatch.setattr(gametora, "driver_pool", lambda headless, server: CountingPool())
+    monkeypatch.setattr(gametora, "nav", lambda d, url, css: True)
+    monkeypatch.setattr(gametora, "ensure_server", lambda d, server, keep_raw_en: None)
+    monkeypatch.setattr(gametora, "_scroll_page_until_stable", lambda d: None)
+    page = {"rows": [], "json": {}, "dialogs": []}
+    monkeypatch.setattr(gametora, "_extract_race_rows", lambda d: page["rows"])
+    monkeypatch.setattr(gametora, "_races_from_next_data", lambda d: page["json"])
+
+    def read_dialog(d, btn):
+        page["dialogs"].append(btn)
+        return {"Grade": "G2", "Season": "Autumn", "FansRequired": "1000", "FansGained": "5000"}
+
+    monkeypatch.setattr(gametora, "_read_race_dialog", read_dialog)
+    return page
+
+
+def _scrape(gametora, tmp_path):
+    path = tmp_path / "races.json"
+    gametora.scrape_races(str(path), server="global")
+    return {r["RaceName"]: r for r in json.loads(path.read_text(encoding="utf-8"))}
+
+
+def test_dialog_values_win_over_the_row(gametora, race_page, tmp_path):
+    race_page["rows"] = [_row("Spring Stakes", grade="G3")]
+    race = _scrape(gametora, tmp_path)["Spring Stakes"]
+    assert (race["Season"], race["Grade"], race["FansRequired"]) == ("Autumn", "G2", "1000")
+    assert race["Terrain"] == "Turf"
+    assert len(race_page["dialogs"]) == 1
+
+
+def test_dialog_skipped_when_next_data_fills_the_rest(gametora, race_page, tmp_path):
+    race_page["rows"] = [_row("Spring Stakes"), _row("Yayoi Sho")]
+    race_page["json"] = {"Spring Stakes": {"Season": "Spring", "FansRequired": "800", "FansGained": "4000"}}
+    races = _scrape(gametora, tmp_path)
+    assert races["Spring Stakes"]["Season"] == "Spring"
+    assert races["Spring Stakes"]["FansGained"] == "4000"
+    assert races["Yayoi Sho"]["Season"] == "Autumn"
+    assert len(race_page["dialogs"]) == 1
+
+
+def test_season_read_from_next_data(gametora):
+    assert gametora._race_fields_from_json({"season": "Winter", "distance": 1600})["Season"] == "Winter"
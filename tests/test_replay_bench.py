@@ -0,0 +1,38 @@
+import json
+from pathlib import Path
+
+FIXTURES = Path(__file__).parent / "fixtures" / "pageprops"
+EXPECTED = Path(__file__).parent / "fixtures" / "pageprops_expected.json"
+# Per-call ceiling for every parser: generous enough for a slow CI box, tight
+# enough to catch an accidental quadratic loop or a per-call regex compile.
+PARSER_BUDGET_US = 2000
+
+
+def test_record_and_load_round_trip(gametora, tmp_path, monkeypatch):
+    monkeypatch.setattr(gametora, "FIXTURE_DIR", str(tmp_path))
+    monkeypatch.setattr(gametora, "_BUILD_ID", "b1")
+    url = "https://gametora.com/umamusume/supports/30001-card"
+    gametora.record_fixture(url, {"itemData": {"id": 30001}})
+    gametora.record_fixture("https://gametora.com/umamusume/races", {"races": []})  # not a detail page
+    [fx] = gametora.load_fixtures(str(tmp_path))
+    assert (fx["url"], fx["kind"], fx["buildId"]) == (url, "support", "b1")
+    assert fx["pageProps"] == {"itemData": {"id": 30001}}
+
+
+def test_replay_reproduces_recorded_output(gametora, tmp_path):
+    out = tmp_path / "replay.json"
+    summary = gametora.replay_fixtures(str(FIXTURES), str(out))
+    assert summary["fixtures"] == summary["records"] == 3
+    assert summary["incomplete"] == summary["errors"] == 0
+    assert json.loads(out.read_text(encoding="utf-8")) == json.loads(EXPECTED.read_text(encoding="utf-8"))
+
+
+def test_parsers_stay_within_budget(gametora):
+    report = gametora.bench_parsers(str(FIXTURES), rounds=5)
+    assert set(report["parsers"]) == {
+        "_parse_events_from_json", "_parse_objectives_from_json", "_parse_stats_from_json",
+        "_parse_support_events_from_json", "_parse_support_hints_from_json", "_format_stat_rewards",
+        "replay_fixture",
+    }
+    slow = {name: p["median_us"] for name, p in report["parsers"].items() if p["median_us"] > PARSER_BUDGET_US}
+    assert not slow
@@ -0,0 +1,98 @@
+import threading
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+
+class CountingPool:
+    """DriverPool stand-in that tracks which drivers are checked out."""
+    def __init__(self):
+        self.out = set()
+        self.acquired = 0
+        self.failed_releases = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            self.acquired += 1
+            driver = object()
+            self.out.add(driver)
+            return driver
+
+    def release(self, driver, failed=False):
+        if driver is None:
+            return
+        with self._lock:
+            self.out.discard(driver)
+            self.failed_releases += bool(failed)
+
+    def discard(self, driver):
+        with self._lock:
+            self.out.discard(driver)
+
+
+@pytest.fixture
+def pool(gametora, monkeypatch):
+    monkeypatch.setattr(gametora, "nav", lambda d, url, css: True)
+    return CountingPool()
+
+
+def test_unexpected_errors_release_driver_and_keep_worker(gametora, pool):
+    urls = [f"https://example.test/{i}" for i in range(6)]
+    done = []
+
+    def scrape_browser(d, url):
+        if url.endswith("/1"):
+            raise KeyError("itemData")
+        if url.endswith("/3"):
+            raise OSError("disk full")
+        done.append(url)
+        return "ok"
+
+    gametora.run_scrape_pool(urls, "TEST", pool, scrape_browser, workers=1, min_interval=0, jitter=0)
+    assert done == [u for u in urls if not u.endswith(("/1", "/3"))]
+    assert pool.out == set()
+    assert pool.acquired == 6
+    assert gametora.METRICS.counters["failed_pages"] == 2
+
+
+def test_selenium_errors_retry_then_give_up(gametora, pool):
+    def scrape_browser(d, url):
+        raise WebDriverException("chrome crashed")
+
+    gametora.run_scrape_pool(["https://example.test/x"], "TEST", pool, scrape_browser,
+                             workers=1, min_interval=0, jitter=0)
+    assert pool.acquired == gametora.RETRIES + 1
+    assert pool.failed_releases == gametora.RETRIES + 1
+    assert pool.out == set()
+
+
+def test_http_errors_fall_back_to_browser(gametora, pool):
+    def scrape_http(url):
+        raise AttributeError("'list' object has no attribute 'get'")
+
+    seen = []
+    gametora.run_scrape_pool(["https://example.test/a", "https://example.test/b"], "TEST", pool,
+                             lambda d, url: seen.append(url) or "ok", scrape_http=scrape_http,
+                             workers=2, min_interval=0, jitter=0)
+    assert sorted(seen) == ["https://example.test/a", "https://example.test/b"]
+    assert pool.out == set()
+
+
+def test_unexpected_errors_are_recorded_in_checkpoint(gametora, pool, tmp_path):
+    urls = ["https://example.test/ok", "https://example.test/bad"]
+    checkpoint = gametora.ScrapeCheckpoint(str(tmp_path / "ckpt.json"), "supports")
+    checkpoint.start(urls)
+
+    def scrape_browser(d, url):
+        if url.endswith("/bad"):
+            raise KeyError("itemData")
+        return "ok"
+
+    gametora.run_scrape_pool(urls, "TEST", pool, scrape_browser, workers=1, min_interval=0, jitter=0,
+                             checkpoint=checkpoint)
+    checkpoint.save(force=True)
+    assert "KeyError" in checkpoint.failed["https://example.test/bad"]
+
+    resumed = gametora.ScrapeCheckpoint(str(tmp_path / "ckpt.json"), "supports", resume=True)
+    assert resumed.pending() == ["https://example.test/bad"]
@@ -0,0 +1,72 @@
+import json
+import os
+
+import pytest
+
+import build_assets
+
+
+def _write_skills(path, skills):
+    path.write_text(json.dumps(skills, ensure_ascii=False), encoding="utf-8")
+    return str(path)
+
+
+def test_index_round_trips_the_json_names(tmp_path):
+    source = _write_skills(tmp_path / "skills.json", [
+        {"id": 200012, "name_en": "Right-Handed ○"},
+        {"id": 10011, "enname": "Shooting Star"},
+        {"id": 900001, "jpname": "集中力"},
+        {"id": 5, "name_en": ""},
+        {"name_en": "No Id"},
+    ])
+    dest = str(tmp_path / "names.idx")
+    assert build_assets.write_skill_name_index(source, dest) == 3
+
+    index = build_assets.SkillNameIndex(dest)
+    try:
+        assert dict(index) == dict(build_assets.iter_skill_names(source))
+        assert list(index) == ["10011", "200012", "900001"]
+        assert index["900001"] == "集中力"
+        for missing in ("5", "0", "0200012", "not-an-id", None):
+            assert index.get(missing) is None
+        assert index.is_current(source)
+    finally:
+        index.close()
+
+
+def test_stale_index_is_rebuilt(tmp_path):
+    source = _write_skills(tmp_path / "skills.json", [{"id": 1, "name_en": "Old Name"}])
+    dest = str(tmp_path / "names.idx")
+    build_assets.write_skill_name_index(source, dest)
+
+    _write_skills(tmp_path / "skills.json", [{"id": 1, "name_en": "New Name"}, {"id": 2, "name_en": "Added"}])
+    os.utime(source, ns=(os.stat(dest).st_mtime_ns + 10**9,) * 2)
+    assert build_assets.open_skill_name_index(dest, source, rebuild=False) is None
+
+    index = build_assets.open_skill_name_index(dest, source)
+    try:
+        assert dict(index) == {"1": "New Name", "2": "Added"}
+        assert index.is_current(source)
+    finally:
+        index.close()
+
+
+@pytest.fixture
+def fresh_names(api):
+    api._SKILL_NAMES = None
+    yield
+    api._SKILL_NAMES = None
+
+
+def test_endpoint_resolves_names_through_the_index(api, client, fresh_names):
+    ids = [sid for sid, _ in build_assets.iter_skill_names(str(api.ASSETS / "skills_all.json"))][:3]
+    r = client.get("/skills/names", params={"ids": ids + ["not-an-id"]})
+    assert r.status_code == 200
+    expected = dict(build_assets.iter_skill_names(str(api.ASSETS / "skills_all.json")))
+    assert r.json()["names"] == {**{sid: expected[sid] for sid in ids}, "not-an-id": None}
+    assert isinstance(api.skill_names(), build_assets.SkillNameIndex)
+
+
+@pytest.mark.parametrize("params", [{}, {"ids": ["1"] * 201}])
+def test_endpoint_rejects_empty_and_oversized_requests(client, params):
+    assert client.get("/skills/names", params=params).status_code == 422
@@ -0,0 +1,49 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(api):
+    api.SKILL_CACHE.clear()
+    yield
+    api.SKILL_CACHE.clear()
+
+
+def _names(body):
+    return [r["skill"].get("name_en") or r["skill"].get("enname") for r in body["results"]]
+
+
+def test_trie_returns_shorter_keys_first(api):
+    trie = api.PrefixTrie()
+    for key in ("focused mind", "focus", "foc", "fox"):
+        trie.insert(key, key)
+    assert trie.search("foc") == ["foc", "focus", "focused mind"]
+    assert trie.search("fo", limit=2) == ["foc", "fox"]
+    assert trie.search("fz") == []
+
+
+def test_prefix_query_ranks_prefix_hits(client):
+    body = client.get("/skills/search", params={"q": "  Focused  Mi "}).json()
+    assert body["query"] == "Focused Mi"
+    top = body["results"][0]
+    assert top["match"] == "prefix" and top["score"] == 100.0
+    assert _names(body)[0] == "Focused Mind"
+
+
+def test_word_prefix_finds_later_words(client):
+    body = client.get("/skills/search", params={"q": "mind", "limit": 50}).json()
+    hit = body["results"][_names(body).index("Focused Mind")]
+    assert hit["match"] == "prefix" and hit["score"] == 90.0
+
+
+def test_misspelled_query_falls_back_to_fuzzy(client):
+    body = client.get("/skills/search", params={"q": "Focsued Mnid"}).json()
+    assert body["results"], "expected a fuzzy match"
+    assert body["results"][0]["match"] == "fuzzy"
+    assert "Focused Mind" in _names(body)
+
+
+def test_empty_queries(client):
+    assert client.get("/skills/search", params={"q": ""}).status_code == 422
+    r = client.get("/skills/search", params={"q": "   "})
+    assert r.status_code == 200
+    assert r.json() == {"query": "", "results": []}
@@ -0,0 +1,56 @@
+import hashlib
+import json
+import os
+
+import build_assets
+
+
+def _write_skills(path, skills):
+    path.write_text(json.dumps(skills, ensure_ascii=False), encoding="utf-8")
+    return str(path)
+
+
+SKILLS = [
+    {"id": 1, "name_en": "Focused Mind", "type": ["nac"], "rarity": 1, "desc_en": "Ease anxiety.",
+     "jpdesc": "集中する", "gene_version": {"cost": 160, "desc_en": "inherited"}},
+    {"id": 2, "enname": "Shooting Star", "rarity": 3, "name_ko": "슈팅 스타"},
+]
+
+
+def test_shards_are_content_hashed_and_listed_in_the_manifest(tmp_path):
+    source = _write_skills(tmp_path / "skills.json", SKILLS)
+    out = tmp_path / "skills"
+    manifest = build_assets.build_skill_shards(source, str(out))
+
+    assert manifest == json.loads((out / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["count"] == 2
+    names = [manifest["core"], *manifest["desc"].values()]
+    assert set(manifest["desc"]) == set(build_assets.SKILL_LOCALE_FIELDS)
+    for name in names:
+        blob = (out / name).read_bytes()
+        assert name.endswith("." + hashlib.blake2b(blob, digest_size=6).hexdigest() + ".json")
+        assert manifest["bytes"][name] == len(blob)
+    assert sorted(os.listdir(out)) == sorted(names + ["manifest.json"])
+
+    core = json.loads((out / manifest["core"]).read_text(encoding="utf-8"))
+    assert core[0] == {"id": 1, "name_en": "Focused Mind", "type": ["nac"], "rarity": 1,
+                       "gene_version": {"cost": 160}}
+    en = json.loads((out / manifest["desc"]["en"]).read_text(encoding="utf-8"))
+    assert en == {"1": {"desc_en": "Ease anxiety."}}
+
+
+def test_rebuild_removes_superseded_shards(tmp_path):
+    source = tmp_path / "skills.json"
+    out = tmp_path / "skills"
+    before = build_assets.build_skill_shards(_write_skills(source, SKILLS), str(out))
+    (out / "notes.txt").write_text("not a shard", encoding="utf-8")
+
+    changed = [dict(SKILLS[0], desc_en="Calm down."), SKILLS[1]]
+    after = build_assets.build_skill_shards(_write_skills(source, changed), str(out))
+
+    assert after["desc"]["en"] != before["desc"]["en"]
+    assert not (out / before["desc"]["en"]).exists()
+    # Shards whose contents didn't change keep their name
+    assert after["core"] == before["core"] and after["desc"]["ja"] == before["desc"]["ja"]
+    current = [after["core"], *after["desc"].values()]
+    assert sorted(os.listdir(out)) == sorted(current + ["manifest.json", "notes.txt"])
@@ -0,0 +1,33 @@
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _png(path, color):
+    img = Image.new("RGB", (200, 260), color)
+    for x in range(0, 200, 7):  # some detail so quality changes the encoded size
+        for y in range(0, 260, 5):
+            img.putpixel((x, y), ((x * 3) % 256, (y * 5) % 256, (x + y) % 256))
+    img.save(path)
+
+
+def test_settings_change_reencodes_per_file_webp(gametora, tmp_path):
+    _png(tmp_path / "10001-a.png", "red")
+    _png(tmp_path / "10002-b.png", "blue")
+    first = gametora.optimize_thumbnails(str(tmp_path), quality=90, avif=False)
+    assert set(first["items"]) == {"10001-a", "10002-b"}
+    assert first["webp_settings"] == {"max_side": gametora.THUMB_MAX_SIDE, "quality": 90}
+    before = (tmp_path / "webp" / "10001-a.webp").read_bytes()
+
+    assert gametora.optimize_thumbnails(str(tmp_path), quality=90, avif=False) == first  # up to date
+    second = gametora.optimize_thumbnails(str(tmp_path), quality=20, avif=False)
+    assert second["webp_settings"]["quality"] == 20
+    assert (tmp_path / "webp" / "10001-a.webp").read_bytes() != before
+
+
+def test_sources_sharing_a_stem_are_rejected(gametora, tmp_path):
+    _png(tmp_path / "10001-a.png", "red")
+    Image.new("RGB", (10, 10)).save(tmp_path / "10001-a.jpg")
+    with pytest.raises(ValueError, match="10001-a.jpg, 10001-a.png"):
+        gametora.optimize_thumbnails(str(tmp_path), avif=False)
+    assert not (tmp_path / "atlas").exists()
@@ -0,0 +1,69 @@
+(function () {
+  // Support-card thumbnail atlas written by `gametora.py` (see optimize_thumbnails).
+  // Cards whose image is in the atlas render as a sprite from one of a few sheets
+  // instead of one request per PNG; anything else falls back to a plain <img>.
+  const ATLAS_BASE = "/assets/support_thumbs/atlas/";
+
+  let atlas = null;
+
+  function supportsAvif() {
+    try {
+      const c = document.createElement("canvas");
+      c.width = c.height = 1;
+      return c.toDataURL("image/avif").startsWith("data:image/avif");
+    } catch (e) {
+      return false;
+    }
+  }
+
+  const ready = fetch(ATLAS_BASE + "index.json")
+    .then((res) => (res.ok ? res.json() : null))
+    .then((index) => {
+      if (!index || !index.items || !Array.isArray(index.sheets)) return null;
+      const avif = supportsAvif();
+      atlas = {
+        items: index.items,
+        sheets: index.sheets.map((sh) => ({
+          url: ATLAS_BASE + (avif && sh.avif ? sh.avif : sh.webp),
+          columns: sh.columns,
+          rows: sh.rows,
+        })),
+      };
+      return atlas;
+    })
+    .catch(() => null);
+
+  // Swap already-rendered <img> thumbnails for sprites once the atlas loads,
+  // so pages can render immediately instead of waiting on index.json.
+  function upgrade(root) {
+    if (!atlas || !root) return;
+    root.querySelectorAll("img[src]").forEach((img) => {
+      const src = img.getAttribute("src");
+      if (atlas.items[keyOf(src)]) img.outerHTML = html(src, img.getAttribute("alt"));
+    });
+  }
+
+  function keyOf(src) {
+    const file = String(src || "").split(/[?#]/)[0].split("/").pop() || "";
+    return file.replace(/\.[a-z0-9]+$/i, "");
+  }
+
+  function escapeAttr(s) {
+    return String(s || "").replace(/"/g, "&quot;");
+  }
+
+  // Markup for a thumbnail: atlas sprite when available, otherwise <img>.
+  function html(src, alt) {
+    const item = atlas && src ? atlas.items[keyOf(src)] : null;
+    const sheet = item ? atlas.sheets[item.sheet] : null;
+    if (!sheet) {
+      return src ? `<img src="${src}" alt="${escapeAttr(alt)}" loading="lazy">` : "";
+    }
+    // Percent-based sizing so the tile scales with whatever box the CSS gives it
+    const x = sheet.columns > 1 ? (item.col / (sheet.columns - 1)) * 100 : 0;
+    const y = sheet.rows > 1 ? (item.row / (sheet.rows - 1)) * 100 : 0;
+    return `<span class="thumb-sprite" role="img" aria-label="${escapeAttr(alt)}" style="background-image:url(${sheet.url});background-size:${sheet.columns * 100}% ${sheet.rows * 100}%;background-position:${x}% ${y}%"></span>`;
+  }
+
+  window.ThumbAtlas = { ready, html, upgrade };
+})();